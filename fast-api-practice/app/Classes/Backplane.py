@@ -0,0 +1,216 @@
+import asyncio
+from abc import ABC, abstractmethod
+import glob
+import logging
+import os
+import socket
+import tempfile
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from app import codec
+from app.codec import JsonText
+
+logger = logging.getLogger(__name__)
+
+# 백플레인으로 전달되는 이벤트 예:
+#   {"origin": "<node id>", "op": "broadcast" | "room" | "user", "target": "<room 또는 uid>", "message": "<직렬화된 메시지>",
+#    "json": <message가 JSON(JsonText)이면 true>}
+BackplaneHandler = Callable[[dict], None]
+
+
+class Backplane(ABC):
+    """
+    워커 프로세스 사이에서 브로드캐스트/room/개인 메시지를 중계하는 인터페이스.
+    publish()는 다른 노드에만 전달하며, 자기 자신이 보낸 이벤트는 handler로 돌아오지 않습니다.
+    """
+
+    def __init__(self):
+        self.node_id = uuid.uuid4().hex
+        self.published = 0
+        self.received = 0
+        self.dropped = 0
+
+    @abstractmethod
+    async def start(self, handler: BackplaneHandler):
+        """다른 노드의 이벤트를 handler로 받기 시작"""
+
+    @abstractmethod
+    async def stop(self):
+        """수신을 멈추고 자원 정리"""
+
+    @abstractmethod
+    def publish(self, op: str, target: Optional[str], message: str):
+        """이벤트를 다른 노드에 전달 (기다리지 않음)"""
+
+    def metrics(self) -> dict:
+        return {
+            "backplane": type(self).__name__,
+            "backplane_node_id": self.node_id,
+            "backplane_published": self.published,
+            "backplane_received": self.received,
+            "backplane_dropped": self.dropped,
+        }
+
+
+class InMemoryBackplane(Backplane):
+    """
+    단일 프로세스용 구현. 같은 hub를 공유하는 인스턴스끼리만 이벤트를 주고받습니다.
+    hub를 지정하지 않으면 peer가 없으므로 publish는 아무 일도 하지 않습니다.
+    """
+
+    def __init__(self, hub: Optional[Dict[str, BackplaneHandler]] = None):
+        super().__init__()
+        self.hub: Dict[str, BackplaneHandler] = hub if hub is not None else {}
+
+    async def start(self, handler: BackplaneHandler):
+        self.hub[self.node_id] = handler
+
+    async def stop(self):
+        self.hub.pop(self.node_id, None)
+
+    def publish(self, op: str, target: Optional[str], message: str):
+        if len(self.hub) <= 1:
+            return
+        event = {"origin": self.node_id, "op": op, "target": target, "message": message,
+                 "json": isinstance(message, JsonText)}
+        self.published += 1
+        for node_id, handler in list(self.hub.items()):
+            if node_id != self.node_id:
+                handler(event)
+
+
+class UnixSocketBackplane(Backplane):
+    """
+    같은 호스트의 여러 워커 프로세스를 Unix domain datagram 소켓으로 연결합니다.
+    각 워커는 directory 아래에 <node_id>.sock 을 바인딩하고, publish 시 다른 모든 소켓 파일로 전송합니다.
+    외부 브로커가 필요 없으며 POSIX 환경에서만 동작합니다.
+    """
+
+    # 하나의 datagram에 담을 수 있는 최대 이벤트 크기
+    MAX_DATAGRAM = 256 * 1024
+    # peer 목록(디렉터리 스캔) 캐시 시간(초)
+    PEER_REFRESH_SECONDS = 1.0
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        self.path = os.path.join(directory, f"{self.node_id}.sock")
+        self._sock: Optional[socket.socket] = None
+        self._handler: Optional[BackplaneHandler] = None
+        self._peers: List[str] = []
+        self._peers_loaded_at = 0.0
+
+    async def start(self, handler: BackplaneHandler):
+        os.makedirs(self.directory, exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.MAX_DATAGRAM * 16)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.MAX_DATAGRAM * 4)
+        sock.bind(self.path)
+        sock.setblocking(False)
+        self._sock = sock
+        self._handler = handler
+        asyncio.get_running_loop().add_reader(sock.fileno(), self._on_readable)
+        logger.info("unix backplane listening on %s", self.path)
+
+    async def stop(self):
+        if self._sock is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def publish(self, op: str, target: Optional[str], message: str):
+        if self._sock is None:
+            return
+        peers = self._current_peers()
+        if not peers:
+            return
+
+        data = codec.dumps_bytes(
+            {"origin": self.node_id, "op": op, "target": target, "message": message,
+             "json": isinstance(message, JsonText)}
+        )
+        if len(data) > self.MAX_DATAGRAM:
+            logger.error("backplane event too large (%d bytes), not relayed", len(data))
+            self.dropped += 1
+            return
+
+        self.published += 1
+        for peer in peers:
+            try:
+                self._sock.sendto(data, peer)
+            except BlockingIOError:
+                # peer의 수신 버퍼가 가득 참 — 이 이벤트는 해당 peer에서 유실
+                self.dropped += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # 종료된 워커가 남긴 소켓 파일
+                self._forget_peer(peer)
+            except OSError:
+                logger.warning("backplane send to %s failed", peer, exc_info=True)
+                self.dropped += 1
+
+    def _current_peers(self) -> List[str]:
+        now = time.monotonic()
+        if now - self._peers_loaded_at >= self.PEER_REFRESH_SECONDS:
+            self._peers = [
+                path for path in glob.glob(os.path.join(self.directory, "*.sock"))
+                if path != self.path
+            ]
+            self._peers_loaded_at = now
+        return self._peers
+
+    def _forget_peer(self, peer: str):
+        if peer in self._peers:
+            self._peers.remove(peer)
+        try:
+            os.unlink(peer)
+        except OSError:
+            pass
+
+    def _on_readable(self):
+        while self._sock is not None:
+            try:
+                data = self._sock.recv(self.MAX_DATAGRAM)
+            except BlockingIOError:
+                return
+            except OSError:
+                logger.warning("backplane receive failed", exc_info=True)
+                return
+
+            try:
+                event = codec.loads(data)
+            except Exception:
+                logger.warning("invalid backplane event dropped")
+                continue
+
+            if event.get("origin") == self.node_id:
+                continue
+            self.received += 1
+            try:
+                self._handler(event)
+            except Exception:
+                logger.exception("backplane handler failed")
+
+
+def create_backplane() -> Backplane:
+    """
+    WS_BACKPLANE 환경변수로 구현을 선택합니다.
+      memory (기본값) : 단일 프로세스
+      unix            : 같은 호스트의 여러 워커 (uvicorn --workers N)
+    """
+    kind = os.getenv("WS_BACKPLANE", "memory").lower()
+    if kind == "unix":
+        directory = os.getenv(
+            "WS_BACKPLANE_DIR",
+            os.path.join(tempfile.gettempdir(), "fastapi-chat-backplane")
+        )
+        return UnixSocketBackplane(directory)
+    if kind != "memory":
+        logger.warning("unknown WS_BACKPLANE=%s, falling back to memory", kind)
+    return InMemoryBackplane()
@@ -1,53 +1,316 @@
-import json
-from typing import Dict, Optional
-from fastapi.params import Depends
-from sqlalchemy.orm import Session
+import asyncio
+import os
+from typing import Dict, Optional, Union
+from starlette import status
 from starlette.websockets import WebSocket
 import logging
-from app.database import get_db
 from app.auth import (
     decode_access_token,
 )
+from app import codec
+from app.codec import JsonText
+from app.binary_protocol import WireEncoding, encode_outbound, negotiate
 from app.dtos import BaseResponse
-from app.models import User
+from app.Classes.Backplane import Backplane, create_backplane
+from app.Classes.ConnectionRegistry import ConnectionRegistry
+from app.Classes.HeartbeatScheduler import HeartbeatScheduler
+from app.Classes.OutboundQueue import BatchPolicy, OutboundQueue, OverflowPolicy
+from app.Classes.UserLookupBatcher import UserLookupBatcher
 
 logger = logging.getLogger(__name__)
 
+# 소켓 하나에 메시지 하나를 보내는 데 허용하는 최대 시간(초). 초과하면 느린 클라이언트로 보고 연결을 끊는다.
+SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "1.0"))
+# 연결별 송신 큐 크기와 큐가 가득 찼을 때의 정책 (drop_oldest | drop_newest | disconnect)
+OUTBOUND_QUEUE_SIZE = int(os.getenv("WS_OUTBOUND_QUEUE_SIZE", "256"))
+OVERFLOW_POLICY = OverflowPolicy(os.getenv("WS_OVERFLOW_POLICY", OverflowPolicy.DROP_OLDEST.value))
+# micro-batching 기본값 ("<window_ms>:<max_messages>", 예: 5:50). 비어 있으면 사용하지 않음
+DEFAULT_BATCH = BatchPolicy.parse(os.getenv("WS_BATCH", ""))
+
+
+def _parse_room_batch(value: str) -> Dict[str, BatchPolicy]:
+    """room별 micro-batching 설정 ("lobby=5:50,news=20:200")"""
+    policies = {}
+    for item in value.split(","):
+        room, _, setting = item.partition("=")
+        policy = BatchPolicy.parse(setting)
+        if room.strip() and policy is not None:
+            policies[room.strip()] = policy
+    return policies
+
+
+ROOM_BATCH = _parse_room_batch(os.getenv("WS_ROOM_BATCH", ""))
+
+# heartbeat: interval초 동안 조용한 연결에 ping, pong_timeout초 안에 응답이 없으면 정리,
+# idle_timeout초 동안 pong 외의 메시지가 없으면 정리 (0이면 사용 안 함)
+# 앱 수준 ping({"type":"ping"} / pong 필수)은 WS_APP_PING=true이거나 클라이언트가 ws_headers에 "heartbeat": true를
+# 보낸 연결에만 사용 — 그 외 연결의 생존 확인은 uvicorn의 WebSocket ping/pong(--ws-ping-interval)에 맡김
+APP_PING = os.getenv("WS_APP_PING", "false").lower() in ("1", "true", "yes", "on")
+HEARTBEAT_INTERVAL = float(os.getenv("WS_HEARTBEAT_INTERVAL", "30"))
+PONG_TIMEOUT = float(os.getenv("WS_PONG_TIMEOUT", "10"))
+IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "0"))
+PING_MESSAGE = JsonText(codec.dumps({"type": "ping"}))
+
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: list[WebSocket] = []
-        # 키는 사용자 식별자(uid 또는 id 또는 username)로 저장
-        self.log_in_connections: Dict[str, WebSocket] = {}
+    def __init__(
+        self,
+        queue_size: int = OUTBOUND_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OVERFLOW_POLICY,
+        send_timeout: float = SEND_TIMEOUT,
+        backplane: Optional[Backplane] = None,
+        default_batch: Optional[BatchPolicy] = DEFAULT_BATCH,
+    ):
+        # 소켓별 송신 큐와 uid(uid 또는 id 또는 username) 인덱스를 함께 관리
+        self.connections = ConnectionRegistry()
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.send_timeout = send_timeout
+        # batching 우선순위: 연결(ws_headers) > room > 기본값
+        self.default_batch = default_batch
+        self.room_batching: Dict[str, BatchPolicy] = dict(ROOM_BATCH)
+        # 연결이 직접 batching을 설정했는지 여부
+        self._pinned_batch: set[WebSocket] = set()
+        # 이미 닫힌 큐의 통계를 누적
+        self._retired_dropped = 0
+        self._retired_sent = 0
+        self._retired_batches = 0
+        self._evicted = 0
+        self._closing: set[asyncio.Task] = set()
+        # 다른 워커 프로세스와 메시지를 주고받는 통로 (uvicorn --workers N)
+        self.backplane = backplane if backplane is not None else create_backplane()
+        self.user_lookup = UserLookupBatcher()
+        # 연결마다 태스크를 두지 않고 heap 하나로 ping / 유휴·무응답 연결 정리
+        self.heartbeat = HeartbeatScheduler(
+            interval=HEARTBEAT_INTERVAL,
+            pong_timeout=PONG_TIMEOUT,
+            idle_timeout=IDLE_TIMEOUT,
+            on_ping=self._send_ping,
+            on_reap=self._reap,
+            ping_by_default=APP_PING,
+        )
+
+    async def start(self):
+        await self.backplane.start(self._on_backplane_event)
+        self.heartbeat.start()
+
+    async def stop(self):
+        await self.heartbeat.stop()
+        await self.backplane.stop()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
 
-        logger.info("websocket header : %s", websocket.headers)
-        logger.info("websocket cookies : %s", websocket.cookies)
-        self.active_connections.append(websocket)
+        # 헤더 / 쿠키 전체는 인증 정보를 포함하므로 남기지 않음
+        logger.info(
+            "websocket connected",
+            extra={"client": websocket.client.host if websocket.client else None,
+                   "user_agent": websocket.headers.get("user-agent")},
+        )
+
+        queue = OutboundQueue(
+            websocket,
+            maxsize=self.queue_size,
+            policy=self.overflow_policy,
+            send_timeout=self.send_timeout,
+            on_failure=self._evict,
+        )
+        queue.batch = self.default_batch
+        self.connections.add(websocket, queue)
+        queue.start()
+        self.heartbeat.track(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        # 느린 소켓으로 이미 정리된 경우 WebSocketDisconnect 처리에서 다시 호출될 수 있음
+        queue = self.connections.remove(websocket)
+        self._pinned_batch.discard(websocket)
+        self.heartbeat.forget(websocket)
+        if queue is not None:
+            queue.close()
+            self._retired_dropped += queue.dropped
+            self._retired_sent += queue.sent
+            self._retired_batches += queue.batches
 
     async def send_personal_message(self, message: str, recipient: WebSocket):
-        await recipient.send_text(message)
+        self._enqueue(recipient, message)
+
+    def _enqueue(self, websocket: WebSocket, message: str):
+        queue = self.connections.get(websocket)
+        if queue is not None:
+            queue.put(message if queue.batch is not None else encode_outbound(message, queue.encoding))
+
+    def touch(self, websocket: WebSocket, activity: bool = True):
+        """클라이언트에서 프레임을 받았음을 heartbeat에 알림 (pong은 activity=False)"""
+        self.heartbeat.touch(websocket, activity)
+
+    def enable_heartbeat(self, websocket: WebSocket):
+        """클라이언트가 앱 수준 ping/pong을 지원한다고 알린 연결 (ws_headers의 "heartbeat": true)"""
+        self.heartbeat.enable_ping(websocket)
+
+    def _send_ping(self, websocket: WebSocket):
+        self._enqueue(websocket, PING_MESSAGE)
+
+    def _reap(self, websocket: WebSocket, reason: str):
+        logger.info("reaping %s websocket connection", reason)
+        self._evict(websocket, code=status.WS_1001_GOING_AWAY)
+
+    def negotiate(self, websocket: WebSocket, data: dict) -> WireEncoding:
+        """ws_headers의 protocol / compression / accept_bytes 값으로 해당 연결의 송신 형식을 정합니다."""
+        encoding = negotiate(data)
+        queue = self.connections.get(websocket)
+        if queue is not None:
+            queue.encoding = encoding
+        return encoding
+
+    def set_batching(self, websocket: WebSocket, policy: Optional[BatchPolicy]):
+        """연결 단위 micro-batching 설정 (None이면 끔). room 설정보다 우선합니다."""
+        queue = self.connections.get(websocket)
+        if queue is not None:
+            queue.batch = policy
+            self._pinned_batch.add(websocket)
+
+    def set_room_batching(self, room: str, policy: Optional[BatchPolicy]):
+        """room 단위 micro-batching 설정. 이후 입장하는 연결 중 직접 설정하지 않은 연결에 적용됩니다."""
+        if policy is None:
+            self.room_batching.pop(room, None)
+        else:
+            self.room_batching[room] = policy
+
+    async def send_to_user(self, uid: str, message: Union[str, dict]):
+        """해당 uid로 로그인한 모든 소켓에 전송합니다."""
+        if not isinstance(message, str):
+            message = JsonText(codec.dumps(message))
+
+        self._deliver_to_user(uid, message)
+        self.backplane.publish("user", uid, message)
+
+    async def broadcast(self, message: Union[str, dict]):
+        """
+        모든 연결의 송신 큐에 메시지를 넣습니다.
+        메시지는 한 번만 직렬화하며, 실제 전송은 연결별 writer 태스크가 동시에 처리합니다.
+        dict는 JSON으로 직렬화하고, str은 문자열 메시지로 보냅니다 (이미 JSON인 문자열은 JsonText로 넘김).
+        """
+        if not isinstance(message, str):
+            message = JsonText(codec.dumps(message))
+
+        self._deliver_to_all(message)
+        self.backplane.publish("broadcast", None, message)
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+    async def subscribe(self, websocket: WebSocket, room: str):
+        if self.connections.join(websocket, room):
+            policy = self.room_batching.get(room)
+            queue = self.connections.get(websocket)
+            if policy is not None and websocket not in self._pinned_batch:
+                queue.batch = policy
+            await self.send_personal_message(
+                BaseResponse.success_json("subscribed", {"room": room}),
+                websocket
+            )
+
+    async def unsubscribe(self, websocket: WebSocket, room: str):
+        if self.connections.leave(websocket, room):
+            await self.send_personal_message(
+                BaseResponse.success_json("unsubscribed", {"room": room}),
+                websocket
+            )
+
+    async def publish(self, room: str, message: Union[str, dict]):
+        """room 멤버에게만 전송합니다. 비용은 room 크기에 비례합니다."""
+        if not isinstance(message, str):
+            message = JsonText(codec.dumps(message))
+
+        self._deliver_to_room(room, message)
+        self.backplane.publish("room", room, message)
+
+    def _deliver_to_all(self, message: str):
+        self._fan_out(self.connections.queues(), message)
+
+    def _deliver_to_room(self, room: str, message: str):
+        self._fan_out(self.connections.room_queues(room), message)
+
+    def _deliver_to_user(self, uid: str, message: str):
+        queues = [self.connections.get(websocket) for websocket in self.connections.sockets_for_user(uid)]
+        self._fan_out([queue for queue in queues if queue is not None], message)
+
+    @staticmethod
+    def _fan_out(queues: list[OutboundQueue], message: str):
+        # 송신 형식(text / bytes / binary / binary+deflate)별로 인코딩과 압축을 한 번만 수행
+        encoded: dict = {WireEncoding.TEXT: message}
+        for queue in queues:
+            if queue.batch is not None:
+                # batching 중인 연결은 flush 시점에 묶어서 인코딩
+                queue.put(message)
+                continue
+            payload = encoded.get(queue.encoding)
+            if payload is None:
+                payload = encoded[queue.encoding] = encode_outbound(message, queue.encoding)
+            queue.put(payload)
+
+    def _on_backplane_event(self, event: dict):
+        """다른 워커에서 온 메시지를 이 프로세스의 연결에만 전달합니다 (다시 중계하지 않음)."""
+        op = event.get("op")
+        message = event.get("message")
+        if event.get("json"):
+            message = JsonText(message)
+        if op == "broadcast":
+            self._deliver_to_all(message)
+        elif op == "room":
+            self._deliver_to_room(event.get("target"), message)
+        elif op == "user":
+            self._deliver_to_user(event.get("target"), message)
+        else:
+            logger.warning("unknown backplane op: %s", op)
+
+    def _evict(self, websocket: WebSocket, code: int = status.WS_1013_TRY_AGAIN_LATER):
+        """전송에 실패했거나 큐가 넘친(또는 heartbeat로 정리된) 소켓을 목록에서 빼고 백그라운드에서 닫습니다."""
+        if websocket not in self.connections:
+            return
+        self._evicted += 1
+        self.disconnect(websocket)
+        task = asyncio.create_task(self._close_quietly(websocket, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_quietly(self, websocket: WebSocket, code: int):
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=code),
+                timeout=self.send_timeout
+            )
+        except Exception:
+            pass
+
+    def metrics(self) -> dict:
+        """송신 큐 깊이와 드롭 횟수"""
+        queues = self.connections.queues()
+        depths = [len(queue) for queue in queues]
+        return {
+            "connections": len(queues),
+            "users": self.connections.user_count,
+            "rooms": self.connections.room_count,
+            "queue_size": self.queue_size,
+            "overflow_policy": self.overflow_policy.value,
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "sent_messages": self._retired_sent + sum(queue.sent for queue in queues),
+            "dropped_messages": self._retired_dropped + sum(queue.dropped for queue in queues),
+            "evicted_connections": self._evicted,
+            "batched_frames": self._retired_batches + sum(queue.batches for queue in queues),
+            **self.heartbeat.metrics(),
+            **self.user_lookup.metrics(),
+            **self.backplane.metrics(),
+        }
 
     async def logIn(self, websocket: WebSocket, token: Optional[str]):
         """
-        websocket에서 호출할 때 DB 의존성 주입이 되지 않으므로 get_db() 제너레이터를 직접 사용합니다.
+        websocket에서 호출할 때 DB 의존성 주입이 되지 않으므로 UserLookupBatcher로 사용자를 조회합니다.
         token: 암호화된(전송된) 토큰 문자열
         """
-        logger.info(f"logIn : token ={token}")
+        logger.debug("websocket login attempt (token present: %s)", bool(token))
 
         if not token:
-            await websocket.send_text(
-                json.dumps(
-                    BaseResponse.error("Invalid token")
-                )
+            await self.send_personal_message(
+                BaseResponse.error_json("Invalid token"),
+                websocket
             )
             return
 
@@ -56,10 +319,9 @@ class ConnectionManager:
             decoded = decode_access_token(token)
         except Exception as e:
             logger.exception("token decode failed")
-            await websocket.send_text(
-                json.dumps(
-                    BaseResponse.error("Invalid token")
-                )
+            await self.send_personal_message(
+                BaseResponse.error_json("Invalid token"),
+                websocket
             )
             return
 
@@ -73,69 +335,54 @@ class ConnectionManager:
         else:
             user_name = None
 
-        logger.info(f"user_name : {user_name}")
+        logger.debug("websocket login user_name: %s", user_name)
 
         if not user_name:
-            await websocket.send_text(
-                json.dumps(
-                    BaseResponse.error("Invalid token payload")
-                )
+            await self.send_personal_message(
+                BaseResponse.error_json("Invalid token payload"),
+                websocket
             )
             return
 
-        # get_db 제너레이터를 직접 사용하여 세션을 얻고, finally에서 정리
-        db_gen = get_db()
+        # 동기 DB 조회를 이벤트 루프에서 직접 하지 않고, 배치로 묶어 스레드 풀에서 실행
         try:
-            db = next(db_gen)
-        except StopIteration:
-            logger.error("Failed to obtain DB session from get_db()")
-            await websocket.send_text(
-                json.dumps(
-                    BaseResponse.error("DB server error")
-                )
+            user = await self.user_lookup.get(user_name)
+        except Exception:
+            await self.send_personal_message(
+                BaseResponse.error_json("DB server error"),
+                websocket
             )
             return
 
-        try:
-            user = db.query(User).filter(User.username == user_name).first()
-            if not user:
-                logger.error("Invalid token or user not found")
-                await websocket.send_text(
-                    json.dumps(
-                        BaseResponse.error("Invalid token or user not found")
-                    )
-                )
-                return
-
-            # 안전한 사용자 식별자 추출 (uid, id, username 순)
-            uid = getattr(user, "uid", None) or getattr(user, "id", None) or getattr(user, "username", None)
-            if uid is None:
-                logger.error("User has no usable identifier")
-                await websocket.send_text(
-                    json.dumps(
-                        BaseResponse.error("User has no usable identifier")
-                    )
-                )
-                return
-
-            # 로그인 연결 저장
-            self.log_in_connections[str(uid)] = websocket
-
-            # 직렬화 가능한 사용자 정보만 전송
-            user_info = {
-                "uid": uid,
-                "username": getattr(user, "username", None),
-                "email": getattr(user, "email", None),
-                # 필요한 추가 필드만 담음
-            }
-            await websocket.send_text(
-                json.dumps(
-                    BaseResponse.success("", user_info)
-                )
+        if not user:
+            logger.error("Invalid token or user not found")
+            await self.send_personal_message(
+                BaseResponse.error_json("Invalid token or user not found"),
+                websocket
             )
-        finally:
-            # 제너레이터를 닫아 DB 세션 정리 코드 실행
-            try:
-                db_gen.close()
-            except Exception:
-                pass
+            return
+
+        # 안전한 사용자 식별자 추출 (uid, id, username 순)
+        uid = user.get("uid") or user.get("id") or user.get("username")
+        if uid is None:
+            logger.error("User has no usable identifier")
+            await self.send_personal_message(
+                BaseResponse.error_json("User has no usable identifier"),
+                websocket
+            )
+            return
+
+        # 로그인 연결 저장
+        self.connections.bind_user(websocket, str(uid))
+
+        # 직렬화 가능한 사용자 정보만 전송
+        user_info = {
+            "uid": uid,
+            "username": user.get("username"),
+            "email": user.get("email"),
+            # 필요한 추가 필드만 담음
+        }
+        await self.send_personal_message(
+            BaseResponse.success_json("", user_info),
+            websocket
+        )
@@ -0,0 +1,115 @@
+from typing import Dict, Iterator, List, Optional, Set
+
+from starlette.websockets import WebSocket
+
+from app.Classes.OutboundQueue import OutboundQueue
+
+
+class ConnectionRegistry:
+    """
+    활성 연결 저장소.
+    소켓 → 송신 큐, 소켓 → uid, uid → 소켓 집합, room → 소켓 집합 인덱스를 함께 유지하며
+    추가/삭제는 모두 O(1)입니다. 한 사용자가 여러 소켓으로 접속할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._queues: Dict[WebSocket, OutboundQueue] = {}
+        self._user_of: Dict[WebSocket, str] = {}
+        # dict를 순서 있는 집합으로 사용
+        self._by_user: Dict[str, Dict[WebSocket, None]] = {}
+        self._rooms: Dict[str, Dict[WebSocket, None]] = {}
+        self._rooms_of: Dict[WebSocket, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._queues)
+
+    def __contains__(self, websocket: WebSocket) -> bool:
+        return websocket in self._queues
+
+    def __iter__(self) -> Iterator[WebSocket]:
+        return iter(self._queues)
+
+    @property
+    def user_count(self) -> int:
+        return len(self._by_user)
+
+    @property
+    def room_count(self) -> int:
+        return len(self._rooms)
+
+    def add(self, websocket: WebSocket, queue: OutboundQueue):
+        self._queues[websocket] = queue
+
+    def get(self, websocket: WebSocket) -> Optional[OutboundQueue]:
+        return self._queues.get(websocket)
+
+    def queues(self) -> List[OutboundQueue]:
+        """순회 중 연결이 끊겨도 안전하도록 스냅샷을 반환"""
+        return list(self._queues.values())
+
+    def bind_user(self, websocket: WebSocket, uid: str):
+        """로그인한 소켓을 uid에 연결합니다. 다른 uid로 다시 로그인하면 이전 바인딩을 대체합니다."""
+        if websocket not in self._queues:
+            return
+        self._unbind_user(websocket)
+        self._user_of[websocket] = uid
+        self._by_user.setdefault(uid, {})[websocket] = None
+
+    def user_of(self, websocket: WebSocket) -> Optional[str]:
+        return self._user_of.get(websocket)
+
+    def sockets_for_user(self, uid: str) -> List[WebSocket]:
+        return list(self._by_user.get(uid, ()))
+
+    def join(self, websocket: WebSocket, room: str) -> bool:
+        if websocket not in self._queues:
+            return False
+        self._rooms.setdefault(room, {})[websocket] = None
+        self._rooms_of.setdefault(websocket, set()).add(room)
+        return True
+
+    def leave(self, websocket: WebSocket, room: str) -> bool:
+        rooms = self._rooms_of.get(websocket)
+        if not rooms or room not in rooms:
+            return False
+        rooms.discard(room)
+        if not rooms:
+            del self._rooms_of[websocket]
+        self._leave_room_index(websocket, room)
+        return True
+
+    def rooms_of(self, websocket: WebSocket) -> Set[str]:
+        return set(self._rooms_of.get(websocket, ()))
+
+    def is_member(self, websocket: WebSocket, room: str) -> bool:
+        return websocket in self._rooms.get(room, ())
+
+    def room_queues(self, room: str) -> List[OutboundQueue]:
+        """room 멤버의 송신 큐 목록. 전체 연결 수가 아닌 room 크기에 비례합니다."""
+        queues = self._queues
+        return [queues[websocket] for websocket in self._rooms.get(room, ())]
+
+    def remove(self, websocket: WebSocket) -> Optional[OutboundQueue]:
+        """모든 인덱스에서 소켓을 제거하고 해당 송신 큐를 반환합니다."""
+        queue = self._queues.pop(websocket, None)
+        self._unbind_user(websocket)
+        for room in self._rooms_of.pop(websocket, ()):
+            self._leave_room_index(websocket, room)
+        return queue
+
+    def _leave_room_index(self, websocket: WebSocket, room: str):
+        members = self._rooms.get(room)
+        if members is not None:
+            members.pop(websocket, None)
+            if not members:
+                del self._rooms[room]
+
+    def _unbind_user(self, websocket: WebSocket):
+        uid = self._user_of.pop(websocket, None)
+        if uid is None:
+            return
+        sockets = self._by_user.get(uid)
+        if sockets is not None:
+            sockets.pop(websocket, None)
+            if not sockets:
+                del self._by_user[uid]
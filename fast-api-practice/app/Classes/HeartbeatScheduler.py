@@ -0,0 +1,191 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from starlette.websockets import WebSocket
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatScheduler:
+    """
+    모든 연결의 heartbeat를 heap 하나와 백그라운드 태스크 하나로 처리합니다 (소켓별 태스크 없음).
+
+    - ping을 켠 연결(ping_by_default 또는 enable_ping())에만, interval 동안 아무것도 받지 못하면 ping을 보냄
+    - ping 후 pong_timeout 안에 응답이 없으면 응답 없는 연결로 보고 정리(reap)
+    - idle_timeout 동안 pong 외의 메시지가 없으면 유휴 연결로 보고 정리 (0이면 사용 안 함)
+    ping을 켜지 않은 연결은 pong을 보내지 않아도 되며, 끊긴 연결은 서버(uvicorn)의 WebSocket ping/pong이 찾아냅니다.
+
+    touch()는 시각만 갱신하고 heap은 건드리지 않으므로 O(1)이며,
+    heap에는 연결마다 유효한 항목이 하나씩만 있습니다 (forget되었거나 대체된 항목은 꺼낼 때 버림).
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        pong_timeout: float,
+        idle_timeout: float,
+        on_ping: Callable[[WebSocket], None],
+        on_reap: Callable[[WebSocket, str], None],
+        batch_size: int = 500,
+        ping_by_default: bool = False,
+    ):
+        self.interval = interval
+        self.pong_timeout = pong_timeout
+        self.idle_timeout = idle_timeout
+        self.batch_size = batch_size
+        self.ping_by_default = ping_by_default
+        # 새 마감 시각은 항상 now + interval(또는 idle_timeout) 이후이므로 그보다 오래 자지 않으면 놓치지 않음
+        self._tick = min((t for t in (interval, idle_timeout) if t > 0), default=0)
+        self._on_ping = on_ping
+        self._on_reap = on_reap
+        self._heap: List[Tuple[float, int, WebSocket]] = []
+        self._seq = itertools.count()
+        # 마지막으로 무엇이든(pong 포함) 받은 시각
+        self._last_seen: Dict[WebSocket, float] = {}
+        # 마지막으로 pong 외의 메시지를 받은 시각
+        self._last_activity: Dict[WebSocket, float] = {}
+        # 응답을 기다리는 ping을 보낸 시각
+        self._ping_sent: Dict[WebSocket, float] = {}
+        # ping을 보내는 연결
+        self._ping_enabled: Set[WebSocket] = set()
+        # 연결별로 유효한 heap 항목의 마감 시각 (이보다 늦은 항목은 꺼낼 때 버림)
+        self._scheduled: Dict[WebSocket, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.pings = 0
+        self.reaped_idle = 0
+        self.reaped_unresponsive = 0
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def track(self, websocket: WebSocket):
+        now = self._now()
+        self._last_seen[websocket] = now
+        self._last_activity[websocket] = now
+        if self.ping_by_default:
+            self.enable_ping(websocket)
+        else:
+            self._schedule(websocket, now)
+
+    def enable_ping(self, websocket: WebSocket):
+        """이 연결에 ping을 보내고 pong을 요구 (클라이언트가 ws_headers에서 heartbeat를 켠 경우)"""
+        if websocket not in self._last_seen or self.interval <= 0:
+            return
+        self._ping_enabled.add(websocket)
+        self._schedule(websocket, self._now())
+
+    def touch(self, websocket: WebSocket, activity: bool = True):
+        if websocket not in self._last_seen:
+            return
+        now = self._now()
+        self._last_seen[websocket] = now
+        self._ping_sent.pop(websocket, None)
+        if activity:
+            self._last_activity[websocket] = now
+
+    def forget(self, websocket: WebSocket):
+        self._last_seen.pop(websocket, None)
+        self._last_activity.pop(websocket, None)
+        self._ping_sent.pop(websocket, None)
+        self._ping_enabled.discard(websocket)
+        self._scheduled.pop(websocket, None)
+
+    def _schedule(self, websocket: WebSocket, now: float):
+        """다음 확인 시각을 heap에 넣음 (이미 더 이른 항목이 있으면 그 항목을 꺼낼 때 다시 계산)"""
+        deadlines = []
+        if websocket in self._ping_enabled:
+            deadlines.append(self._last_seen[websocket] + self.interval)
+        if self.idle_timeout > 0:
+            deadlines.append(self._last_activity[websocket] + self.idle_timeout)
+        if not deadlines:
+            return
+        deadline = max(min(deadlines), now)
+        scheduled = self._scheduled.get(websocket)
+        if scheduled is None or deadline < scheduled:
+            self._push(deadline, websocket)
+
+    def _push(self, deadline: float, websocket: WebSocket):
+        self._scheduled[websocket] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), websocket))
+
+    def start(self):
+        if self._task is None and self._tick > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        heap = self._heap
+        while True:
+            # heap 맨 앞까지, 단 새로 들어올 항목을 놓치지 않도록 _tick보다 오래 자지는 않음
+            delay = min(heap[0][0] - self._now(), self._tick) if heap else self._tick
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                self._process_due()
+            except Exception:
+                logger.exception("heartbeat pass failed")
+            # 배치마다 이벤트 루프에 양보
+            await asyncio.sleep(0)
+
+    def _process_due(self):
+        heap = self._heap
+        now = self._now()
+        processed = 0
+        while heap and heap[0][0] <= now and processed < self.batch_size:
+            deadline, _, websocket = heapq.heappop(heap)
+            if self._scheduled.get(websocket) != deadline:
+                # 이미 forget된 연결이거나 더 이른 항목으로 대체된 항목
+                continue
+            del self._scheduled[websocket]
+            last_seen = self._last_seen[websocket]
+            processed += 1
+
+            if self.idle_timeout > 0 and now - self._last_activity[websocket] >= self.idle_timeout:
+                self.reaped_idle += 1
+                self.forget(websocket)
+                self._on_reap(websocket, "idle")
+                continue
+
+            if websocket not in self._ping_enabled:
+                self._schedule(websocket, now)
+                continue
+
+            ping_sent = self._ping_sent.get(websocket)
+            if ping_sent is not None:
+                if now - ping_sent >= self.pong_timeout:
+                    self.reaped_unresponsive += 1
+                    self.forget(websocket)
+                    self._on_reap(websocket, "unresponsive")
+                    continue
+                self._push(ping_sent + self.pong_timeout, websocket)
+                continue
+
+            if now - last_seen >= self.interval:
+                self._ping_sent[websocket] = now
+                self.pings += 1
+                self._on_ping(websocket)
+                self._push(now + self.pong_timeout, websocket)
+            else:
+                self._schedule(websocket, now)
+
+    def metrics(self) -> dict:
+        return {
+            "heartbeat_live": len(self._last_seen),
+            "heartbeat_ping_enabled": len(self._ping_enabled),
+            "heartbeat_awaiting_pong": len(self._ping_sent),
+            "heartbeat_pings": self.pings,
+            "heartbeat_reaped_idle": self.reaped_idle,
+            "heartbeat_reaped_unresponsive": self.reaped_unresponsive,
+        }
@@ -0,0 +1,72 @@
+import bisect
+from typing import Dict, List, Optional, Sequence
+
+# 버킷 상한(초). 마지막 버킷(+Inf)은 자동으로 추가됩니다.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LatencyHistogram:
+    """
+    고정 버킷 누적 히스토그램 (Prometheus histogram과 같은 방식).
+    observe()는 bisect 한 번과 정수 증가뿐이라 요청/쿼리마다 호출해도 부담이 적고,
+    p50/p99는 버킷 경계로 근사합니다.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets: List[float] = sorted(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram(self.buckets)
+        histogram.counts = list(self.counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        histogram.max = self.max
+        return histogram
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수가 속한 버킷의 상한(초, 최대 관측값을 넘지 않음), 관측값이 없으면 None"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.buckets[index], self.max) if index < len(self.buckets) else self.max
+        return self.max
+
+    def cumulative(self) -> List[int]:
+        """버킷별 누적 개수 (le 순서, 마지막은 +Inf)"""
+        total = 0
+        result = []
+        for bucket_count in self.counts:
+            total += bucket_count
+            result.append(total)
+        return result
+
+    def snapshot(self) -> Dict[str, object]:
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": self.count,
+            "avg_ms": ms(self.sum / self.count) if self.count else None,
+            "p50_ms": ms(self.quantile(0.5)),
+            "p99_ms": ms(self.quantile(0.99)),
+            "max_ms": ms(self.max) if self.count else None,
+            "buckets_ms": {
+                **{f"{bucket * 1000:g}": total for bucket, total in zip(self.buckets, self.cumulative())},
+                "+Inf": self.count,
+            },
+        }
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+from collections import deque
+from enum import Enum
+from typing import Callable, List, NamedTuple, Optional, Union
+
+from starlette.websockets import WebSocket
+
+from app import codec
+from app.codec import JsonText
+from app.binary_protocol import WireEncoding, encode_outbound
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """송신 큐가 가득 찼을 때의 처리 방식"""
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+class BatchPolicy(NamedTuple):
+    """
+    micro-batching 설정.
+    첫 메시지가 들어온 뒤 window_ms 동안(또는 max_messages개가 찰 때까지) 모아
+    JSON 배열 하나의 프레임으로 보냅니다.
+    """
+    window_ms: float
+    max_messages: int
+
+    @classmethod
+    def parse(cls, value) -> Optional["BatchPolicy"]:
+        """{"window_ms": 5, "max_messages": 50} 또는 "5:50" 형식. 0이나 잘못된 값이면 None"""
+        try:
+            if isinstance(value, dict):
+                window_ms = float(value.get("window_ms", 0))
+                max_messages = int(value.get("max_messages", 0))
+            elif isinstance(value, str) and value:
+                window, _, count = value.partition(":")
+                window_ms = float(window)
+                max_messages = int(count or 0)
+            else:
+                return None
+        except (TypeError, ValueError):
+            return None
+        if window_ms <= 0 or max_messages <= 1:
+            return None
+        return cls(min(window_ms, 1000.0), max_messages)
+
+
+class OutboundQueue:
+    """
+    연결 하나에 대응하는 크기 제한 송신 큐.
+    put()은 절대 대기하지 않고, 전용 writer 태스크가 큐를 비우며 소켓에 전송합니다.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        maxsize: int,
+        policy: OverflowPolicy,
+        send_timeout: float,
+        on_failure: Callable[[WebSocket], None],
+    ):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self._on_failure = on_failure
+        self._items: deque = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._timed_out = False
+        # ws_headers에서 협상한 송신 형식 (bytes 형식이면 send_bytes로 보냄)
+        self.encoding = WireEncoding.TEXT
+        # batching 중에는 인코딩 전 메시지(str)를 받아 flush 시점에 한 번에 인코딩
+        self.batch: Optional[BatchPolicy] = None
+        self.closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.batches = 0
+        self.batched_messages = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def put(self, message: Union[str, bytes]) -> bool:
+        """메시지를 큐에 넣습니다. 정책에 따라 버려지거나 연결이 끊기면 False를 반환합니다."""
+        if self.closed:
+            return False
+
+        if len(self._items) >= self.maxsize:
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return False
+            if self.policy == OverflowPolicy.DROP_OLDEST:
+                self._items.popleft()
+                self.dropped += 1
+            else:
+                logger.warning("outbound queue full (%d), disconnecting client", self.maxsize)
+                # 이 메시지만 셈 — 큐에 남은 메시지는 연결을 정리할 때 close()가 셈
+                self.dropped += 1
+                self._on_failure(self.websocket)
+                return False
+
+        self._items.append(message)
+        self._wakeup.set()
+        return True
+
+    def close(self):
+        """writer 태스크를 멈추고 남은 메시지를 버립니다."""
+        if self.closed:
+            return
+        self.closed = True
+        self.dropped += len(self._items)
+        self._items.clear()
+        self._wakeup.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def _on_send_timeout(self):
+        self._timed_out = True
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run(self):
+        # 메시지마다 wait_for로 태스크를 만들지 않고, 타이머 하나로 writer 태스크 자체를 취소합니다.
+        loop = asyncio.get_running_loop()
+        items = self._items
+        while not self.closed:
+            if not items:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            message = items.popleft()
+            if self.batch is not None and isinstance(message, str):
+                message = await self._collect_batch(loop, message)
+                if message is None:
+                    continue
+
+            timer = loop.call_later(self.send_timeout, self._on_send_timeout)
+            try:
+                if isinstance(message, bytes):
+                    await self.websocket.send_bytes(message)
+                else:
+                    await self.websocket.send_text(message)
+                self.sent += 1
+            except asyncio.CancelledError:
+                if not self._timed_out:
+                    raise
+                logger.warning("outbound send timed out after %.3fs", self.send_timeout)
+                self._on_failure(self.websocket)
+                return
+            except Exception:
+                logger.debug("outbound send failed", exc_info=True)
+                self._on_failure(self.websocket)
+                return
+            finally:
+                timer.cancel()
+
+    async def _collect_batch(self, loop, first: str) -> Optional[Union[str, bytes]]:
+        """window 동안 메시지를 모아 하나의 프레임으로 만듭니다. 모은 메시지가 하나면 그대로 보냅니다."""
+        policy = self.batch
+        items = self._items
+        batch: List[str] = [first]
+        deadline = loop.time() + policy.window_ms / 1000
+
+        while len(batch) < policy.max_messages and not self.closed:
+            if items:
+                if not isinstance(items[0], str):
+                    break
+                batch.append(items.popleft())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            # put()이 호출되거나 window가 끝나면 깨어남
+            self._wakeup.clear()
+            timer = loop.call_later(remaining, self._wakeup.set)
+            try:
+                await self._wakeup.wait()
+            finally:
+                timer.cancel()
+
+        if self.closed:
+            return None
+        if len(batch) == 1:
+            return encode_outbound(first, self.encoding)
+
+        self.batches += 1
+        self.batched_messages += len(batch)
+        # 이미 JSON인 메시지(JsonText)는 그대로, 일반 문자열은 JSON 문자열로 감싸 배열을 만듦
+        text = JsonText("[" + ",".join(
+            item if isinstance(item, JsonText) else codec.dumps(item) for item in batch
+        ) + "]")
+        return encode_outbound(text, self.encoding)
@@ -0,0 +1,122 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+
+def _hash_all(hash_fn: Callable[[str], str], passwords: List[str]) -> List[str]:
+    # 프로세스 풀로 보낼 수 있도록 모듈 최상위 함수로 둠
+    return [hash_fn(password) for password in passwords]
+
+
+class PasswordHasherBusy(Exception):
+    """대기 중인 해시 작업이 max_pending을 넘어 새 요청을 받지 않음"""
+
+
+class PasswordHasherPool:
+    """
+    비밀번호 해시/검증(pbkdf2)을 이벤트 루프 밖의 크기 제한 풀에서 실행합니다.
+
+    kind="thread"  : hashlib.pbkdf2_hmac은 계산 중 GIL을 놓으므로 스레드만으로 여러 코어를 사용
+    kind="process" : 프로세스 풀 (hash_fn / verify_fn은 pickle 가능한 모듈 최상위 함수여야 함)
+
+    실행 중 + 대기 중인 작업이 max_pending개를 넘으면 PasswordHasherBusy를 발생시켜
+    로그인 폭주 시 큐가 끝없이 쌓이지 않도록 합니다(admission control).
+
+    대량 가입(hash_many)은 bulk_chunk_size개씩 묶은 작업을 동시에 최대 bulk_workers개만 제출하므로
+    가져오기가 진행 중이어도 나머지 워커는 로그인/회원가입 해시에 남습니다.
+    """
+
+    def __init__(
+        self,
+        hash_fn: Callable[[str], str],
+        verify_fn: Callable[[str, str], bool],
+        kind: str = "thread",
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        bulk_workers: Optional[int] = None,
+        bulk_chunk_size: int = 16,
+    ):
+        self.hash_fn = hash_fn
+        self.verify_fn = verify_fn
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 16
+        # 기본값: 워커의 절반 (워커가 1개면 1 — 이때 로그인은 최대 묶음 하나만큼 기다림)
+        self.bulk_workers = min(bulk_workers or max(1, self.workers // 2), self.workers)
+        self.bulk_chunk_size = max(1, bulk_chunk_size)
+        self._executor: Optional[Executor] = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> Executor:
+        # 프로세스 풀은 import 시점이 아니라 처음 사용할 때 생성
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="pwhash")
+        return self._executor
+
+    async def _submit(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.hash_fn, password)
+
+    async def hash_many(self, passwords: List[str]) -> List[str]:
+        """
+        대량 가입용: 비밀번호 목록을 bulk_chunk_size개 묶음으로 나눠 해시 (입력 순서 유지).
+        동시에 실행하는 묶음은 bulk_workers개까지이므로 max_pending 한도도 그만큼만 차지합니다.
+        묶음 하나라도 실패(PasswordHasherBusy 등)하면 남은 묶음은 제출하지 않고 예외를 그대로 올립니다.
+        """
+        if not passwords:
+            return []
+        size = self.bulk_chunk_size
+        parts = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        results: List[Optional[List[str]]] = [None] * len(parts)
+        remaining = iter(range(len(parts)))
+
+        async def drain():
+            try:
+                for index in remaining:
+                    results[index] = await self._submit(_hash_all, self.hash_fn, parts[index])
+            except BaseException:
+                for _ in remaining:
+                    pass
+                raise
+
+        await asyncio.gather(*(drain() for _ in range(min(self.bulk_workers, len(parts)))))
+        return [hashed for part in results for hashed in part]
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(self.verify_fn, plain_password, hashed_password)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def metrics(self) -> dict:
+        return {
+            "executor": self.kind,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "bulk_workers": self.bulk_workers,
+            "in_flight": min(self.pending, self.workers),
+            "queued": max(0, self.pending - self.workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,118 @@
+import threading
+import time
+from typing import Dict, Tuple, Type
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.Classes.LatencyHistogram import LatencyHistogram
+
+
+class PoolMonitor:
+    """
+    SQLAlchemy 커넥션 풀과 쿼리 지연을 수집합니다.
+
+    - 풀 대기 시간 : pool_class()로 만든 풀 클래스가 커넥션을 꺼낼 때(_do_get) 걸린 시간을 기록
+    - 쿼리 지연     : before/after_cursor_execute 이벤트로 측정, 문장 종류(SELECT/INSERT/...)별 히스토그램
+    - 풀 상태       : metrics() 호출 시점의 checked-out / idle / overflow
+
+    sync 모드에서는 db_executor 스레드들이 동시에 기록하므로 히스토그램 갱신은 잠금으로 보호합니다.
+    """
+
+    SLOW_QUERY_SECONDS = 0.5
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Engine] = {}
+        self.pool_wait: Dict[str, LatencyHistogram] = {}
+        self.queries: Dict[str, LatencyHistogram] = {}
+        self.pool_timeouts = 0
+        self.query_errors = 0
+        self.slow_queries = 0
+
+    def pool_class(self, base: Type[QueuePool], name: str) -> Type[QueuePool]:
+        """커넥션을 얻기까지 기다린 시간을 기록하는 base의 하위 클래스 (create_engine(poolclass=...)용)"""
+        histogram = self.pool_wait.setdefault(name, LatencyHistogram())
+        monitor = self
+
+        def _do_get(pool, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return base._do_get(pool, *args, **kwargs)
+            except exc.TimeoutError:
+                with monitor._lock:
+                    monitor.pool_timeouts += 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                with monitor._lock:
+                    histogram.observe(elapsed)
+
+        # SQLAlchemy는 풀 로거 이름을 클래스의 모듈에서 정하므로, sqlalchemy.* 로거 레벨(기본 WARN)을 따르도록 base의 모듈을 유지
+        return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get, "__module__": base.__module__})
+
+    def instrument(self, engine: Engine, name: str):
+        """engine(async 엔진은 .sync_engine)에 쿼리 지연 이벤트를 연결"""
+        self._engines[name] = engine
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get("query_started")
+        if not stack:
+            return
+        elapsed = time.perf_counter() - stack.pop()
+        kind = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        with self._lock:
+            histogram = self.queries.get(kind)
+            if histogram is None:
+                histogram = self.queries[kind] = LatencyHistogram()
+            histogram.observe(elapsed)
+            if elapsed >= self.SLOW_QUERY_SECONDS:
+                self.slow_queries += 1
+
+    def _on_error(self, exception_context):
+        connection = exception_context.connection
+        if connection is not None:
+            stack = connection.info.get("query_started")
+            if stack:
+                stack.pop()
+        with self._lock:
+            self.query_errors += 1
+
+    @staticmethod
+    def _pool_status(pool: Pool) -> dict:
+        if not isinstance(pool, QueuePool):
+            return {"pool": type(pool).__name__}
+        return {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # pool_size를 넘어 만든 연결 수 (QueuePool.overflow()는 아직 pool_size만큼 만들지 않았으면 음수)
+            "overflow": max(0, pool.overflow()),
+        }
+
+    def histograms(self) -> Tuple[Dict[str, LatencyHistogram], Dict[str, LatencyHistogram]]:
+        """(엔진별 풀 대기, 문장 종류별 쿼리) 히스토그램의 사본 — 잠금 안에서 복사하므로 버킷과 count가 어긋나지 않음"""
+        with self._lock:
+            return (
+                {name: histogram.copy() for name, histogram in self.pool_wait.items()},
+                {kind: histogram.copy() for kind, histogram in self.queries.items()},
+            )
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "pools": {name: self._pool_status(engine.pool) for name, engine in self._engines.items()},
+                "pool_wait": {name: histogram.snapshot() for name, histogram in self.pool_wait.items()},
+                "pool_timeouts": self.pool_timeouts,
+                "queries": {kind: histogram.snapshot() for kind, histogram in self.queries.items()},
+                "query_errors": self.query_errors,
+                "slow_queries": self.slow_queries,
+            }
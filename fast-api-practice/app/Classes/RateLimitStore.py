@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitStoreError(Exception):
+    """저장소(Redis 등)에 접근하지 못함 — RateLimiter는 이 경우 요청을 통과시킴(fail open)"""
+
+
+class RateLimitStore(ABC):
+    """
+    sliding window counter용 카운터 저장소 인터페이스.
+    hit()은 key의 현재 window 카운터를 1 올리고 (직전 window 카운트, 현재 window 카운트)를 돌려줍니다.
+    window 번호(now_ms // window_ms)는 호출하는 쪽에서 계산하므로 저장소는 단순 카운터만 관리합니다.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, window_ms: int, now_ms: int) -> Tuple[int, int]:
+        """(직전 window 카운트, 현재 window 카운트) — 저장소에 접근하지 못하면 RateLimitStoreError"""
+
+    async def close(self):
+        pass
+
+    def metrics(self) -> dict:
+        return {"rate_limit_store": type(self).__name__}
+
+
+class ShardedMemoryRateLimitStore(RateLimitStore):
+    """
+    프로세스 메모리에 카운터를 두는 기본 구현 (워커마다 따로 셈).
+    key를 shards개의 dict로 나눠 두고, shard가 max_keys_per_shard를 넘으면 그 shard만 정리하므로
+    스푸핑된 IP / username이 쏟아져도 정리 비용이 한 shard 크기로 제한되고 메모리도 상한을 넘지 않습니다.
+    이벤트 루프 안에서만 사용하므로 잠금은 없습니다.
+    """
+
+    def __init__(self, shards: int = 64, max_keys_per_shard: int = 4096):
+        self.max_keys_per_shard = max_keys_per_shard
+        # key -> [window 번호, 직전 window 카운트, 현재 window 카운트, 정리해도 되는 시각(ms)]
+        self._shards: List[dict] = [{} for _ in range(max(1, shards))]
+        self.evictions = 0
+
+    async def hit(self, key: str, window_ms: int, now_ms: int) -> Tuple[int, int]:
+        shard = self._shards[hash(key) % len(self._shards)]
+        window = now_ms // window_ms
+        entry = shard.get(key)
+        if entry is None:
+            if len(shard) >= self.max_keys_per_shard:
+                self._evict(shard, now_ms)
+            shard[key] = [window, 0, 1, (window + 2) * window_ms]
+            return 0, 1
+
+        if entry[0] != window:
+            entry[1] = entry[2] if entry[0] == window - 1 else 0
+            entry[2] = 0
+            entry[0] = window
+            entry[3] = (window + 2) * window_ms
+        entry[2] += 1
+        return entry[1], entry[2]
+
+    def _evict(self, shard: dict, now_ms: int):
+        # 다음 window가 끝나면 카운터가 더 이상 결과에 영향을 주지 않으므로 그 시각이 지난 key부터 정리
+        stale = [key for key, entry in shard.items() if entry[3] <= now_ms]
+        for key in stale:
+            del shard[key]
+        # 모두 살아 있으면 가장 먼저 들어온 key부터 버림
+        while len(shard) >= self.max_keys_per_shard:
+            del shard[next(iter(shard))]
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def metrics(self) -> dict:
+        return {
+            **super().metrics(),
+            "rate_limit_keys": len(self),
+            "rate_limit_evictions": self.evictions,
+        }
+
+
+def _encode_command(*args) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader):
+    """RESP 응답 하나를 읽음 (오류 응답은 raise하지 않고 RateLimitStoreError 객체로 돌려줌)"""
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("connection closed")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest.decode()
+    if kind == b"-":
+        return RateLimitStoreError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        length = int(rest)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(rest)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"unexpected reply: {line!r}")
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Redis 프로토콜(RESP)을 쓰는 저장소 — 여러 워커 / 서버가 같은 카운터를 공유합니다.
+    hit() 한 번에 INCR / PEXPIRE / GET을 pipeline으로 보내 왕복 1회로 처리하며,
+    INCR가 원자적이므로 여러 워커가 동시에 세어도 카운트가 빠지지 않습니다.
+    연결 하나를 lock으로 나눠 쓰고, 오류가 나면 연결을 닫았다가 다음 호출에서 다시 연결합니다.
+    """
+
+    def __init__(self, url: str, prefix: str = "rl:", timeout: float = 0.5):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+        self.errors = 0
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            await self._send(setup)
+
+    async def _send(self, commands: List[tuple]) -> list:
+        self._writer.write(b"".join(_encode_command(*command) for command in commands))
+        await self._writer.drain()
+        replies = [await _read_reply(self._reader) for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RateLimitStoreError):
+                raise reply
+        return replies
+
+    async def pipeline(self, *commands: tuple) -> list:
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await asyncio.wait_for(self._connect(), self.timeout)
+                return await asyncio.wait_for(self._send(list(commands)), self.timeout)
+            except (OSError, ConnectionError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    RateLimitStoreError) as e:
+                self.errors += 1
+                self._disconnect()
+                raise RateLimitStoreError(f"redis {self.host}:{self.port}: {e!r}") from e
+
+    async def hit(self, key: str, window_ms: int, now_ms: int) -> Tuple[int, int]:
+        window = now_ms // window_ms
+        current_key = f"{self.prefix}{key}:{window}"
+        replies = await self.pipeline(
+            ("INCR", current_key),
+            ("PEXPIRE", current_key, window_ms * 2),
+            ("GET", f"{self.prefix}{key}:{window - 1}"),
+        )
+        return int(replies[2] or 0), replies[0]
+
+    def _disconnect(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def close(self):
+        async with self._lock:
+            self._disconnect()
+
+    def metrics(self) -> dict:
+        return {
+            **super().metrics(),
+            "rate_limit_store_errors": self.errors,
+        }
+
+
+def create_rate_limit_store() -> RateLimitStore:
+    """
+    RATE_LIMIT_STORE 환경변수로 구현을 선택합니다.
+      memory (기본값) : 워커 프로세스마다 따로 셈
+      redis           : RATE_LIMIT_REDIS_URL (redis://[:password@]host:port/db)의 Redis와 공유
+    """
+    kind = os.getenv("RATE_LIMIT_STORE", "memory").lower()
+    if kind == "redis":
+        return RedisRateLimitStore(os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0"))
+    if kind != "memory":
+        logger.warning("unknown RATE_LIMIT_STORE=%s, falling back to memory", kind)
+    return ShardedMemoryRateLimitStore()
@@ -0,0 +1,96 @@
+import itertools
+import threading
+from typing import Dict, List, Optional
+
+
+class _ReplicaState:
+    __slots__ = ("name", "latency", "lag", "healthy", "checked", "reads")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency: Optional[float] = None   # 확인 쿼리 왕복 시간 EWMA (초)
+        self.lag: Optional[float] = None       # 마지막으로 확인한 replication lag (초)
+        self.healthy = False
+        self.checked = False
+        self.reads = 0
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 replica 선택.
+
+    - strategy: round_robin(기본값) | least_latency (확인 쿼리 왕복 시간의 EWMA가 가장 작은 replica)
+    - observe()로 받은 확인 결과에서 lag가 max_lag초를 넘거나 확인에 실패한 replica는 건너뜀 (max_lag <= 0이면 lag는 보지 않음)
+    - 아직 한 번도 확인하지 않은 replica도 쓰지 않으며, 쓸 수 있는 replica가 없으면 None(= primary 사용)
+    sync 모드에서는 db_executor 스레드에서 세션이 replica를 고르므로 상태는 잠금으로 보호합니다.
+    """
+
+    STRATEGIES = ("round_robin", "least_latency")
+    LATENCY_SMOOTHING = 0.3
+
+    def __init__(self, names: List[str], strategy: str = "round_robin", max_lag: float = 5.0):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"unknown replica strategy {strategy} (expected one of {', '.join(self.STRATEGIES)})")
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self._lock = threading.Lock()
+        self._replicas: Dict[str, _ReplicaState] = {name: _ReplicaState(name) for name in names}
+        self._cycle = itertools.cycle(names) if names else None
+        self.primary_fallbacks = 0
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._replicas)
+
+    def observe(self, name: str, latency: Optional[float], lag: Optional[float]):
+        """replica 확인 결과 — latency가 None이면 확인 실패, lag가 None이면 lag를 알 수 없음(heartbeat 없음)"""
+        with self._lock:
+            replica = self._replicas[name]
+            replica.checked = True
+            if latency is None:
+                replica.healthy = False
+                return
+            replica.latency = latency if replica.latency is None else (
+                replica.latency + self.LATENCY_SMOOTHING * (latency - replica.latency)
+            )
+            replica.lag = lag
+            replica.healthy = self.max_lag <= 0 or (lag is not None and lag <= self.max_lag)
+
+    def choose(self) -> Optional[str]:
+        """이번 세션이 읽을 replica 이름 (없으면 None)"""
+        with self._lock:
+            if self._cycle is None:
+                return None
+            if self.strategy == "least_latency":
+                candidates = [replica for replica in self._replicas.values() if replica.healthy]
+                chosen = min(candidates, key=lambda replica: replica.latency) if candidates else None
+            else:
+                chosen = None
+                for _ in range(len(self._replicas)):
+                    replica = self._replicas[next(self._cycle)]
+                    if replica.healthy:
+                        chosen = replica
+                        break
+            if chosen is None:
+                self.primary_fallbacks += 1
+                return None
+            chosen.reads += 1
+            return chosen.name
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "strategy": self.strategy,
+                "max_lag": self.max_lag,
+                "primary_fallbacks": self.primary_fallbacks,
+                "replicas": {
+                    replica.name: {
+                        "healthy": replica.healthy,
+                        "checked": replica.checked,
+                        "lag": replica.lag,
+                        "latency_ms": None if replica.latency is None else round(replica.latency * 1000, 3),
+                        "reads": replica.reads,
+                    }
+                    for replica in self._replicas.values()
+                },
+            }
@@ -0,0 +1,122 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.Classes.LatencyHistogram import LatencyHistogram
+
+
+class RouteStats:
+    """라우트 하나(method + 경로 템플릿)의 지연 히스토그램과 진행 중인 요청 수"""
+
+    __slots__ = ("in_flight", "duration", "dependencies", "handler", "responses")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.duration = LatencyHistogram()
+        # duration = dependencies(timed_dependency로 감싼 의존성의 실행 시간 합) + handler(나머지 전부)
+        self.dependencies = LatencyHistogram()
+        self.handler = LatencyHistogram()
+        # status code -> 응답 수
+        self.responses: Dict[int, int] = {}
+
+
+class RequestMonitor:
+    """
+    HTTP 요청 지연을 라우트별로 수집합니다.
+
+    - 요청 전체 : RequestMetricsMiddleware가 begin() / end()로 기록
+    - 의존성    : timed_dependency()로 감싼 의존성(get_db, get_current_user 등)의 실행 시간을
+                  요청별 누적값(contextvar)과 component 히스토그램에 함께 기록
+    - component : measure()로 감싼 구간(pbkdf2, JWT 검증 등)의 실행 시간
+
+    모든 기록은 이벤트 루프 스레드에서만 일어나므로 잠금 없이 정수/히스토그램을 바로 갱신합니다.
+    (동기 의존성은 FastAPI가 스레드 풀에서 실행하므로 timed_dependency는 async 함수에만 사용하세요.)
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.components: Dict[str, LatencyHistogram] = {}
+        self.in_flight = 0
+        # 현재 요청의 의존성 실행 시간 합계 ([초] — 리스트로 두어 자식 context에서도 같은 값을 갱신)
+        self._dependency_time: contextvars.ContextVar[Optional[List[float]]] = contextvars.ContextVar(
+            "dependency_time", default=None
+        )
+
+    def route(self, method: str, path: str) -> RouteStats:
+        stats = self.routes.get((method, path))
+        if stats is None:
+            stats = self.routes[(method, path)] = RouteStats()
+        return stats
+
+    def begin(self, stats: RouteStats) -> Tuple[float, List[float], contextvars.Token]:
+        self.in_flight += 1
+        stats.in_flight += 1
+        dependency_time = [0.0]
+        return time.perf_counter(), dependency_time, self._dependency_time.set(dependency_time)
+
+    def end(self, stats: RouteStats, state: Tuple[float, List[float], contextvars.Token], status: int):
+        started, dependency_time, token = state
+        elapsed = time.perf_counter() - started
+        self._dependency_time.reset(token)
+        self.in_flight -= 1
+        stats.in_flight -= 1
+        stats.duration.observe(elapsed)
+        stats.dependencies.observe(dependency_time[0])
+        stats.handler.observe(max(0.0, elapsed - dependency_time[0]))
+        stats.responses[status] = stats.responses.get(status, 0) + 1
+
+    def observe_component(self, name: str, seconds: float):
+        histogram = self.components.get(name)
+        if histogram is None:
+            histogram = self.components[name] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def _observe_dependency(self, name: str, seconds: float):
+        self.observe_component(name, seconds)
+        dependency_time = self._dependency_time.get()
+        if dependency_time is not None:
+            dependency_time[0] += seconds
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        """with 블록(안의 await 포함) 실행 시간을 component 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_component(name, time.perf_counter() - started)
+
+    def timed_dependency(self, name: str) -> Callable[[Callable], Callable]:
+        """
+        FastAPI 의존성 데코레이터. 하위 의존성은 호출 전에 이미 풀려 있으므로 함수 자신의 실행 시간만 잽니다.
+        yield 의존성(get_db 등)은 yield까지(세션 준비)만 잽니다.
+        functools.wraps가 __wrapped__를 남기므로 FastAPI는 원래 함수의 signature로 의존성을 분석합니다.
+        """
+
+        def decorator(fn: Callable) -> Callable:
+            if inspect.isasyncgenfunction(fn):
+                context_manager = contextlib.asynccontextmanager(fn)
+
+                @functools.wraps(fn)
+                async def generator_wrapper(*args, **kwargs):
+                    started = time.perf_counter()
+                    async with context_manager(*args, **kwargs) as value:
+                        self._observe_dependency(name, time.perf_counter() - started)
+                        yield value
+
+                return generator_wrapper
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    self._observe_dependency(name, time.perf_counter() - started)
+
+            return wrapper
+
+        return decorator
@@ -0,0 +1,57 @@
+from typing import Dict, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.Classes.ReplicaRouter import ReplicaRouter
+
+# 읽기 문장도 primary로 보내려면 statement.execution_options(**READ_FROM_PRIMARY)
+READ_FROM_PRIMARY = {"db_route": "primary"}
+
+
+class RoutingSession(Session):
+    """
+    SELECT는 replica, 나머지는 primary로 보내는 Session (SQLAlchemy 문서의 "custom get_bind" 방식).
+
+    - replica는 세션에서 처음 읽을 때 router.choose()로 하나 고르고, 세션이 끝날 때까지 같은 replica를 씀
+      (한 요청이 서로 다른 replica의 서로 다른 시점을 섞어 읽지 않도록)
+    - flush / INSERT / UPDATE / DELETE / SELECT ... FOR UPDATE / text() 문장이 한 번이라도 있으면 그 뒤로는 모든 문장이
+      primary로 감 — 같은 요청 안에서 방금 쓴 내용을 replica에서 (아직 복제되지 않은 상태로) 읽지 않도록
+    - use_primary()를 호출하거나 문장에 execution_options(**READ_FROM_PRIMARY)를 주면 읽기도 primary
+    replica가 없거나 쓸 수 있는 replica가 없으면 모든 문장이 primary입니다.
+    """
+
+    def __init__(self, *args, primary: Engine, replicas: Dict[str, Engine], router: ReplicaRouter, **kwargs):
+        kwargs["bind"] = primary
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.router = router
+        self.pinned = not replicas
+        self._replica: Optional[Engine] = None
+        self._chosen = False
+
+    def use_primary(self):
+        """이 세션의 이후 모든 문장을 primary로"""
+        self.pinned = True
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self.pinned:
+            return self.primary
+        if self._flushing or (clause is not None and self._writes(clause)):
+            self.pinned = True
+            return self.primary
+        if clause is None or clause.get_execution_options().get("db_route") == "primary":
+            return self.primary
+
+        if not self._chosen:
+            self._chosen = True
+            name = self.router.choose()
+            self._replica = self.replicas[name] if name is not None else None
+        return self._replica if self._replica is not None else self.primary
+
+    @staticmethod
+    def _writes(clause) -> bool:
+        if not getattr(clause, "is_select", False):
+            return True
+        return getattr(clause, "_for_update_arg", None) is not None
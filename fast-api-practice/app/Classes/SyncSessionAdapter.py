@@ -0,0 +1,84 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Union
+
+from sqlalchemy.engine import CursorResult, Result
+from sqlalchemy.orm import Session
+
+
+class _StreamedResult:
+    """AsyncResult.partitions()와 같은 방식으로 server-side cursor 결과를 조금씩 읽음"""
+
+    def __init__(self, result: Result, run: Callable[..., Awaitable[Any]]):
+        self._result = result
+        self._run = run
+
+    async def partitions(self, size: Optional[int] = None) -> AsyncIterator[List[Any]]:
+        while True:
+            rows = await self._run(self._result.fetchmany, size)
+            if not rows:
+                return
+            yield rows
+
+
+class SyncSessionAdapter:
+    """
+    동기 Session을 AsyncSession과 같은 형태(await db.execute(...) 등)로 감싼 어댑터.
+    DB_MODE=sync일 때 get_db가 반환하며, 모든 DB 작업은 run(db_executor)에서 실행됩니다.
+    결과는 executor 안에서 모두 읽어 둔(buffered) Result로 돌려주므로 이벤트 루프에서 I/O가 일어나지 않습니다.
+    라우터가 한 번에 하나씩 await하므로 세션을 여러 스레드가 동시에 쓰는 일은 없습니다.
+    """
+
+    def __init__(self, session: Session, run: Callable[..., Awaitable[Any]]):
+        self.sync_session = session
+        self._run = run
+
+    def _execute_buffered(self, statement, params) -> Result:
+        result = self.sync_session.execute(statement, params)
+        if isinstance(params, list) or (isinstance(result, CursorResult) and not result.returns_rows):
+            # executemany(대량 insert 등)나 RETURNING 없는 UPDATE/DELETE는 읽을 행이 없음
+            return result
+        return result.freeze()()
+
+    async def execute(self, statement, params: Optional[Union[dict, List[dict]]] = None) -> Result:
+        return await self._run(self._execute_buffered, statement, params)
+
+    async def stream(self, statement, params: Optional[dict] = None) -> _StreamedResult:
+        """AsyncSession.stream과 같은 용도 — 결과를 한꺼번에 읽지 않고 partitions()로 나눠 읽음"""
+        statement = statement.execution_options(stream_results=True)
+        result = await self._run(self.sync_session.execute, statement, params)
+        return _StreamedResult(result, self._run)
+
+    async def scalars(self, statement, params: Optional[dict] = None):
+        return (await self.execute(statement, params)).scalars()
+
+    async def scalar(self, statement, params: Optional[dict] = None):
+        return await self._run(self.sync_session.scalar, statement, params)
+
+    async def get(self, entity, ident, **kwargs):
+        return await self._run(lambda: self.sync_session.get(entity, ident, **kwargs))
+
+    def get_bind(self):
+        return self.sync_session.get_bind()
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+
+    async def delete(self, instance):
+        await self._run(self.sync_session.delete, instance)
+
+    async def flush(self):
+        await self._run(self.sync_session.flush)
+
+    async def commit(self):
+        await self._run(self.sync_session.commit)
+
+    async def rollback(self):
+        await self._run(self.sync_session.rollback)
+
+    async def refresh(self, instance):
+        await self._run(self.sync_session.refresh, instance)
+
+    async def close(self):
+        await self._run(self.sync_session.close)
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.Classes.RoutingSession import READ_FROM_PRIMARY
+from app.database import REPLICA_NAMES, open_session
+from app.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class UserLookupBatcher:
+    """
+    WebSocket 로그인용 사용자 조회.
+    짧은 시간(window) 안에 들어온 조회를 하나의 WHERE username IN (...) 쿼리로 묶어
+    DB_MODE의 세션(open_session — async 모드는 AsyncSession, sync 모드는 db_executor 스레드)으로 실행하므로
+    로그인이 몰려도 이벤트 루프가 막히지 않고, async 모드에서 sync 엔진(별도 커넥션 풀)을 만들지 않습니다.
+    결과는 세션과 분리된 dict(id, uid, username, email)로 반환합니다.
+    """
+
+    def __init__(self, window: float = 0.002, max_batch: int = 200):
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._running: set[asyncio.Task] = set()
+        self.lookups = 0
+        self.batches = 0
+
+    async def get(self, username: str) -> Optional[dict]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(username, []).append(future)
+        self.lookups += 1
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        self.batches += 1
+        task = asyncio.create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[str, List[asyncio.Future]]):
+        try:
+            users = await self._query(list(batch))
+        except Exception as e:
+            logger.exception("user lookup batch failed (%d usernames)", len(batch))
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for username, futures in batch.items():
+            user = users.get(username)
+            for future in futures:
+                if not future.done():
+                    future.set_result(user)
+
+    @staticmethod
+    async def _query(usernames: List[str]) -> Dict[str, dict]:
+        """replica가 있으면 replica에서 읽고, 없는 사용자만 primary에서 다시 찾음"""
+        columns = (User.id, User.uid, User.username, User.email)
+        async with open_session() as db:
+            rows = (await db.execute(select(*columns).where(User.username.in_(usernames)))).all()
+            missing = set(usernames).difference(row.username for row in rows)
+            if missing and REPLICA_NAMES:
+                # 가입 직후라 replica에 아직 없을 수 있음
+                rows += (await db.execute(
+                    select(*columns).where(User.username.in_(missing)).execution_options(**READ_FROM_PRIMARY)
+                )).all()
+        return {row.username: row._asdict() for row in rows}
+
+    def metrics(self) -> dict:
+        return {
+            "login_lookups": self.lookups,
+            "login_lookup_batches": self.batches,
+        }
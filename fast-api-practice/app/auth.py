@@ -1,52 +1,118 @@
-﻿from datetime import datetime, timedelta
+﻿from datetime import timedelta
 from typing import Optional, Dict, Any
+import hashlib
 import os
+import time
 
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+from app.jwt_backend import InvalidTokenError, create_jwt_backend
+from app.Classes.PasswordHasherPool import PasswordHasherPool
+from app.Classes.TTLCache import TTLCache
+from app.request_metrics import measure
 
 # 간단한 설정 — 실제 운영에서는 환경변수로 관리하세요.
 SECRET_KEY = "change_this_secret_for_production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+_DEFAULT_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# JWT_BACKEND: hs256(기본값) | jose
+jwt_backend = create_jwt_backend(SECRET_KEY, ALGORITHM)
+
+# 검증이 끝난 토큰의 claims 캐시 (토큰의 exp까지만 유지)
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+token_cache: TTLCache[Dict[str, Any]] = TTLCache(
+    maxsize=TOKEN_CACHE_SIZE,
+    ttl=_DEFAULT_EXPIRE_SECONDS,
+)
 
 # pbkdf2_sha256 사용 (bcrypt에 의존하지 않음)
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# passlib import와 CryptContext 생성은 처음 해시할 때 (앱 시작 시간에서 제외, process 풀에서는 워커마다 한 번)
+_pwd_context = None
+
+
+def get_pwd_context():
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+
+        _pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+    return _pwd_context
 
 
 def get_password_hash(password: str) -> str:
     """pbkdf2_sha256으로 비밀번호 해시 (bcrypt 관련 문제 회피)"""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """평문 비밀번호와 해시 비교"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+# 해시 계산(요청당 ~100ms CPU)이 이벤트 루프를 막지 않도록 별도 풀에서 실행
+# PASSWORD_HASH_EXECUTOR: thread(기본값) | process
+password_pool = PasswordHasherPool(
+    get_password_hash,
+    verify_password,
+    kind=os.getenv("PASSWORD_HASH_EXECUTOR", "thread"),
+    workers=int(os.getenv("PASSWORD_HASH_WORKERS", "0")) or None,
+    max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", "0")) or None,
+    bulk_workers=int(os.getenv("PASSWORD_HASH_BULK_WORKERS", "0")) or None,
+)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash를 password_pool에서 실행 (대기열이 가득 차면 PasswordHasherBusy)"""
+    with measure("password_hash"):
+        return await password_pool.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password를 password_pool에서 실행 (대기열이 가득 차면 PasswordHasherBusy)"""
+    with measure("password_verify"):
+        return await password_pool.verify(plain_password, hashed_password)
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    seconds = expires_delta.total_seconds() if expires_delta else _DEFAULT_EXPIRE_SECONDS
+    # exp는 epoch 초(정수) — datetime 생성/변환 없이 바로 계산
+    return jwt_backend.encode({**data, "exp": int(time.time() + seconds)})
+
+
+def _token_key(token: str) -> bytes:
+    # 토큰 원문 대신 digest를 키로 사용 (메모리에 토큰을 남기지 않음)
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def decode_access_token_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Verify a JWT access token and return its claims (cached until exp)"""
+    key = _token_key(token)
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    try:
+        with measure("jwt_decode"):
+            payload = jwt_backend.decode(token)
+    except InvalidTokenError:
+        return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, payload, expires_at=exp)
+    return payload
 
 
 def decode_access_token(token: str) -> Optional[str]:
     """Decode a JWT access token"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            return None
-        return username
-    except JWTError:
+    payload = decode_access_token_claims(token)
+    if payload is None:
+        return None
+    username: str = payload.get("sub")
+    if username is None:
         return None
+    return username
 
 # Swagger UI에 전달할 oauth 초기값 (환경변수로 설정 권장)
 SWAGGER_UI_PARAMS = {
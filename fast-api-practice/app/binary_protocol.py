@@ -0,0 +1,127 @@
+# /ws/chat 바이너리 프레임 프로토콜.
+#
+# ws_headers 핸드셰이크에서 {"protocol": "binary", "compression": "deflate"} 로 협상하며,
+# 모든 프레임은 3바이트 고정 헤더 뒤에 payload가 붙는 형태입니다.
+# 압축 없는 바이너리 송신은 텍스트보다 헤더만큼 크고 이점이 없어 협상하지 않습니다
+# ("compression" 없이 "binary"만 보내면 텍스트/accept_bytes 형식 유지).
+# 서버가 받는 프레임은 압축 여부와 관계없이 처리합니다.
+#
+#     byte 0 : 버전 (PROTOCOL_VERSION)
+#     byte 1 : 플래그 (FLAG_DEFLATE: payload가 zlib(deflate)로 압축됨)
+#     byte 2 : 종류
+#              KIND_JSON - payload는 UTF-8 JSON
+#              KIND_TEXT - payload는 UTF-8 문자열
+#              KIND_ROOM - payload는 [room 길이 u8][room UTF-8][메시지 UTF-8]
+#                          (서버가 JSON 파싱 없이 room을 읽어 라우팅)
+import os
+import zlib
+from enum import Enum
+from typing import Optional, Tuple, Union
+
+from app.codec import JsonText
+
+PROTOCOL_VERSION = 1
+
+FLAG_DEFLATE = 0x01
+
+KIND_JSON = 0x01
+KIND_TEXT = 0x02
+KIND_ROOM = 0x03
+
+HEADER_SIZE = 3
+# KIND_ROOM의 room 길이는 1바이트 (UTF-8 기준)
+MAX_ROOM_BYTES = 255
+
+# 이 크기 이상의 payload만 압축 (작은 메시지는 압축 헤더가 더 큼)
+COMPRESS_THRESHOLD = int(os.getenv("WS_COMPRESS_THRESHOLD", "512"))
+COMPRESS_LEVEL = 6
+# 받은 압축 payload를 풀었을 때 허용하는 최대 크기 (decompression bomb 방지)
+MAX_INFLATED_BYTES = int(os.getenv("WS_MAX_INFLATED_BYTES", str(1024 * 1024)))
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+class WireEncoding(str, Enum):
+    """연결별 송신 형식"""
+    TEXT = "text"                      # 기존 텍스트 프레임
+    BYTES = "bytes"                    # UTF-8 바이트 (accept_bytes)
+    BINARY_DEFLATE = "binary+deflate"  # 고정 헤더 프레임 + 큰 payload 압축
+
+
+def negotiate(data: dict) -> WireEncoding:
+    """ws_headers 메시지에서 송신 형식을 결정"""
+    if data.get("protocol") == "binary" and data.get("compression") == "deflate":
+        return WireEncoding.BINARY_DEFLATE
+    if data.get("accept_bytes"):
+        return WireEncoding.BYTES
+    return WireEncoding.TEXT
+
+
+def encode_frame(kind: int, payload: bytes, compress: bool = False) -> bytes:
+    flags = 0
+    if compress and len(payload) >= COMPRESS_THRESHOLD:
+        compressed = zlib.compress(payload, COMPRESS_LEVEL)
+        if len(compressed) < len(payload):
+            payload = compressed
+            flags |= FLAG_DEFLATE
+    return bytes((PROTOCOL_VERSION, flags, kind)) + payload
+
+
+def decode_frame(frame: bytes) -> Tuple[int, bytes]:
+    """(종류, 압축 해제된 payload) 반환"""
+    if len(frame) < HEADER_SIZE:
+        raise ProtocolError("frame too short")
+    version, flags, kind = frame[0], frame[1], frame[2]
+    if version != PROTOCOL_VERSION:
+        raise ProtocolError(f"unsupported protocol version {version}")
+    payload = frame[HEADER_SIZE:]
+    if flags & FLAG_DEFLATE:
+        payload = _inflate(payload)
+    return kind, payload
+
+
+def _inflate(payload: bytes, limit: Optional[int] = None) -> bytes:
+    """최대 limit(기본값 MAX_INFLATED_BYTES)바이트까지만 압축을 풂 — 넘으면 끝까지 풀지 않고 ProtocolError"""
+    limit = MAX_INFLATED_BYTES if limit is None else limit
+    inflater = zlib.decompressobj()
+    try:
+        data = inflater.decompress(payload, limit)
+    except zlib.error as e:
+        raise ProtocolError("invalid deflate payload") from e
+    if inflater.unconsumed_tail:
+        raise ProtocolError(f"inflated payload exceeds {limit} bytes")
+    if not inflater.eof:
+        raise ProtocolError("truncated deflate payload")
+    return data
+
+
+def encode_room_payload(room: str, message: str) -> bytes:
+    room_bytes = room.encode("utf-8")
+    if len(room_bytes) > MAX_ROOM_BYTES:
+        raise ProtocolError("room name too long")
+    return bytes((len(room_bytes),)) + room_bytes + message.encode("utf-8")
+
+
+def decode_room_payload(payload: bytes) -> Tuple[str, str]:
+    if not payload:
+        raise ProtocolError("empty room payload")
+    room_length = payload[0]
+    if len(payload) < 1 + room_length:
+        raise ProtocolError("truncated room payload")
+    room = payload[1:1 + room_length].decode("utf-8")
+    message = payload[1 + room_length:].decode("utf-8")
+    return room, message
+
+
+def encode_outbound(message: str, encoding: WireEncoding) -> Union[str, bytes]:
+    """직렬화된 메시지를 연결의 송신 형식에 맞게 변환"""
+    if encoding == WireEncoding.TEXT:
+        return message
+    data = message.encode("utf-8")
+    if encoding == WireEncoding.BYTES:
+        return data
+    # 직렬화된 JSON(JsonText)이면 JSON으로 표시해 클라이언트가 바로 파싱할 수 있게 함
+    kind = KIND_JSON if isinstance(message, JsonText) else KIND_TEXT
+    return encode_frame(kind, data, compress=True)
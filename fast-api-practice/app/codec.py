@@ -0,0 +1,79 @@
+import json
+import logging
+import os
+from typing import Any, Union
+
+logger = logging.getLogger(__name__)
+
+# JSON 백엔드 선택: 설치되어 있으면 orjson > msgspec > 표준 json 순으로 사용합니다.
+# JSON_BACKEND 환경변수(orjson | msgspec | json)로 강제할 수 있습니다.
+_requested = os.getenv("JSON_BACKEND", "").lower()
+
+_orjson = None
+_msgspec_encoder = None
+_msgspec_decoder = None
+
+if _requested in ("", "orjson"):
+    try:
+        import orjson as _orjson
+    except ImportError:
+        _orjson = None
+
+if _orjson is None and _requested in ("", "msgspec"):
+    try:
+        import msgspec
+
+        _msgspec_encoder = msgspec.json.Encoder()
+        _msgspec_decoder = msgspec.json.Decoder()
+    except ImportError:
+        _msgspec_encoder = None
+
+if _orjson is not None:
+    BACKEND = "orjson"
+elif _msgspec_encoder is not None:
+    BACKEND = "msgspec"
+else:
+    BACKEND = "json"
+
+if _requested and _requested != BACKEND:
+    logger.warning("JSON_BACKEND=%s is not available, using %s", _requested, BACKEND)
+
+_stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class JsonText(str):
+    """
+    이미 JSON으로 직렬화된 메시지 표시 (채팅 송신 경로에서 일반 문자열과 구분).
+    일반 str은 문자열 메시지로 보고 batch에서는 JSON 문자열로 감싸며, 바이너리 프레임에서는 KIND_TEXT로 보냅니다.
+    """
+    __slots__ = ()
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화"""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(obj)
+    return _stdlib_encoder.encode(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """객체를 JSON 문자열로 직렬화 (send_text 용)"""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode("utf-8")
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(obj).decode("utf-8")
+    return _stdlib_encoder.encode(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if _msgspec_decoder is not None:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # orjson / json과 같이 ValueError로 (잘못된 JSON은 백엔드와 관계없이 ValueError)
+            raise ValueError(str(e)) from e
+    return json.loads(data)
@@ -4,17 +4,17 @@ import os
 # 현재 디렉토리를 모듈 검색 경로에 추가 (필요 시)
 sys.path.append(os.getcwd())
 
-from app.database import engine, Base
-# 모델을 import해야 Base.metadata에 테이블 정보가 등록됩니다.
-from app.models import User 
+from app.database import get_engine
+# 모델을 import해야 Base.metadata에 테이블 정보가 등록됩니다. (app.schema가 app.models를 import)
+from app.schema import ensure_schema
 
 def init_db():
+    engine = get_engine()
     print(f"Database URL: {engine.url}")
     print("Creating database tables based on models...")
     try:
-        # 여기에 정의된 모든 모델을 기반으로 테이블을 생성합니다.
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created successfully!")
+        # 여기에 정의된 모든 모델을 기반으로 테이블을 생성합니다. (schema_version이 최신이면 건너뜀, DB_SCHEMA_INIT=always로 강제)
+        print(f"✅ Database schema {ensure_schema(engine)}")
     except Exception as e:
         print(f"❌ Error creating tables: {e}")
 
@@ -0,0 +1,36 @@
+# DB 제약 조건 위반(IntegrityError)을 사용자에게 보여줄 오류로 바꾸기 위한 도우미.
+#
+# unique 인덱스 위반 메시지는 드라이버마다 다르므로 메시지에 컬럼/인덱스 이름이 들어 있는지로 판단합니다.
+#   MariaDB : (1062, "Duplicate entry 'a@b.com' for key 'ix_users_email'")
+#   SQLite  : UNIQUE constraint failed: users.email
+import re
+from typing import Iterable, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+# users 테이블 unique 컬럼별 오류 메시지 (register / update_user_me / 대량 가입에서 공통 사용)
+DUPLICATE_USER_MESSAGES = {
+    "email": "Email already registered",
+    "username": "Username already taken",
+}
+
+
+def unique_violation(error: IntegrityError, columns: Iterable[str]) -> Optional[str]:
+    """error가 columns 중 어느 컬럼의 unique 위반인지 반환 (알 수 없으면 None)"""
+    message = str(error.orig)
+    match = re.search(r"for key '([^']+)'", message)
+    if match:
+        # MariaDB는 값이 아니라 key 이름만 보고 판단 (값에 컬럼 이름이 들어 있을 수 있음)
+        message = match.group(1)
+    elif "UNIQUE constraint failed:" in message:
+        message = message.split("UNIQUE constraint failed:", 1)[1]
+    for column in columns:
+        if re.search(rf"\b{re.escape(column)}\b", message) or message.endswith(f"_{column}"):
+            return column
+    return None
+
+
+def duplicate_user_message(error: IntegrityError) -> str:
+    return DUPLICATE_USER_MESSAGES.get(
+        unique_violation(error, DUPLICATE_USER_MESSAGES), "Email or username already registered"
+    )
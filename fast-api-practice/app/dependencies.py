@@ -1,16 +1,51 @@
 ﻿from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import os
+from app.database import DB_REPLICA_CHECK_INTERVAL, DB_REPLICA_MAX_LAG, REPLICA_NAMES, get_db
 from app.models import User
 from app.auth import decode_access_token
+from app.request_metrics import timed_dependency
+from app.Classes.RoutingSession import READ_FROM_PRIMARY
+from app.Classes.TTLCache import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# username -> 세션에 묶이지 않은 User 스냅샷
+# 다른 워커에서 변경된 내용은 최대 USER_CACHE_TTL초 뒤에 반영됨
+user_cache: TTLCache[User] = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "1000")),
+    ttl=float(os.getenv("USER_CACHE_TTL", "30")),
+)
 
+# 최근에 바뀐 사용자 — replica가 따라잡을 때까지(최대 lag + 확인 주기) 조회를 primary에서 해서
+# 복제되기 전의 옛 값을 다시 user_cache에 넣지 않도록 함 (replica가 없으면 사용하지 않음)
+recently_written: TTLCache[bool] = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "1000")) if REPLICA_NAMES else 0,
+    ttl=DB_REPLICA_MAX_LAG + DB_REPLICA_CHECK_INTERVAL,
+)
+
+
+def _snapshot(user: User) -> User:
+    """
+    세션과 무관한 User 복사본.
+    요청 세션이 commit되면 원본 인스턴스는 만료(expire)되므로 캐시에는 값만 복사해 둡니다.
+    """
+    return User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+
+
+def invalidate_user(*usernames: str):
+    """사용자 정보가 바뀌거나 삭제되면 호출 — 다음 요청에서 DB를 다시 조회"""
+    for username in usernames:
+        user_cache.pop(username)
+        recently_written.set(username, True)
+
+
+@timed_dependency("get_current_user")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get the current authenticated user"""
     credentials_exception = HTTPException(
@@ -23,13 +58,24 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.username == username).first()
+    cached = user_cache.get(username)
+    if cached is not None:
+        return cached
+
+    statement = select(User).where(User.username == username).limit(1)
+    from_primary = not REPLICA_NAMES or recently_written.get(username) is not None
+    user = await db.scalar(statement.execution_options(**READ_FROM_PRIMARY) if from_primary else statement)
+    if user is None and not from_primary:
+        # 가입 직후라 replica에 아직 없을 수 있음
+        user = await db.scalar(statement.execution_options(**READ_FROM_PRIMARY))
     if user is None:
         raise credentials_exception
 
+    user_cache.set(username, _snapshot(user))
     return user
 
 
+@timed_dependency("get_current_active_user")
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -40,3 +86,16 @@ async def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+
+@timed_dependency("get_current_superuser")
+async def get_current_superuser(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """Get the current user, requiring superuser privileges"""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough privileges"
+        )
+    return current_user
@@ -1,4 +1,6 @@
-import json
+from functools import lru_cache
+
+from app import codec
 
 class BaseResponse:
     result: bool
@@ -14,21 +16,31 @@ class BaseResponse:
 
     @staticmethod
     def error(message: str) -> dict:
-        return BaseResponse(
-            result=False,
-            error=True,
-            message=message,
-            data=None
-        ).to_dict()
+        return {
+            "result": False,
+            "error": True,
+            "message": message,
+            "data": None
+        }
 
     @staticmethod
     def success(message: str, data: object) -> dict:
-        return BaseResponse(
-            result=True,
-            error=False,
-            message=message,
-            data=data
-        ).to_dict()
+        return {
+            "result": True,
+            "error": False,
+            "message": message,
+            "data": data
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def error_json(message: str) -> str:
+        """에러 응답은 메시지별로 한 번만 직렬화해 재사용 ("Invalid token" 등 고정 응답용)"""
+        return codec.JsonText(codec.dumps(BaseResponse.error(message)))
+
+    @staticmethod
+    def success_json(message: str, data: object) -> str:
+        return codec.JsonText(codec.dumps(BaseResponse.success(message, data)))
 
     def to_dict(self) -> dict:
         return {
@@ -39,4 +51,4 @@ class BaseResponse:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return codec.dumps(self.to_dict())
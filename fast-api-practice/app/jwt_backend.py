@@ -0,0 +1,157 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+from app import codec
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidTokenError(ValueError):
+    """서명/형식/만료 검증에 실패한 토큰"""
+
+
+class JWTBackend(ABC):
+    """access token 인코딩/검증 인터페이스 (서명 키와 알고리즘은 생성 시 고정)"""
+
+    name = ""
+
+    def __init__(self, secret_key: str, algorithm: str):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """claims에 서명한 토큰 문자열 반환"""
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        """검증된 claims 반환, 실패 시 InvalidTokenError"""
+
+
+class JoseJWTBackend(JWTBackend):
+    """python-jose 구현 (HS256 외의 알고리즘도 지원)"""
+
+    name = "jose"
+
+    def __init__(self, secret_key: str, algorithm: str):
+        super().__init__(secret_key, algorithm)
+        from jose import jwt, JWTError
+        self._jwt = jwt
+        self._error = JWTError
+        self._algorithms = [algorithm]
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return self._jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(token, self.secret_key, algorithms=self._algorithms)
+        except self._error as e:
+            raise InvalidTokenError(str(e)) from e
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class HS256JWTBackend(JWTBackend):
+    """
+    hmac + base64만 사용하는 최소 HS256 구현.
+    헤더 세그먼트와 키를 넣은 HMAC 객체를 미리 만들어 두고 토큰마다 copy()해서 사용합니다.
+    python-jose와 같은 헤더 바이트를 만들기 때문에 서로 발급한 토큰을 그대로 검증할 수 있습니다.
+    """
+
+    name = "hs256"
+
+    HEADER_SEGMENT = _b64encode(b'{"alg":"HS256","typ":"JWT"}')
+
+    def __init__(self, secret_key: str, algorithm: str = "HS256"):
+        if algorithm != "HS256":
+            raise ValueError(f"HS256JWTBackend does not support {algorithm}")
+        super().__init__(secret_key, algorithm)
+        self._mac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        signing_input = self.HEADER_SEGMENT + b"." + _b64encode(codec.dumps_bytes(claims))
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            raw = token.encode("ascii")
+        except UnicodeEncodeError:
+            raise InvalidTokenError("token is not ascii") from None
+
+        parts = raw.split(b".")
+        if len(parts) != 3:
+            raise InvalidTokenError("malformed token")
+        header, payload, signature = parts
+
+        try:
+            if header != self.HEADER_SEGMENT:
+                # 헤더 바이트가 다르면(키 순서, kid 등) 파싱해서 alg만 확인
+                if codec.loads(_b64decode(header)).get("alg") != "HS256":
+                    raise InvalidTokenError("unexpected algorithm")
+            expected = self._sign(header + b"." + payload)
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                raise InvalidTokenError("signature verification failed")
+            claims = codec.loads(_b64decode(payload))
+        except InvalidTokenError:
+            raise
+        except (binascii.Error, ValueError, AttributeError) as e:
+            raise InvalidTokenError("malformed token") from e
+
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("claims must be an object")
+
+        now = time.time()
+        exp = claims.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)):
+                raise InvalidTokenError("exp must be a number")
+            if exp <= now:
+                raise InvalidTokenError("token has expired")
+        nbf = claims.get("nbf")
+        if nbf is not None:
+            if not isinstance(nbf, (int, float)):
+                raise InvalidTokenError("nbf must be a number")
+            if nbf > now:
+                raise InvalidTokenError("token is not yet valid")
+        return claims
+
+
+BACKENDS = {
+    JoseJWTBackend.name: JoseJWTBackend,
+    HS256JWTBackend.name: HS256JWTBackend,
+}
+
+
+def create_jwt_backend(secret_key: str, algorithm: str) -> JWTBackend:
+    """
+    JWT_BACKEND 환경변수로 구현을 선택합니다.
+      hs256 (기본값) : hmac 기반 최소 구현 (ALGORITHM이 HS256일 때만)
+      jose           : python-jose
+    """
+    kind = os.getenv("JWT_BACKEND", "hs256").lower()
+    if kind not in BACKENDS:
+        logger.warning("unknown JWT_BACKEND=%s, falling back to hs256", kind)
+        kind = "hs256"
+    if kind == "hs256" and algorithm != "HS256":
+        logger.warning("hs256 JWT backend cannot sign %s, using jose", algorithm)
+        kind = "jose"
+    return BACKENDS[kind](secret_key, algorithm)
@@ -0,0 +1,158 @@
+# 로깅 파이프라인 (main.py에서 configure_logging() 한 번 호출).
+#
+# 로거 -> NonBlockingQueueHandler -> (크기 제한 큐) -> QueueListener 스레드 -> StreamHandler(JSON 또는 텍스트)
+#   - 이벤트 루프에서는 %-포맷(record.getMessage)과 큐에 넣기만 하고, JSON 직렬화 · traceback 포맷 · 출력은
+#     리스너 스레드에서 처리합니다. 큐가 가득 차면 기다리지 않고 버린 뒤 개수만 셉니다.
+#   - uvicorn 로거도 같은 큐를 쓰도록 바꿔 access log가 이벤트 루프에서 직접 쓰이지 않게 합니다.
+#   - 채팅 메시지마다 남기는 로그는 LogSampler로 N개 중 1개만 남깁니다.
+import atexit
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app import codec
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# json(기본값) | text
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# 출력 스레드가 밀릴 때 쌓아 둘 최대 레코드 수 (넘으면 버림)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# 로그에 호출 위치(파일:줄)를 남길지 — 끄면 호출마다 stack을 뒤지는 비용(findCaller)이 없어짐
+LOG_CALLER_INFO = os.getenv("LOG_CALLER_INFO", "false").lower() in ("1", "true", "yes", "on")
+# 채팅 메시지별 로그를 남길 비율 (0.01 = 100개 중 1개, 0이면 남기지 않음)
+LOG_CHAT_SAMPLE_RATE = float(os.getenv("LOG_CHAT_SAMPLE_RATE", "0.01"))
+
+# LogRecord 기본 속성 — 나머지(extra=...로 넘긴 값)는 JSON 필드로 그대로 출력 (uvicorn의 ANSI 색 메시지는 제외)
+_RESERVED_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message", "asctime", "color_message",
+}
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 레코드 하나 — {"ts", "level", "logger", "message", ...extra, "exc_info"}"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = value if isinstance(value, _PLAIN_TYPES) else str(value)
+        if LOG_CALLER_INFO:
+            entry["caller"] = f"{record.pathname}:{record.lineno}"
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return codec.dumps(entry)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    기본 QueueHandler.prepare()는 호출한 스레드(= 이벤트 루프)에서 format()까지 실행하므로,
+    여기서는 메시지만 만들어 두고(args가 나중에 바뀌어도 로그 내용이 달라지지 않도록) 나머지는 리스너에 맡깁니다.
+    큐는 잠금 없이 넣을 수 있는 SimpleQueue이고, maxsize를 넘으면(대략적인 상한) 기다리지 않고 버립니다.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, maxsize: int):
+        super().__init__(log_queue)
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.maxsize > 0 and self.queue.qsize() >= self.maxsize:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+class LogSampler:
+    """
+    rate 비율만큼만 True를 반환 (1/rate개마다 한 번, 난수 없이 카운터만 사용).
+    로그 호출 전에 확인하므로 걸러진 메시지는 LogRecord도 만들지 않습니다.
+        if sampler():
+            logger.info("...", extra={"sample_rate": sampler.rate})
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.every = round(1 / rate) if rate > 0 else 0
+        self._count = 0
+
+    def __call__(self) -> bool:
+        if self.every <= 0:
+            return False
+        self._count += 1
+        if self._count >= self.every:
+            self._count = 0
+            return True
+        return False
+
+
+queue_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging():
+    """root 로거를 큐 기반 파이프라인으로 설정 (여러 번 호출해도 한 번만 적용)"""
+    global queue_handler, _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    if LOG_FORMAT == "text":
+        output.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    else:
+        output.setFormatter(JsonFormatter())
+
+    queue_handler = NonBlockingQueueHandler(queue.SimpleQueue(), LOG_QUEUE_SIZE)
+    _listener = QueueListener(queue_handler.queue, output, respect_handler_level=True)
+
+    if not LOG_CALLER_INFO:
+        # logging HOWTO "Optimization" — 호출 위치를 찾지 않음 (pathname / lineno는 기본값으로 남음)
+        logging._srcfile = None
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(LOG_LEVEL)
+
+    # uvicorn은 자체 StreamHandler를 붙이고 전파를 끄므로, 같은 큐로 모이도록 되돌림
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """큐에 남은 레코드를 모두 출력하고 리스너 스레드를 멈춤"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def metrics() -> dict:
+    return {
+        "log_queue_size": queue_handler.queue.qsize() if queue_handler else 0,
+        "log_dropped": queue_handler.dropped if queue_handler else 0,
+    }
@@ -1,9 +1,12 @@
 ﻿import uuid
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Table
 from sqlalchemy.sql import func
 from app.database import Base
 
+# 테이블을 추가/변경하면 올리세요 — 시작 시 DB의 schema_version이 이보다 낮을 때만 create_all을 실행 (app.schema)
+SCHEMA_VERSION = 2
+
 
 class User(Base):
     __tablename__ = "users"
@@ -18,3 +21,24 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # INSERT/UPDATE 시 서버에서 정해지는 값(id, created_at, updated_at)을 RETURNING으로 같은 문장에서 받아 옴
+    # (RETURNING을 지원하지 않는 경우에만 flush 직후 SELECT) — commit 후 db.refresh()가 필요 없음
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# 스키마 버전 표시 — create_all이 끝난 뒤 SCHEMA_VERSION을 한 행 기록
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+# replica lag 확인용 — primary에 현재 시각(epoch 초)을 쓰고 replica에서 읽어 차이를 봄 (app.replicas)
+replica_heartbeat = Table(
+    "replica_heartbeat",
+    Base.metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("ts", Float, nullable=False),
+)
@@ -0,0 +1,32 @@
+# GET /api/users/ keyset(cursor) 페이지네이션용 cursor 토큰.
+#
+# cursor는 마지막으로 받은 행의 id를 담은 불투명 문자열이며, 클라이언트는 내용을 해석하지 않고
+# 응답의 next_cursor를 다음 요청의 cursor로 그대로 넘기기만 하면 됩니다.
+# 형식(버전 포함)을 바꿔도 클라이언트에 영향이 없도록 base64url로 감쌉니다.
+import base64
+import binascii
+
+CURSOR_VERSION = "1"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = f"{CURSOR_VERSION}:{last_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> int:
+    """cursor에서 마지막 id를 꺼냄, 형식이 잘못되면 InvalidCursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        version, last_id = raw.split(":", 1)
+        if version != CURSOR_VERSION:
+            raise InvalidCursor(f"unsupported cursor version {version}")
+        return int(last_id)
+    except InvalidCursor:
+        raise
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursor("malformed cursor") from e
@@ -0,0 +1,54 @@
+# Prometheus text exposition format (0.0.4) 작성기 — GET /metrics 에서 사용.
+# prometheus_client 없이 LatencyHistogram / 정수 카운터를 그대로 내보냅니다.
+from typing import Dict, Iterable, List, Tuple
+
+from app.Classes.LatencyHistogram import LatencyHistogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Dict[str, object]
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+class PrometheusWriter:
+    def __init__(self):
+        self._lines: List[str] = []
+
+    def _header(self, name: str, kind: str, help_text: str):
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def gauge(self, name: str, help_text: str, samples: Iterable[Tuple[Labels, float]]):
+        self._header(name, "gauge", help_text)
+        self._lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+
+    def counter(self, name: str, help_text: str, samples: Iterable[Tuple[Labels, float]]):
+        self._header(name, "counter", help_text)
+        self._lines.extend(f"{name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+
+    def histogram(self, name: str, help_text: str, samples: Iterable[Tuple[Labels, LatencyHistogram]]):
+        """LatencyHistogram(초 단위)를 _bucket / _sum / _count 시리즈로 내보냄"""
+        self._header(name, "histogram", help_text)
+        for labels, histogram in samples:
+            cumulative = histogram.cumulative()
+            for bucket, total in zip(histogram.buckets, cumulative):
+                self._lines.append(f"{name}_bucket{_labels({**labels, 'le': f'{bucket:g}'})} {total}")
+            self._lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {cumulative[-1]}")
+            self._lines.append(f"{name}_sum{_labels(labels)} {histogram.sum:.6f}")
+            self._lines.append(f"{name}_count{_labels(labels)} {cumulative[-1]}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
@@ -0,0 +1,198 @@
+# 인증 엔드포인트 요청 제한 (credential stuffing / 가입 폭주 방지).
+#
+# RateLimitMiddleware는 라우터(= DB 조회, 비밀번호 해시)보다 먼저 실행되어
+#   - POST /api/auth/login, /api/auth/token : 클라이언트 IP별 + username별
+#   - POST /api/auth/register               : 클라이언트 IP별
+# 요청 수를 sliding window counter로 세고, 한도를 넘으면 바로 429 + Retry-After로 응답합니다.
+# sliding window counter: 직전 window 카운트를 지난 비율만큼 줄여 현재 window 카운트에 더한 값을 한도와 비교
+# (고정 window처럼 경계에서 2배가 몰리지 않고, key당 카운터 2개만 저장).
+# 카운터 저장소는 app.Classes.RateLimitStore (RATE_LIMIT_STORE=memory | redis)에서 선택합니다.
+import logging
+import math
+import os
+import time
+from typing import Optional, Tuple
+from urllib.parse import parse_qs
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import codec
+from app.Classes.RateLimitStore import RateLimitStore, RateLimitStoreError, create_rate_limit_store
+
+logger = logging.getLogger(__name__)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes", "on")
+
+
+def parse_rate(value: str) -> Optional[Tuple[int, int]]:
+    """"횟수/초" (예: "10/60") -> (limit, window_ms), "0" 또는 빈 값이면 제한 없음"""
+    if not value or value == "0":
+        return None
+    limit, _, seconds = value.partition("/")
+    return int(limit), int(float(seconds or 1) * 1000)
+
+
+RATE_LIMIT_ENABLED = _env_bool("RATE_LIMIT_ENABLED", True)
+# IP 하나가 1분에 시도할 수 있는 로그인 횟수 (/login + /token 합산)
+RATE_LIMIT_LOGIN_IP = parse_rate(os.getenv("RATE_LIMIT_LOGIN_IP", "30/60"))
+# username 하나에 대해 1분에 시도할 수 있는 로그인 횟수 (IP를 바꿔 가며 시도해도 합산)
+RATE_LIMIT_LOGIN_USERNAME = parse_rate(os.getenv("RATE_LIMIT_LOGIN_USERNAME", "10/60"))
+# IP 하나가 1분에 보낼 수 있는 가입 요청 수
+RATE_LIMIT_REGISTER_IP = parse_rate(os.getenv("RATE_LIMIT_REGISTER_IP", "10/60"))
+# 프록시 뒤에서 실행할 때만 켜세요 — X-Forwarded-For의 첫 번째 주소를 클라이언트 IP로 사용
+RATE_LIMIT_TRUST_FORWARDED = _env_bool("RATE_LIMIT_TRUST_FORWARDED", False)
+
+# username을 읽기 위해 버퍼링할 최대 요청 본문 크기 (이보다 크면 IP 제한만 적용)
+MAX_BODY_BYTES = 16 * 1024
+MAX_USERNAME_KEY_LENGTH = 128
+
+# path -> (IP 카운터 이름, username도 제한할지)
+LIMITED_ROUTES = {
+    "/api/auth/login": ("login", True),
+    "/api/auth/token": ("login", True),
+    "/api/auth/register": ("register", False),
+}
+
+
+class RateLimiter:
+    """RateLimitStore 위에서 sliding window counter로 한도를 판정"""
+
+    def __init__(self, store: RateLimitStore):
+        self.store = store
+        self.allowed = 0
+        self.rejected = 0
+        self.store_failures = 0
+
+    async def hit(self, key: str, rate: Tuple[int, int]) -> Optional[float]:
+        """key에 요청 1회를 기록하고, 한도를 넘었으면 다시 시도할 수 있을 때까지의 초를 반환"""
+        limit, window_ms = rate
+        now_ms = int(time.time() * 1000)
+        try:
+            previous, current = await self.store.hit(key, window_ms, now_ms)
+        except RateLimitStoreError as e:
+            # 저장소 장애로 로그인 자체를 막지는 않음 (해시 풀의 admission control이 마지막 방어선)
+            self.store_failures += 1
+            logger.warning("rate limit store unavailable, allowing request: %s", e)
+            return None
+
+        elapsed = (now_ms % window_ms) / window_ms
+        if previous * (1 - elapsed) + current <= limit:
+            return None
+        # 현재 window가 끝날 때까지 (그 뒤로는 직전 window 카운트가 줄어들기 시작)
+        return (window_ms - now_ms % window_ms) / 1000
+
+    async def check(self, ip: str, route: str, username: Optional[str]) -> Optional[float]:
+        """IP 제한을 먼저 확인하고, 통과했을 때만 username 카운터를 올림 (차단된 IP가 남의 계정을 잠그지 못하도록)"""
+        ip_rate = RATE_LIMIT_LOGIN_IP if route == "login" else RATE_LIMIT_REGISTER_IP
+        retry_after = await self.hit(f"ip:{route}:{ip}", ip_rate) if ip_rate else None
+        if retry_after is None and username and RATE_LIMIT_LOGIN_USERNAME:
+            retry_after = await self.hit(f"user:{username}", RATE_LIMIT_LOGIN_USERNAME)
+
+        if retry_after is None:
+            self.allowed += 1
+        else:
+            self.rejected += 1
+        return retry_after
+
+    async def close(self):
+        await self.store.close()
+
+    def metrics(self) -> dict:
+        return {
+            **self.store.metrics(),
+            "rate_limit_allowed": self.allowed,
+            "rate_limit_rejected": self.rejected,
+            "rate_limit_store_failures": self.store_failures,
+        }
+
+
+rate_limiter = RateLimiter(create_rate_limit_store())
+
+
+def _client_ip(scope: Scope) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _username(body: bytes, content_type: bytes) -> Optional[str]:
+    """JSON(LoginRequest) 또는 form(OAuth2PasswordRequestForm) 본문에서 username만 꺼냄 — 검증은 라우터가 함"""
+    try:
+        if content_type.startswith(b"application/x-www-form-urlencoded"):
+            values = parse_qs(body.decode("utf-8"), max_num_fields=20).get("username")
+            username = values[0] if values else None
+        else:
+            data = codec.loads(body)
+            username = data.get("username") if isinstance(data, dict) else None
+    except ValueError:
+        return None
+    if not isinstance(username, str) or not username:
+        return None
+    return username[:MAX_USERNAME_KEY_LENGTH]
+
+
+async def _read_body(receive: Receive) -> Tuple[list, bytes]:
+    """본문 메시지를 모두 읽어 둠 (라우터에 다시 전달하기 위해 메시지 목록도 반환)"""
+    messages: list = []
+    size = 0
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break
+        size += len(message.get("body", b""))
+        if not message.get("more_body", False) or size > MAX_BODY_BYTES:
+            break
+    if size > MAX_BODY_BYTES:
+        return messages, b""
+    return messages, b"".join(message.get("body", b"") for message in messages)
+
+
+def _replay(messages: list, receive: Receive) -> Receive:
+    async def replay() -> Message:
+        if messages:
+            return messages.pop(0)
+        return await receive()
+
+    return replay
+
+
+class RateLimitMiddleware:
+    """
+    LIMITED_ROUTES의 POST 요청을 라우터보다 먼저 제한하는 ASGI 미들웨어.
+    username 제한을 위해 본문을 읽은 경우 읽은 메시지를 그대로 다시 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in LIMITED_ROUTES:
+            await self.app(scope, receive, send)
+            return
+
+        route, per_username = LIMITED_ROUTES[scope["path"]]
+        username = None
+        if per_username:
+            messages, body = await _read_body(receive)
+            content_type = dict(scope["headers"]).get(b"content-type", b"")
+            username = _username(body, content_type)
+            receive = _replay(messages, receive)
+
+        retry_after = await self.limiter.check(_client_ip(scope), route, username)
+        if retry_after is not None:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests, please retry later"},
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,135 @@
+# 읽기 replica 상태 확인 (main.py lifespan에서 시작 / 종료).
+#
+# DB_REPLICA_CHECK_INTERVAL초마다 (async 모드는 async 엔진으로, sync 모드는 db_executor 스레드에서 sync 엔진으로)
+#   1. primary의 replica_heartbeat 행에 현재 시각을 씀
+#   2. 각 replica에서 그 행을 읽어 lag(= 지금 - 읽은 시각)와 확인 쿼리 왕복 시간을 replica_router.observe()로 넘김
+# 복제가 멈추거나 느려진 replica는 lag가 DB_REPLICA_MAX_LAG를 넘으면 읽기 대상에서 빠지고, 따라잡으면 다시 쓰입니다.
+# (MariaDB의 Seconds_Behind_Master 대신 heartbeat를 쓰므로 DB 종류나 복제 방식과 관계없이 같은 방법으로 잽니다.)
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.engine import Connection, Engine
+
+from app.database import (
+    DB_MODE,
+    DB_REPLICA_CHECK_INTERVAL,
+    REPLICA_NAMES,
+    get_async_engine,
+    get_async_replica_engines,
+    get_engine,
+    get_replica_engines,
+    replica_router,
+    run_in_db_executor,
+)
+from app.models import replica_heartbeat
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_ID = 1
+
+_task: Optional[asyncio.Task] = None
+
+
+def _write_heartbeat(conn: Connection, now: float):
+    result = conn.execute(
+        update(replica_heartbeat).where(replica_heartbeat.c.id == HEARTBEAT_ID).values(ts=now)
+    )
+    if result.rowcount == 0:
+        conn.execute(insert(replica_heartbeat).values(id=HEARTBEAT_ID, ts=now))
+
+
+def _read_heartbeat(conn: Connection) -> Optional[float]:
+    return conn.scalar(select(replica_heartbeat.c.ts).where(replica_heartbeat.c.id == HEARTBEAT_ID))
+
+
+def write_heartbeat(engine: Engine, now: float):
+    with engine.begin() as conn:
+        _write_heartbeat(conn, now)
+
+
+def read_heartbeat(engine: Engine) -> Optional[float]:
+    with engine.connect() as conn:
+        return _read_heartbeat(conn)
+
+
+def check_replicas():
+    """heartbeat를 쓰고 모든 replica의 lag / 응답 시간을 갱신 (sync 모드 — db_executor에서 실행)"""
+    try:
+        write_heartbeat(get_engine(), time.time())
+    except Exception as e:
+        # primary에 쓰지 못하면 replica의 lag가 계속 커지므로 결국 모든 읽기가 primary로 감
+        logger.warning("Could not write replica heartbeat: %s", e)
+
+    for name, engine in get_replica_engines().items():
+        started = time.perf_counter()
+        try:
+            written = read_heartbeat(engine)
+        except Exception as e:
+            logger.warning("Replica %s check failed: %s", name, e)
+            replica_router.observe(name, None, None)
+            continue
+        latency = time.perf_counter() - started
+        lag = None if written is None else max(0.0, time.time() - written)
+        replica_router.observe(name, latency, lag)
+
+
+async def check_replicas_async():
+    """check_replicas의 async 모드 버전 — async 엔진을 쓰므로 sync 엔진 / 풀을 만들지 않음"""
+    try:
+        async with get_async_engine().begin() as conn:
+            await conn.run_sync(_write_heartbeat, time.time())
+    except Exception as e:
+        logger.warning("Could not write replica heartbeat: %s", e)
+
+    for name, engine in get_async_replica_engines().items():
+        started = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                written = await conn.run_sync(_read_heartbeat)
+        except Exception as e:
+            logger.warning("Replica %s check failed: %s", name, e)
+            replica_router.observe(name, None, None)
+            continue
+        latency = time.perf_counter() - started
+        lag = None if written is None else max(0.0, time.time() - written)
+        replica_router.observe(name, latency, lag)
+
+
+async def _check():
+    if DB_MODE == "async":
+        await check_replicas_async()
+    else:
+        await run_in_db_executor(check_replicas)
+
+
+async def _check_loop():
+    while True:
+        await asyncio.sleep(DB_REPLICA_CHECK_INTERVAL)
+        try:
+            await _check()
+        except Exception:
+            logger.exception("Replica check failed")
+
+
+async def start_replica_monitor():
+    """replica가 설정되어 있으면 한 번 확인한 뒤(첫 요청부터 replica를 쓰도록) 주기적인 확인을 시작"""
+    global _task
+    if not REPLICA_NAMES or _task is not None:
+        return
+    await _check()
+    _task = asyncio.create_task(_check_loop())
+
+
+async def stop_replica_monitor():
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
@@ -0,0 +1,69 @@
+# 요청 지연 계측 (GET /metrics).
+#
+# RequestMetricsMiddleware는 가장 바깥 미들웨어로 모든 HTTP 요청의 시작/끝을 기록하고,
+# 라우트 템플릿(/api/users/{user_id} 등)별로
+#   - 전체 지연, 진행 중인 요청 수, status code별 응답 수
+#   - 의존성(get_db, get_current_user ...) 시간 vs 나머지(handler: 본문 검증, 엔드포인트, 직렬화, 미들웨어) 시간
+# 을 모읍니다. pbkdf2 / JWT 검증 등은 request_monitor.measure()로, DB 쿼리는 PoolMonitor가 따로 잽니다.
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.Classes.RequestMonitor import RequestMonitor
+
+request_monitor = RequestMonitor()
+timed_dependency = request_monitor.timed_dependency
+measure = request_monitor.measure
+
+# 어느 라우트에도 맞지 않는 요청(404)은 경로 대신 이 이름으로 묶음 (임의 경로로 시리즈가 늘어나지 않도록)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _route_path(routes: list, scope: Scope) -> str:
+    """
+    Starlette 라우터와 같은 순서로 라우트 템플릿을 찾음 (첫 번째 매치, method만 다르면 405가 될 첫 라우트).
+    route.matches()는 매번 child scope를 만들어 느리므로 경로 정규식과 methods만 비교합니다 (HTTP 라우트만 대상).
+    """
+    path = scope["path"]
+    method = scope["method"]
+    partial = None
+    for route in routes:
+        methods = getattr(route, "methods", None)
+        if methods is None or not route.path_regex.match(path):
+            continue
+        if method in methods:
+            return route.path
+        if partial is None:
+            partial = route.path
+    return partial or UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    HTTP 요청마다 라우트를 먼저 찾아 진행 중인 요청 수를 올리고, 응답 시작(http.response.start)의 status와
+    요청 전체 시간을 기록합니다. 라우트를 미리 찾으므로 요청 제한(429) 등 라우터 앞에서 끝난 요청도 해당 라우트로 집계됩니다.
+    routes에는 app.router.routes를 그대로 넘기세요 (이후 include_router로 추가되는 라우트도 반영됨).
+    """
+
+    def __init__(self, app: ASGIApp, monitor: RequestMonitor, routes: list):
+        self.app = app
+        self.monitor = monitor
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = self.monitor.route(scope["method"], _route_path(self.routes, scope))
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        state = self.monitor.begin(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.monitor.end(stats, state, status)
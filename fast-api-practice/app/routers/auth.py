@@ -1,15 +1,19 @@
 ﻿from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 import logging
 
-from app.database import get_db
+from app.database import get_db, use_primary
+from app.db_errors import duplicate_user_message
 from app.models import User
 from app.schemas import Token, UserCreate, UserResponse, LoginRequest
+from app.Classes.PasswordHasherPool import PasswordHasherBusy
 from app.auth import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     get_swagger_ui_params,  # 추가: 메인에서 사용 가능
@@ -21,26 +25,15 @@ logger = logging.getLogger(__name__)
 
 """Register a new user"""
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
 
-    logger.info("user register params : %s", user)
-
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-
-    db_user = db.query(User).filter(User.username == user.username).first()
-    if db_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken"
-        )
+    # 비밀번호가 포함된 요청 전체가 아니라 식별 정보만 남김
+    logger.info("user register", extra={"username": user.username})
 
     try:
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await get_password_hash_async(user.password)
+    except PasswordHasherBusy:
+        raise
     except Exception as e:
         logger.exception("password hashing failed")
         raise HTTPException(
@@ -54,8 +47,15 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
         hashed_password=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    # 중복 확인은 email / username unique 인덱스에 맡김 — 미리 SELECT하지 않으므로 동시 가입에도 안전
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=duplicate_user_message(e)
+        )
 
     return db_user
 
@@ -63,10 +63,11 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
 
 """Login and get access token"""
 @router.post("/login", response_model=Token)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.username == login_data.username).first()
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
+    # 가입 직후의 로그인이 아직 복제되지 않은 replica를 읽지 않도록
+    user = await use_primary(db).scalar(select(User).where(User.username == login_data.username).limit(1))
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user or not await verify_password_async(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -91,12 +92,12 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """OAuth2 compatible token login (for Swagger UI)"""
-    user = db.query(User).filter(User.username == form_data.username).first()
+    user = await use_primary(db).scalar(select(User).where(User.username == form_data.username).limit(1))
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
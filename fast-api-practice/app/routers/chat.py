@@ -1,37 +1,144 @@
-import json
-
 from fastapi import FastAPI, WebSocket, APIRouter
 from starlette.websockets import WebSocketDisconnect
 
 import logging
 
-from app import dtos
+from app import binary_protocol, codec, dtos
+from app.logging_setup import LOG_CHAT_SAMPLE_RATE, LogSampler
 
 from app.Classes.ConnectionManager import ConnectionManager
+from app.Classes.OutboundQueue import BatchPolicy
 
 router = APIRouter(prefix="/ws/chat", tags=["Chat"])
 
 manager = ConnectionManager()
 
 logger = logging.getLogger(__name__)
+# 메시지마다 남기는 로그는 일부만 (LOG_CHAT_SAMPLE_RATE)
+message_log_sampler = LogSampler(LOG_CHAT_SAMPLE_RATE)
 
 @router.websocket(path='', name='Chat')
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            text = await websocket.receive_text()
-            data = json.loads(text)
-
-            type: str = data.get("type")
+            # 텍스트 프레임(JSON)과 바이너리 프레임(binary_protocol)을 모두 받음
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
 
-            logger.info(f"Received message of type {type}")
+            if message.get("bytes") is not None:
+                await handle_binary_frame(websocket, message["bytes"])
+                continue
 
-            if type == "ws_headers":
-                logger.info(f"Received headers: {data}")
-                await manager.logIn(websocket, data.get('headers').get('access_token'))
-            else:
-                await manager.send_personal_message(text,websocket)
+            text = message.get("text") or ""
+            try:
+                data = parse_message(text)
+            except ValueError:
+                logger.warning("invalid text frame")
+                await manager.send_personal_message(
+                    dtos.BaseResponse.error_json("Invalid message"),
+                    websocket
+                )
+                continue
+            await handle_message(websocket, data, codec.JsonText(text))
     except WebSocketDisconnect:
+        pass
+    finally:
+        # 예상하지 못한 예외로 끝나도 registry / 송신 큐 / writer / heartbeat 항목은 정리
         manager.disconnect(websocket)
-        await manager.broadcast(f"{websocket.client.host} left the chat")
\ No newline at end of file
+    await manager.broadcast(f"{websocket.client.host} left the chat")
+
+
+def parse_message(payload) -> dict:
+    """JSON 메시지 파싱 — 잘못된 JSON이거나 객체가 아니면 ValueError"""
+    data = codec.loads(payload)
+    if not isinstance(data, dict):
+        raise binary_protocol.ProtocolError("message must be a JSON object")
+    return data
+
+
+async def handle_message(websocket: WebSocket, data: dict, text: codec.JsonText):
+    type: str = data.get("type")
+
+    if logger.isEnabledFor(logging.INFO) and message_log_sampler():
+        logger.info("Received message of type %s", type, extra={"sample_rate": message_log_sampler.rate})
+
+    # heartbeat 응답(pong)은 연결이 살아 있다는 의미일 뿐 활동으로 보지 않음
+    manager.touch(websocket, activity=type != "pong")
+    if type == "pong":
+        return
+
+    if type == "ws_headers":
+        # access_token이 들어 있으므로 값은 남기지 않음
+        logger.debug("Received headers: %s", sorted(data))
+        manager.negotiate(websocket, data)
+        if "batch" in data:
+            manager.set_batching(websocket, BatchPolicy.parse(data.get("batch")))
+        if data.get("heartbeat") is True:
+            manager.enable_heartbeat(websocket)
+        # 송신 형식 협상만 하는 경우 headers가 없을 수 있음
+        headers = data.get("headers")
+        if isinstance(headers, dict):
+            await manager.logIn(websocket, headers.get('access_token'))
+        elif headers is not None:
+            await manager.send_personal_message(dtos.BaseResponse.error_json("Invalid message"), websocket)
+    elif type in ("subscribe", "unsubscribe", "room_message"):
+        room = data.get("room")
+        if not valid_room(room):
+            await manager.send_personal_message(dtos.BaseResponse.error_json("Invalid room"), websocket)
+        elif type == "subscribe":
+            await manager.subscribe(websocket, room)
+        elif type == "unsubscribe":
+            await manager.unsubscribe(websocket, room)
+        else:
+            await publish_to_room(websocket, room, text)
+    else:
+        await manager.send_personal_message(text,websocket)
+
+
+def valid_room(room) -> bool:
+    """room 이름은 비어 있지 않은 문자열이고, 바이너리 프레임(KIND_ROOM)에 담을 수 있는 길이여야 함"""
+    return isinstance(room, str) and 0 < len(room.encode("utf-8")) <= binary_protocol.MAX_ROOM_BYTES
+
+
+async def handle_binary_frame(websocket: WebSocket, frame: bytes):
+    try:
+        kind, payload = binary_protocol.decode_frame(frame)
+        if kind == binary_protocol.KIND_ROOM:
+            manager.touch(websocket)
+            # JSON 파싱 없이 헤더의 room으로 바로 라우팅
+            room, body = binary_protocol.decode_room_payload(payload)
+            if not valid_room(room):
+                raise binary_protocol.ProtocolError("empty room name")
+            await publish_to_room(
+                websocket,
+                room,
+                codec.JsonText(codec.dumps({"type": "room_message", "room": room, "message": body}))
+            )
+        elif kind == binary_protocol.KIND_JSON:
+            text = payload.decode("utf-8")
+            await handle_message(websocket, parse_message(payload), codec.JsonText(text))
+        elif kind == binary_protocol.KIND_TEXT:
+            manager.touch(websocket)
+            await manager.send_personal_message(payload.decode("utf-8"), websocket)
+        else:
+            raise binary_protocol.ProtocolError(f"unknown frame kind {kind}")
+    except ValueError:
+        # ProtocolError, UnicodeDecodeError, 잘못된 JSON 모두 ValueError
+        logger.warning("invalid binary frame", exc_info=True)
+        await manager.send_personal_message(
+            dtos.BaseResponse.error_json("Invalid binary frame"),
+            websocket
+        )
+
+
+async def publish_to_room(websocket: WebSocket, room: str, text: str):
+    # room 멤버만 해당 room에 메시지를 보낼 수 있음
+    if manager.connections.is_member(websocket, room):
+        await manager.publish(room, text)
+    else:
+        await manager.send_personal_message(
+            dtos.BaseResponse.error_json("Not subscribed to room"),
+            websocket
+        )
@@ -0,0 +1,107 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app import logging_setup, prometheus, startup_timing
+from app.auth import password_pool, token_cache
+from app.database import db_monitor, replica_router
+from app.dependencies import user_cache
+from app.rate_limit import rate_limiter
+from app.request_metrics import request_monitor
+from app.routers.chat import manager
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """요청 / 의존성 / pbkdf2·JWT / DB 쿼리 지연 히스토그램 (Prometheus text format)"""
+    writer = prometheus.PrometheusWriter()
+    routes = list(request_monitor.routes.items())
+
+    writer.gauge("http_requests_in_flight", "HTTP requests currently being handled", [
+        ({"method": method, "route": route}, stats.in_flight) for (method, route), stats in routes
+    ])
+    writer.counter("http_requests_total", "HTTP responses by route and status code", [
+        ({"method": method, "route": route, "status": status}, count)
+        for (method, route), stats in routes
+        for status, count in sorted(stats.responses.items())
+    ])
+    writer.histogram("http_request_duration_seconds", "HTTP request latency", [
+        ({"method": method, "route": route}, stats.duration) for (method, route), stats in routes
+    ])
+    writer.histogram(
+        "http_request_phase_seconds",
+        "Time per request spent in timed dependencies vs everything else (handler)",
+        [
+            ({"method": method, "route": route, "phase": phase}, histogram)
+            for (method, route), stats in routes
+            for phase, histogram in (("dependencies", stats.dependencies), ("handler", stats.handler))
+        ],
+    )
+    writer.histogram("app_component_duration_seconds", "Latency of dependencies, pbkdf2 and JWT decode", [
+        ({"component": name}, histogram) for name, histogram in sorted(request_monitor.components.items())
+    ])
+
+    pool_wait, queries = db_monitor.histograms()
+    writer.histogram("db_query_duration_seconds", "SQL statement latency by statement type", [
+        ({"statement": kind}, histogram) for kind, histogram in sorted(queries.items())
+    ])
+    writer.histogram("db_pool_wait_seconds", "Time spent waiting for a pooled connection", [
+        ({"engine": name}, histogram) for name, histogram in sorted(pool_wait.items())
+    ])
+    writer.counter("db_pool_timeouts_total", "Connection checkouts that timed out", [({}, db_monitor.pool_timeouts)])
+    writer.counter("db_query_errors_total", "SQL statements that raised", [({}, db_monitor.query_errors)])
+
+    replicas = replica_router.metrics()
+    writer.gauge("db_replica_healthy", "1 if the read replica is used for reads (reachable and within max lag)", [
+        ({"replica": name}, int(state["healthy"])) for name, state in replicas["replicas"].items()
+    ])
+    writer.gauge("db_replica_lag_seconds", "Replication lag measured with the heartbeat row", [
+        ({"replica": name}, float(state["lag"])) for name, state in replicas["replicas"].items()
+        if state["lag"] is not None
+    ])
+    writer.counter("db_replica_sessions_total", "Sessions that read from each replica", [
+        ({"replica": name}, state["reads"]) for name, state in replicas["replicas"].items()
+    ])
+    writer.counter("db_replica_primary_fallbacks_total", "Sessions that read from the primary because no replica was usable", [
+        ({}, replicas["primary_fallbacks"])
+    ])
+
+    hasher = password_pool.metrics()
+    writer.gauge("password_hash_in_flight", "Password hash/verify jobs running", [({}, hasher["in_flight"])])
+    writer.gauge("password_hash_queued", "Password hash/verify jobs waiting for a worker", [({}, hasher["queued"])])
+    writer.counter("password_hash_rejected_total", "Password jobs rejected with 503", [({}, hasher["rejected"])])
+    writer.counter("rate_limit_rejected_total", "Auth requests rejected with 429", [({}, rate_limiter.rejected)])
+
+    logs = logging_setup.metrics()
+    writer.gauge("log_queue_size", "Log records waiting for the output thread", [({}, logs["log_queue_size"])])
+    writer.counter("log_dropped_total", "Log records dropped because the queue was full", [({}, logs["log_dropped"])])
+
+    writer.gauge("app_startup_phase_seconds", "Time spent importing the app and running lifespan startup", [
+        ({"phase": phase}, seconds) for phase, seconds in startup_timing.phases.items()
+    ])
+
+    return PlainTextResponse(writer.render(), media_type=prometheus.CONTENT_TYPE)
+
+
+@router.get("/chat")
+async def chat_metrics():
+    """WebSocket 송신 큐 깊이 및 드롭 통계"""
+    return manager.metrics()
+
+
+@router.get("/auth")
+async def auth_metrics():
+    """비밀번호 해시 풀 현황, 토큰/사용자 캐시 적중률과 로그인 요청 제한 통계"""
+    return {
+        **password_pool.metrics(),
+        **token_cache.metrics("token_cache"),
+        **user_cache.metrics("user_cache"),
+        **rate_limiter.metrics(),
+    }
+
+
+@router.get("/db")
+async def db_metrics():
+    """커넥션 풀 사용량, 풀 대기 시간, 쿼리 종류별 지연 히스토그램과 읽기 replica 상태"""
+    return {**db_monitor.metrics(), "replicas": replica_router.metrics()}
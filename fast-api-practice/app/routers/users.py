@@ -1,10 +1,26 @@
-﻿from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+﻿from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
+from app.database import get_db, use_primary
+from app.db_errors import duplicate_user_message
 from app.models import User
-from app.schemas import UserResponse, UserUpdate
-from app.dependencies import get_current_active_user
+from app.schemas import UserImportReport, UserImportRequest, UserPage, UserResponse, UserUpdate
+from app.pagination import InvalidCursor, decode_cursor, encode_cursor
+from app.user_export import MEDIA_TYPES, iter_export
+from app.user_import import IMPORT_BATCH_SIZE, import_users
+from app.user_serialization import (
+    ID_INDEX,
+    USER_RESPONSE_COLUMNS,
+    json_response,
+    user_json,
+    user_page_json,
+    user_row,
+    users_json,
+)
+from app.dependencies import get_current_active_user, get_current_superuser, invalidate_user
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
@@ -12,83 +28,167 @@ router = APIRouter(prefix="/api/users", tags=["Users"])
 @router.get("/me", response_model=UserResponse)
 async def read_users_me(current_user: User = Depends(get_current_active_user)):
     """Get current user information"""
-    return current_user
+    return json_response(user_json(user_row(current_user)))
 
 
-@router.get("/", response_model=List[UserResponse])
+MAX_PAGE_SIZE = 1000
+
+
+@router.get("/", response_model=Union[List[UserResponse], UserPage])
 async def read_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get list of users (requires authentication)
+
+    - offset 모드 (기본값): `?skip=&limit=` — 사용자 목록(list)을 반환
+    - cursor 모드: `?cursor=` (첫 페이지는 빈 값) — `{items, next_cursor}` 를 반환하며,
+      id 인덱스에서 바로 시작하므로 페이지가 깊어져도 지연이 일정함
+
+    응답은 UserResponse 컬럼만 읽어 바로 JSON으로 만듦 (app.user_serialization)
+    """
+    if cursor is None:
+        rows = (await db.execute(select(*USER_RESPONSE_COLUMNS).offset(skip).limit(limit))).all()
+        return json_response(users_json(rows))
+
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"limit must be between 1 and {MAX_PAGE_SIZE}"
+        )
+
+    statement = select(*USER_RESPONSE_COLUMNS).order_by(User.id).limit(limit + 1)
+    if cursor:
+        try:
+            statement = statement.where(User.id > decode_cursor(cursor))
+        except InvalidCursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+
+    # limit + 1개를 읽어 다음 페이지가 있는지 확인
+    rows = (await db.execute(statement)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][ID_INDEX])
+    return json_response(user_page_json(rows, next_cursor))
+
+
+@router.get("/export")
+async def export_users(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """Get list of users (requires authentication)"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    """Stream all users as NDJSON or CSV (requires authentication)"""
+    # 인증에 쓴 요청 세션(get_db는 요청당 한 번만 만들어짐)으로 그대로 스트리밍
+    return StreamingResponse(
+        iter_export(db, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="users.{format}"'},
+    )
+
+
+@router.post("/import", response_model=UserImportReport)
+async def import_users_bulk(
+    request: UserImportRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superuser)
+):
+    """
+    Register many users at once (requires superuser)
+
+    batch_size명씩 중복 확인 쿼리 1번, 병렬 해시, INSERT 1번으로 저장하며
+    실패한 행은 입력 순서(index)와 이유를 errors로 돌려줍니다. 성공한 batch는 그대로 저장됩니다.
+    """
+    # 중복 확인 쿼리도 primary에서 (앞 batch에서 방금 넣은 사용자가 replica에 아직 없을 수 있음)
+    report = await import_users(use_primary(db), request.users, request.batch_size or IMPORT_BATCH_SIZE)
+    return report.to_dict()
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def read_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Get specific user by ID"""
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    row = (await db.execute(select(*USER_RESPONSE_COLUMNS).where(User.id == user_id))).first()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return user
+    return json_response(user_json(row))
 
 
 @router.put("/me", response_model=UserResponse)
 async def update_user_me(
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Update current user information"""
+    changes = {}
     if user_update.email:
-        existing_user = db.query(User).filter(
-            User.email == user_update.email,
-            User.id != current_user.id
-        ).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        current_user.email = user_update.email
-
+        changes["email"] = user_update.email
     if user_update.username:
-        existing_user = db.query(User).filter(
-            User.username == user_update.username,
-            User.id != current_user.id
-        ).first()
-        if existing_user:
+        changes["username"] = user_update.username
+    if user_update.password:
+        from app.auth import get_password_hash_async
+        changes["hashed_password"] = await get_password_hash_async(user_update.password)
+
+    old_username = current_user.username
+    select_response = select(*USER_RESPONSE_COLUMNS).where(User.id == current_user.id)
+    if not changes:
+        # current_user는 캐시된 스냅샷일 수 있으므로 응답은 DB에서 읽음
+        row = (await db.execute(select_response)).first()
+    else:
+        # 중복 확인은 unique 인덱스에 맡기고 UPDATE 한 번으로 처리.
+        # RETURNING을 지원하면(SQLite, PostgreSQL) 갱신된 행을 같은 문장에서 받고,
+        # 지원하지 않으면(MariaDB) 갱신 후 SELECT 한 번
+        statement = update(User).where(User.id == current_user.id).values(**changes)
+        returning = db.get_bind().dialect.update_returning
+        if returning:
+            statement = statement.returning(*USER_RESPONSE_COLUMNS)
+        try:
+            result = await db.execute(statement)
+            row = result.first() if returning else None
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
+                detail=duplicate_user_message(e)
             )
-        current_user.username = user_update.username
-
-    if user_update.password:
-        from app.auth import get_password_hash
-        current_user.hashed_password = get_password_hash(user_update.password)
+        if not returning:
+            row = (await db.execute(select_response)).first()
+        invalidate_user(old_username, row.username if row is not None else old_username)
 
-    db.commit()
-    db.refresh(current_user)
-    return current_user
+    if row is None:
+        invalidate_user(old_username)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return json_response(user_json(row))
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user_me(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Delete current user account"""
-    db.delete(current_user)
-    db.commit()
+    user = await use_primary(db).get(User, current_user.id)
+    if user is not None:
+        await db.delete(user)
+        await db.commit()
+    invalidate_user(current_user.username)
     return None
@@ -0,0 +1,77 @@
+# 시작 시 스키마 확인 (main.py lifespan, import_users.py, app/database_initialization.py).
+#
+# Base.metadata.create_all은 테이블마다 존재 여부를 조회하므로(원격 DB면 왕복 여러 번) 매 시작마다 실행하지 않고,
+# schema_version 테이블의 버전이 models.SCHEMA_VERSION 이상이면 SELECT 한 번으로 끝냅니다.
+# create_all은 없는 테이블만 만들 뿐 기존 테이블을 바꾸지 않으므로, 컬럼 변경은 여전히 직접 마이그레이션해야 합니다.
+import os
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.database import DB_MODE, Base, get_async_engine, get_engine, run_in_db_executor
+from app.models import SCHEMA_VERSION, schema_version
+
+# auto(기본값) — 버전이 낮거나 없을 때만 create_all
+# always       — 매번 create_all (이전 동작)
+# off          — 확인하지 않음 (스키마를 별도 마이그레이션으로 관리하는 경우)
+DB_SCHEMA_INIT = os.getenv("DB_SCHEMA_INIT", "auto").lower()
+
+
+def _schema_version(conn: Connection) -> Optional[int]:
+    try:
+        return conn.scalar(select(func.max(schema_version.c.version)))
+    except (OperationalError, ProgrammingError):
+        return None
+
+
+def _create_schema(conn: Connection):
+    Base.metadata.create_all(bind=conn)
+    conn.execute(delete(schema_version))
+    conn.execute(insert(schema_version).values(version=SCHEMA_VERSION))
+
+
+def current_schema_version(engine: Engine) -> Optional[int]:
+    """DB에 기록된 스키마 버전 (schema_version 테이블이 없으면 None)"""
+    with engine.connect() as conn:
+        return _schema_version(conn)
+
+
+def ensure_schema(engine: Engine) -> str:
+    """
+    필요할 때만 테이블을 만들고 결과를 반환 — "created" | "up to date" | "skipped".
+    동기 함수이므로 이벤트 루프에서는 ensure_app_schema()를 쓰세요.
+    """
+    if DB_SCHEMA_INIT == "off":
+        return "skipped"
+    if DB_SCHEMA_INIT != "always":
+        version = current_schema_version(engine)
+        if version is not None and version >= SCHEMA_VERSION:
+            return "up to date"
+
+    with engine.begin() as conn:
+        _create_schema(conn)
+    return "created"
+
+
+async def ensure_app_schema() -> str:
+    """
+    앱 시작용 ensure_schema — DB_MODE의 엔진을 사용합니다.
+    async 모드에서는 async 엔진의 run_sync로 실행해 sync 엔진(과 그 커넥션 풀)을 따로 만들지 않습니다.
+    """
+    if DB_MODE != "async":
+        return await run_in_db_executor(ensure_schema, get_engine())
+    if DB_SCHEMA_INIT == "off":
+        return "skipped"
+
+    engine = get_async_engine()
+    if DB_SCHEMA_INIT != "always":
+        async with engine.connect() as conn:
+            version = await conn.run_sync(_schema_version)
+        if version is not None and version >= SCHEMA_VERSION:
+            return "up to date"
+
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_schema)
+    return "created"
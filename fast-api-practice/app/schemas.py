@@ -1,5 +1,5 @@
-﻿from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional
+﻿from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -29,6 +29,30 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserPage(BaseModel):
+    items: List[UserResponse]
+    # 다음 페이지가 없으면 None
+    next_cursor: Optional[str] = None
+
+
+class UserImportRequest(BaseModel):
+    # 행마다 따로 검증해서 오류를 보고하므로 여기서는 dict 그대로 받음 (UserCreate 형식)
+    users: List[Dict[str, Any]]
+    batch_size: Optional[int] = Field(default=None, ge=1, le=10_000)
+
+
+class UserImportError(BaseModel):
+    index: int
+    detail: str
+
+
+class UserImportReport(BaseModel):
+    total: int
+    inserted: int
+    failed: int
+    errors: List[UserImportError]
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
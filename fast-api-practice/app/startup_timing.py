@@ -0,0 +1,23 @@
+# 프로세스 시작 비용 측정 (시작 로그와 GET /metrics의 app_startup_phase_seconds).
+# main.py가 가장 먼저 import하므로 이 모듈이 로드된 시점부터 잽니다.
+# 어떤 모듈이 import 시간을 쓰는지는 `python benchmarks/startup.py` (-X importtime 요약)로 확인하세요.
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+IMPORT_STARTED = time.perf_counter()
+phases: Dict[str, float] = {}
+
+
+def imported():
+    """main.py import가 끝난 시점에 호출 — 이 모듈 로드부터의 시간을 "import"로 기록"""
+    phases["import"] = time.perf_counter() - IMPORT_STARTED
+
+
+@contextmanager
+def phase(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = time.perf_counter() - started
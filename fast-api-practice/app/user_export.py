@@ -0,0 +1,82 @@
+# 사용자 대량 내보내기 (GET /api/users/export).
+#
+# ORM 객체나 UserResponse를 만들지 않고 필요한 컬럼만 SELECT한 뒤, server-side cursor에서
+# EXPORT_CHUNK_ROWS개씩 읽어 바로 NDJSON / CSV 바이트로 바꿔 내보냅니다.
+# 한 번에 메모리에 올라가는 행은 chunk 하나뿐이므로 사용자 수와 관계없이 메모리 사용량이 일정합니다.
+import csv
+import io
+import os
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import select
+
+from app import codec
+from app.models import User
+
+EXPORT_CHUNK_ROWS = int(os.getenv("EXPORT_CHUNK_ROWS", "1000"))
+
+# hashed_password는 내보내지 않음
+EXPORT_COLUMNS = (
+    User.id,
+    User.uid,
+    User.email,
+    User.username,
+    User.is_active,
+    User.is_superuser,
+    User.created_at,
+    User.updated_at,
+)
+FIELD_NAMES = tuple(column.key for column in EXPORT_COLUMNS)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _ndjson_chunk(rows) -> bytes:
+    return b"".join(
+        codec.dumps_bytes({name: _isoformat(value) for name, value in zip(FIELD_NAMES, row)}) + b"\n"
+        for row in rows
+    )
+
+
+class _CsvChunkWriter:
+    """csv.writer가 쓴 내용을 chunk 단위로 꺼내기 위한 버퍼"""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def chunk(self, rows) -> bytes:
+        self._writer.writerows([_isoformat(value) for value in row] for row in rows)
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+async def iter_export(db, export_format: str, chunk_rows: int = EXPORT_CHUNK_ROWS) -> AsyncIterator[bytes]:
+    """
+    export_format(ndjson | csv)으로 전체 사용자를 id 순서대로 chunk씩 생성.
+    db는 요청의 get_db 세션을 그대로 받음 — 의존성 정리(세션 close)는 응답을 다 보낸 뒤에 실행되므로 스트리밍 동안 유지되고,
+    DB_MODE=sync에서 세션 수 제한(_sync_sessions)을 요청당 한 번만 씀 (두 번째 세션을 열면 요청들이 서로의 자리를 기다리며 멈춤).
+    """
+    statement = select(*EXPORT_COLUMNS).order_by(User.id).execution_options(yield_per=chunk_rows)
+
+    csv_writer = None
+    if export_format == "csv":
+        csv_writer = _CsvChunkWriter()
+        yield csv_writer.chunk([FIELD_NAMES])
+
+    result = await db.stream(statement)
+    async for rows in result.partitions(chunk_rows):
+        if csv_writer is not None:
+            yield csv_writer.chunk(rows)
+        else:
+            yield _ndjson_chunk(rows)
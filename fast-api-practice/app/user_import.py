@@ -0,0 +1,169 @@
+# 사용자 대량 가입/가져오기 (POST /api/users/import, import_users.py).
+#
+# 한 명씩 register를 호출하면 사용자마다 중복 확인 SELECT 2번 + INSERT + commit + refresh가 필요하지만,
+# 여기서는 batch_size명씩 묶어서
+#   1) 중복 확인 : email / username IN (...) SELECT 한 번 (+ 같은 batch 안의 중복)
+#   2) 해시     : password_pool.hash_many로 병렬 실행 (로그인용 워커는 남겨 둠, 풀이 가득 차면 그 batch만 실패로 기록)
+#   3) 저장     : INSERT executemany 한 번 + commit 한 번
+# 으로 처리하고, 실패한 행은 입력 순서(index)와 이유를 모아 보고합니다.
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+
+from app.auth import password_pool
+from app.Classes.PasswordHasherPool import PasswordHasherBusy
+from app.db_errors import duplicate_user_message
+from app.models import User
+from app.schemas import UserCreate
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+# API 응답에 담을 최대 오류 수 (failed는 전부 셈)
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportReport:
+    def __init__(self, max_errors: Optional[int] = MAX_REPORTED_ERRORS):
+        self.max_errors = max_errors
+        self.total = 0
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def error(self, index: int, detail: str):
+        self.failed += 1
+        if self.max_errors is None or len(self.errors) < self.max_errors:
+            self.errors.append({"index": index, "detail": detail})
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda error: error["index"]),
+        }
+
+
+def _validation_detail(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+async def _existing(db, users: List[UserCreate]) -> tuple[set, set]:
+    """이미 DB에 있는 email / username (batch 전체를 한 번의 쿼리로 확인)"""
+    emails = [user.email for user in users]
+    usernames = [user.username for user in users]
+    rows = await db.execute(
+        select(User.email, User.username).where(or_(User.email.in_(emails), User.username.in_(usernames)))
+    )
+    taken_emails, taken_usernames = set(), set()
+    for email, username in rows:
+        taken_emails.add(email)
+        taken_usernames.add(username)
+    return taken_emails, taken_usernames
+
+
+async def _insert_rows(db, rows: List[dict], indexes: List[int], report: ImportReport):
+    try:
+        await db.execute(insert(User), rows)
+        await db.commit()
+        report.inserted += len(rows)
+        return
+    except IntegrityError:
+        # 확인 후 insert 사이에 다른 요청이 같은 email/username을 등록한 경우 — 행 단위로 다시 시도
+        await db.rollback()
+        logger.info("bulk insert conflicted, retrying %d rows one by one", len(rows))
+
+    for index, row in zip(indexes, rows):
+        try:
+            await db.execute(insert(User), [row])
+            await db.commit()
+            report.inserted += 1
+        except IntegrityError as e:
+            await db.rollback()
+            report.error(index, duplicate_user_message(e))
+
+
+async def import_batch(db, records: List[Any], start_index: int, report: ImportReport):
+    """records[i]는 UserCreate 형식의 dict, start_index는 records[0]의 전체 입력 기준 위치"""
+    report.total += len(records)
+
+    users: List[UserCreate] = []
+    indexes: List[int] = []
+    seen_emails, seen_usernames = set(), set()
+    for offset, record in enumerate(records):
+        index = start_index + offset
+        try:
+            user = UserCreate.model_validate(record)
+        except ValidationError as e:
+            report.error(index, _validation_detail(e))
+            continue
+        if user.email in seen_emails:
+            report.error(index, "Duplicate email in import")
+            continue
+        if user.username in seen_usernames:
+            report.error(index, "Duplicate username in import")
+            continue
+        seen_emails.add(user.email)
+        seen_usernames.add(user.username)
+        users.append(user)
+        indexes.append(index)
+
+    if not users:
+        return
+
+    taken_emails, taken_usernames = await _existing(db, users)
+    accepted: List[UserCreate] = []
+    accepted_indexes: List[int] = []
+    for index, user in zip(indexes, users):
+        if user.email in taken_emails:
+            report.error(index, "Email already registered")
+        elif user.username in taken_usernames:
+            report.error(index, "Username already taken")
+        else:
+            accepted.append(user)
+            accepted_indexes.append(index)
+
+    if not accepted:
+        return
+
+    try:
+        hashed = await password_pool.hash_many([user.password for user in accepted])
+    except PasswordHasherBusy:
+        # 앞선 batch는 이미 commit되었으므로 중단하지 않고 이 batch의 행만 실패로 기록 (다시 보내면 됨)
+        logger.warning("password hasher busy, skipping %d rows", len(accepted))
+        for index in accepted_indexes:
+            report.error(index, "Password hashing busy, retry later")
+        return
+    rows = [
+        {"email": user.email, "username": user.username, "hashed_password": hashed_password}
+        for user, hashed_password in zip(accepted, hashed)
+    ]
+    await _insert_rows(db, rows, accepted_indexes, report)
+
+
+async def import_users(
+    db,
+    records: Iterable[Any],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    report: Optional[ImportReport] = None,
+) -> ImportReport:
+    """records를 batch_size개씩 가져와 저장 (batch마다 commit)"""
+    report = report or ImportReport()
+    batch: List[Any] = []
+    start_index = 0
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            await import_batch(db, batch, start_index, report)
+            start_index += len(batch)
+            batch = []
+    if batch:
+        await import_batch(db, batch, start_index, report)
+    return report
@@ -0,0 +1,69 @@
+# 사용자 응답(UserResponse) 직렬화 fast path.
+#
+# response_model 경로는 ORM User 객체를 만든 뒤 FastAPI가 행마다 UserResponse로 다시 검증(EmailStr 검증이 대부분)하고
+# jsonable_encoder + json.dumps를 거치므로, 100행 페이지 하나에 수십 ms의 CPU를 씁니다.
+# 여기서는 UserResponse 필드에 해당하는 컬럼만 row tuple로 SELECT하고, 필드 목록으로 미리 만들어 둔 함수(row -> dict)와
+# codec.dumps_bytes(orjson)로 바로 JSON 바이트를 만들어 Response로 돌려줍니다.
+# 저장된 값은 가입 / 수정 / 가져오기에서 이미 UserCreate / UserUpdate로 검증되었으므로 응답에서 다시 검증하지 않습니다.
+# 라우터의 response_model은 OpenAPI 문서용으로 그대로 두며, Response를 직접 반환하면 FastAPI는 검증을 건너뜁니다.
+from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Optional, Sequence
+
+from fastapi import Response, status
+
+from app import codec
+from app.models import User
+from app.schemas import UserResponse
+
+# UserResponse와 같은 순서 (응답 JSON의 키 순서도 response_model 경로와 같음)
+USER_RESPONSE_FIELDS = tuple(UserResponse.model_fields)
+USER_RESPONSE_COLUMNS = tuple(getattr(User, name) for name in USER_RESPONSE_FIELDS)
+ID_INDEX = USER_RESPONSE_FIELDS.index("id")
+
+# ORM User(또는 캐시된 스냅샷) -> USER_RESPONSE_FIELDS 순서의 tuple
+user_row: Callable[[User], tuple] = attrgetter(*USER_RESPONSE_FIELDS)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+def _build_row_serializer(fields: Sequence[str]) -> Callable[[Sequence], dict]:
+    """
+    row -> {"email": row[0], ...} 함수를 필드 목록으로 한 번 만들어 둠 (행마다 dict(zip(...)) 한 번).
+    orjson / msgspec은 datetime을 직접 ISO 8601로 쓰지만, 표준 json 백엔드일 때만 문자열로 바꿉니다.
+    """
+    keys = tuple(fields)
+    converted = tuple(
+        (index, name) for index, name in enumerate(keys)
+        if codec.BACKEND == "json" and UserResponse.model_fields[name].annotation in (datetime, Optional[datetime])
+    )
+
+    def serialize_row(row: Sequence) -> dict:
+        data = dict(zip(keys, row))
+        for index, name in converted:
+            data[name] = _isoformat(row[index])
+        return data
+
+    return serialize_row
+
+
+serialize_row = _build_row_serializer(USER_RESPONSE_FIELDS)
+
+
+def user_json(row: Sequence) -> bytes:
+    return codec.dumps_bytes(serialize_row(row))
+
+
+def users_json(rows: Sequence[Sequence]) -> bytes:
+    return codec.dumps_bytes(list(map(serialize_row, rows)))
+
+
+def user_page_json(rows: Sequence[Sequence], next_cursor: Optional[str]) -> bytes:
+    """UserPage와 같은 형태 — {"items": [...], "next_cursor": ...}"""
+    return codec.dumps_bytes({"items": list(map(serialize_row, rows)), "next_cursor": next_cursor})
+
+
+def json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(content=content, status_code=status_code, media_type="application/json")
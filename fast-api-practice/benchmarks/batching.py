@@ -0,0 +1,84 @@
+# micro-batching benchmark
+#
+# 실행: python benchmarks/batching.py
+# 100개 연결에 작은 메시지 2,000개를 몰아서 보낼 때, batching 설정별로
+# 실제 소켓 send 호출(프레임) 수와 전체 전달 시간을 출력합니다.
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import codec
+from app.Classes.ConnectionManager import ConnectionManager
+from app.Classes.OutboundQueue import BatchPolicy
+from fake_websocket import FakeClient
+
+CONNECTIONS = 100
+MESSAGES = 2_000
+POLICIES = (None, BatchPolicy(1, 20), BatchPolicy(5, 50), BatchPolicy(20, 200))
+
+
+class CountingWebSocket:
+    """프레임 수와 프레임에 담긴 메시지 수를 세는 가짜 WebSocket"""
+
+    def __init__(self, state: dict):
+        self.headers = {}
+        self.cookies = {}
+        self.client = FakeClient("10.0.0.1")
+        self.state = state
+
+    async def accept(self, *args, **kwargs):
+        pass
+
+    async def send_text(self, message: str):
+        await asyncio.sleep(0)
+        # 실제 클라이언트처럼 일반 str로 받음 (orjson은 str 하위 클래스인 JsonText를 직접 파싱하지 않음)
+        data = codec.loads(str(message))
+        self.state["frames"] += 1
+        self.state["messages"] += len(data) if isinstance(data, list) else 1
+        if self.state["messages"] >= self.state["expected"]:
+            self.state["done"].set()
+
+    async def close(self, code: int = 1000, reason: str = None):
+        pass
+
+
+async def run(policy):
+    manager = ConnectionManager(queue_size=MESSAGES, default_batch=policy)
+    state = {"frames": 0, "messages": 0, "expected": CONNECTIONS * MESSAGES, "done": asyncio.Event()}
+    for _ in range(CONNECTIONS):
+        await manager.connect(CountingWebSocket(state))
+
+    started = time.perf_counter()
+    for i in range(MESSAGES):
+        await manager.broadcast({"type": "tick", "seq": i})
+        if i % 100 == 0:
+            # 송신자가 조금씩 쉬어가며 보내는 burst
+            await asyncio.sleep(0)
+    await asyncio.wait_for(state["done"].wait(), timeout=60)
+    elapsed = time.perf_counter() - started
+
+    label = "off" if policy is None else f"{policy.window_ms:g}ms / {policy.max_messages}"
+    print(
+        f"batching {label:<12} | frames {state['frames']:>8,}"
+        f" | msgs/frame {state['messages'] / state['frames']:6.1f}"
+        f" | {elapsed * 1000:8.1f} ms"
+    )
+    for ws in list(manager.connections):
+        manager.disconnect(ws)
+
+
+async def main():
+    logging.disable(logging.WARNING)
+    print("=" * 60)
+    print(f"Micro-batching benchmark ({CONNECTIONS} connections x {MESSAGES:,} messages)")
+    print("=" * 60)
+    for policy in POLICIES:
+        await run(policy)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+# 텍스트(JSON) vs 바이너리 프레임 benchmark
+#
+# 실행: python benchmarks/binary_protocol.py
+# 메시지 종류별로 전송 바이트 수와 encode / decode 비용(us/msg)을 출력합니다.
+#   inbound room message : 클라이언트 → 서버 (서버가 room을 꺼내기까지의 비용)
+#   outbound payloads    : 서버 → 클라이언트 (연결 송신 형식에 맞게 인코딩, 클라이언트 측 decode)
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import binary_protocol as bp
+from app import codec
+from app.binary_protocol import WireEncoding
+
+ITERATIONS = 50_000
+
+ROOM = "room-42"
+CHAT_TEXT = "오늘 회의는 3시로 변경되었습니다. see you there!"
+
+OUTBOUND = {
+    "small chat": {"type": "room_message", "room": ROOM, "message": CHAT_TEXT},
+    "login response": {
+        "result": True, "error": False, "message": "",
+        "data": {"uid": "3f0c2a9e-8a55-4c31-9b1e-0d7d3c1a2b4f", "username": "testuser", "email": "user@example.com"},
+    },
+    "history (50 msgs)": {
+        "type": "history",
+        "room": ROOM,
+        "messages": [
+            {"seq": i, "from": f"user{i % 7}", "message": CHAT_TEXT, "sent_at": 1735689600000 + i * 1000}
+            for i in range(50)
+        ],
+    },
+}
+
+
+def per_message_us(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - started) / ITERATIONS * 1_000_000
+
+
+def inbound():
+    print("inbound room message (client -> server)")
+    text = codec.dumps({"type": "room_message", "room": ROOM, "message": CHAT_TEXT})
+    frame = bp.encode_frame(bp.KIND_ROOM, bp.encode_room_payload(ROOM, CHAT_TEXT))
+
+    def parse_text():
+        data = codec.loads(text)
+        return data["room"], data["message"]
+
+    def parse_binary():
+        return bp.decode_room_payload(bp.decode_frame(frame)[1])
+
+    print(f"  {'text':<16} {len(text.encode('utf-8')):>7} bytes  decode {per_message_us(parse_text):7.2f} us")
+    print(f"  {'binary':<16} {len(frame):>7} bytes  decode {per_message_us(parse_binary):7.2f} us")
+
+
+def outbound():
+    for name, obj in OUTBOUND.items():
+        print(f"outbound {name} (server -> client)")
+        message = codec.JsonText(codec.dumps(obj))
+        for encoding in (WireEncoding.TEXT, WireEncoding.BINARY_DEFLATE):
+            wire = bp.encode_outbound(message, encoding)
+            size = len(wire.encode("utf-8")) if isinstance(wire, str) else len(wire)
+            encode_us = per_message_us(lambda: bp.encode_outbound(message, encoding))
+            if isinstance(wire, str):
+                # 클라이언트가 받는 텍스트 프레임은 일반 str (JsonText 표시는 서버 안에서만 쓰임)
+                received = str(wire)
+                decode_us = per_message_us(lambda: codec.loads(received))
+            else:
+                decode_us = per_message_us(lambda: codec.loads(bp.decode_frame(wire)[1]))
+            print(f"  {encoding.value:<16} {size:>7} bytes  encode {encode_us:7.2f} us  decode {decode_us:7.2f} us")
+
+
+def main():
+    print("=" * 60)
+    print(f"Text vs binary frame benchmark (JSON backend: {codec.BACKEND})")
+    print("=" * 60)
+    inbound()
+    outbound()
+
+
+if __name__ == "__main__":
+    main()
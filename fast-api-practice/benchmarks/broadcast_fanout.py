@@ -0,0 +1,70 @@
+# ConnectionManager.broadcast fan-out latency benchmark
+#
+# 실행: python benchmarks/broadcast_fanout.py
+# 프로세스 내부의 가짜 소켓 1k / 5k / 10k 개에 브로드캐스트하고,
+# 각 수신자가 메시지를 받기까지 걸린 시간의 p50 / p99를 출력합니다.
+import asyncio
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.Classes.ConnectionManager import ConnectionManager
+from fake_websocket import DeliveryTracker, FakeWebSocket, percentile
+
+CONNECTION_COUNTS = (1_000, 5_000, 10_000)
+ROUNDS = 20
+# 일부러 느리게 만드는 소켓 비율 (SEND_TIMEOUT보다 오래 걸림)
+SLOW_EVERY = 500
+
+
+async def run(count: int):
+    manager = ConnectionManager()
+    tracker = DeliveryTracker()
+    sockets = [FakeWebSocket(i, tracker) for i in range(count)]
+    for ws in sockets:
+        await manager.connect(ws)
+
+    p50s, p99s = [], []
+    for i in range(ROUNDS):
+        tracker.reset(count)
+        await manager.broadcast({"type": "chat", "seq": i, "message": "hello"})
+        await asyncio.wait_for(tracker.done.wait(), timeout=30)
+        p50s.append(percentile(tracker.latencies, 50))
+        p99s.append(percentile(tracker.latencies, 99))
+
+    # 느린 소켓이 섞여 있을 때 나머지 소켓이 막히지 않는지 확인
+    slow = [FakeWebSocket(i, tracker, slow=True) for i in range(count // SLOW_EVERY)]
+    for ws in slow:
+        await manager.connect(ws)
+    tracker.reset(count)
+    started = time.perf_counter()
+    await manager.broadcast({"type": "chat", "seq": -1, "message": "with slow clients"})
+    await asyncio.wait_for(tracker.done.wait(), timeout=30)
+    with_slow_p99 = percentile(tracker.latencies, 99)
+    with_slow_total = time.perf_counter() - started
+
+    print(
+        f"{count:>7} sockets | p50 {sum(p50s) / len(p50s) * 1000:8.2f} ms"
+        f" | p99 {sum(p99s) / len(p99s) * 1000:8.2f} ms"
+        f" | p99 w/ {len(slow)} slow {with_slow_p99 * 1000:8.2f} ms"
+        f" (broadcast returned in {with_slow_total * 1000:.0f} ms)"
+    )
+
+    for ws in sockets:
+        manager.disconnect(ws)
+
+
+async def main():
+    logging.disable(logging.WARNING)
+    print("=" * 60)
+    print("ConnectionManager broadcast fan-out benchmark")
+    print("=" * 60)
+    for count in CONNECTION_COUNTS:
+        await run(count)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+# DB_MODE(sync / async) load-test benchmark
+#
+# 실행: python benchmarks/db_modes.py
+# 각 모드마다 별도 프로세스에서 앱을 띄우고(httpx ASGITransport, 네트워크 없음)
+# GET /api/users/ 를 CONCURRENCY개씩 동시에 REQUESTS번 호출해 req/s와 p50 / p99 지연을 출력합니다.
+# 기본 DB는 임시 SQLite 파일이며, BENCH_DATABASE_URL로 MariaDB 등을 지정할 수 있습니다 (테이블 내용이 바뀜).
+# httpx가 필요합니다: pip install httpx
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+sys.path.append(BENCH_DIR)
+
+MODES = ("sync", "async")
+REQUESTS = 2_000
+CONCURRENCY = 50
+SEED_USERS = 200
+# 응답 직렬화(EmailStr 검증)가 지연의 대부분을 차지하지 않도록 작은 페이지 사용
+PAGE_SIZE = 5
+
+
+async def load_test():
+    import httpx
+
+    import main
+    from app import database
+    from app.auth import create_access_token
+    from app.models import User
+    from fake_websocket import percentile
+
+    database.Base.metadata.create_all(bind=database.engine)
+    with database.SessionLocal() as session:
+        if session.query(User).count() < SEED_USERS:
+            session.add_all(
+                User(email=f"bench{i}@example.com", username=f"bench{i}", hashed_password="x")
+                for i in range(SEED_USERS)
+            )
+            session.commit()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench0'})}"}
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(f"/api/users/?limit={PAGE_SIZE}", headers=headers)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        # 워밍업 (커넥션 풀, 토큰/사용자 캐시)
+        await asyncio.gather(*(one() for _ in range(CONCURRENCY)))
+        latencies.clear()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(REQUESTS)))
+        elapsed = time.perf_counter() - started
+
+    await database.dispose_engines()
+    print(
+        f"  {os.environ['DB_MODE']:<6} {REQUESTS / elapsed:>9,.0f} req/s"
+        f"   p50 {percentile(latencies, 50) * 1000:7.2f} ms"
+        f"   p99 {percentile(latencies, 99) * 1000:7.2f} ms"
+    )
+
+
+def main():
+    print("=" * 60)
+    print(f"GET /api/users/ load test ({REQUESTS:,} requests, concurrency {CONCURRENCY})")
+    print("=" * 60)
+
+    database_url = os.getenv("BENCH_DATABASE_URL")
+    temp_dir = None
+    if database_url is None:
+        temp_dir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+
+    for mode in MODES:
+        # DB_MODE는 import 시점에 읽히므로 모드마다 새 프로세스에서 실행
+        env = {**os.environ, "DB_MODE": mode, "DATABASE_URL": database_url}
+        subprocess.run([sys.executable, __file__, "--worker"], env=env, check=True)
+
+    if temp_dir is not None:
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        logging.disable(logging.INFO)
+        asyncio.run(load_test())
+    else:
+        main()
@@ -0,0 +1,112 @@
+# 벤치마크 / 로컬 확인용 최소 Redis 프로토콜(RESP) 서버
+#
+# 단독 실행: python benchmarks/fake_redis.py [port]  (기본 6379)
+# RedisRateLimitStore가 쓰는 명령(PING, AUTH, SELECT, GET, INCR, PEXPIRE, PTTL, DEL, FLUSHALL)만 구현합니다.
+import asyncio
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+
+class FakeRedis:
+    def __init__(self):
+        # key -> (값, 만료 시각(monotonic 초) 또는 None)
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.commands = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        # 처리 중인 연결: task -> writer
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def execute(self, name: bytes, args: list) -> bytes:
+        self.commands += 1
+        name = name.upper()
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name in (b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if name == b"FLUSHALL":
+            self.data.clear()
+            return b"+OK\r\n"
+        if name == b"GET":
+            value = self._get(args[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if name == b"INCR":
+            value = self._get(args[0])
+            try:
+                number = int(value or 0) + 1
+            except ValueError:
+                return b"-ERR value is not an integer or out of range\r\n"
+            expires_at = self.data[args[0]][1] if value is not None else None
+            self.data[args[0]] = (str(number).encode(), expires_at)
+            return b":%d\r\n" % number
+        if name == b"PEXPIRE":
+            value = self._get(args[0])
+            if value is None:
+                return b":0\r\n"
+            self.data[args[0]] = (value, time.monotonic() + int(args[1]) / 1000)
+            return b":1\r\n"
+        if name == b"PTTL":
+            if self._get(args[0]) is None:
+                return b":-2\r\n"
+            expires_at = self.data[args[0]][1]
+            return b":-1\r\n" if expires_at is None else b":%d\r\n" % int((expires_at - time.monotonic()) * 1000)
+        if name == b"DEL":
+            return b":%d\r\n" % sum(1 for key in args if self.data.pop(key, None) is not None)
+        return b"-ERR unknown command '%s'\r\n" % name
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.startswith(b"*"):
+                    writer.write(b"-ERR only RESP arrays are supported\r\n")
+                    continue
+                parts = []
+                for _ in range(int(line[1:])):
+                    length = int((await reader.readline())[1:])
+                    parts.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self.execute(parts[0], parts[1:]))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            self._clients.pop(task, None)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # 연결된 클라이언트를 끊고 처리 task가 끝날 때까지 기다림 (이벤트 루프 종료 시 취소되지 않도록)
+            for writer in list(self._clients.values()):
+                writer.close()
+            await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+
+
+async def serve(port: int):
+    server = FakeRedis()
+    await server.start(port=port)
+    print(f"fake redis listening on 127.0.0.1:{port}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve(int(sys.argv[1]) if len(sys.argv) > 1 else 6379))
@@ -0,0 +1,62 @@
+# 벤치마크용 프로세스 내부 가짜 WebSocket
+import asyncio
+import time
+
+
+class FakeClient:
+    def __init__(self, host: str):
+        self.host = host
+        self.port = 0
+
+
+class DeliveryTracker:
+    """기준 시각부터 각 수신까지 걸린 시간을 기록"""
+
+    def __init__(self):
+        self.started = 0.0
+        self.latencies: list[float] = []
+        self.expected = 0
+        self.done = asyncio.Event()
+
+    def reset(self, expected: int):
+        self.started = time.perf_counter()
+        self.latencies = []
+        self.expected = expected
+        self.done = asyncio.Event()
+
+    def record(self):
+        self.latencies.append(time.perf_counter() - self.started)
+        if len(self.latencies) >= self.expected:
+            self.done.set()
+
+
+class FakeWebSocket:
+    """send_text 시점을 기록하는 가짜 WebSocket"""
+
+    def __init__(self, index: int, tracker: DeliveryTracker, slow: bool = False):
+        self.headers = {}
+        self.cookies = {}
+        self.client = FakeClient(f"10.0.0.{index % 255}")
+        self.tracker = tracker
+        self.slow = slow
+
+    async def accept(self, *args, **kwargs):
+        pass
+
+    async def send_text(self, message: str):
+        if self.slow:
+            await asyncio.sleep(60)
+        await asyncio.sleep(0)
+        self.tracker.record()
+
+    async def send_bytes(self, message: bytes):
+        await self.send_text(message.decode("utf-8"))
+
+    async def close(self, code: int = 1000, reason: str = None):
+        pass
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
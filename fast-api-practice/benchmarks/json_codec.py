@@ -0,0 +1,64 @@
+# WebSocket 메시지 JSON 처리 micro-benchmark
+#
+# 실행: python benchmarks/json_codec.py
+# 수신 프레임 파싱과 응답 직렬화를 기존 방식(json + BaseResponse 객체)과
+# app.codec 방식(빠른 백엔드 + 고정 응답 캐시)으로 각각 수행했을 때의 messages/sec를 출력합니다.
+# JSON_BACKEND=json 으로 실행하면 표준 라이브러리 fallback 성능을 확인할 수 있습니다.
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import codec
+from app.dtos import BaseResponse
+
+ITERATIONS = 200_000
+
+INBOUND = json.dumps({
+    "type": "room_message",
+    "room": "room-1",
+    "message": "안녕하세요, 반갑습니다! hello world",
+    "sent_at": 1735689600123,
+})
+USER_INFO = {"uid": "3f0c2a9e-8a55-4c31-9b1e-0d7d3c1a2b4f", "username": "testuser", "email": "user@example.com"}
+
+
+def measure(name: str, fn) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    elapsed = time.perf_counter() - started
+    rate = ITERATIONS / elapsed
+    print(f"  {name:<38} {rate:>12,.0f} msg/s")
+    return rate
+
+
+def legacy_error():
+    return json.dumps(BaseResponse(result=False, error=True, message="Invalid token", data=None).to_dict())
+
+
+def legacy_success():
+    return json.dumps(BaseResponse(result=True, error=False, message="", data=USER_INFO).to_dict())
+
+
+def main():
+    print("=" * 60)
+    print(f"JSON codec benchmark (backend: {codec.BACKEND})")
+    print("=" * 60)
+
+    cases = [
+        ("parse inbound frame", lambda: json.loads(INBOUND), lambda: codec.loads(INBOUND)),
+        ("encode constant error response", legacy_error, lambda: BaseResponse.error_json("Invalid token")),
+        ("encode login success response", legacy_success, lambda: BaseResponse.success_json("", USER_INFO)),
+    ]
+    for label, before, after in cases:
+        print(label)
+        old = measure("before (json + BaseResponse)", before)
+        new = measure(f"after  (codec/{codec.BACKEND})", after)
+        print(f"  speedup x{new / old:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# JWT 백엔드 micro-benchmark
+#
+# 실행: python benchmarks/jwt_backend.py
+# app.jwt_backend의 각 구현(jose, hs256)으로 access token 발급(encode)과 검증(decode)을
+# 반복했을 때의 tokens/sec를 출력합니다. 발급은 create_access_token과 같은 claims(sub + exp)를 사용합니다.
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.jwt_backend import BACKENDS
+
+ITERATIONS = 50_000
+SECRET_KEY = "benchmark-secret"
+ALGORITHM = "HS256"
+
+
+def measure(name: str, fn) -> float:
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    elapsed = time.perf_counter() - started
+    rate = ITERATIONS / elapsed
+    print(f"  {name:<20} {rate:>12,.0f} tokens/s")
+    return rate
+
+
+def main():
+    print("=" * 60)
+    print(f"JWT backend benchmark ({ITERATIONS:,} iterations)")
+    print("=" * 60)
+
+    exp = int(time.time()) + 1800
+    claims = {"sub": "testuser", "exp": exp}
+
+    results = {}
+    for name, backend_class in BACKENDS.items():
+        backend = backend_class(SECRET_KEY, ALGORITHM)
+        token = backend.encode(claims)
+        print(name)
+        results[name] = (
+            measure("encode", lambda: backend.encode({**claims, "exp": exp})),
+            measure("verify", lambda: backend.decode(token)),
+        )
+
+    if "jose" in results:
+        base_encode, base_decode = results["jose"]
+        for name, (encode_rate, decode_rate) in results.items():
+            if name != "jose":
+                print(f"{name} vs jose: encode x{encode_rate / base_encode:.1f}, verify x{decode_rate / base_decode:.1f}")
+
+
+if __name__ == "__main__":
+    main()
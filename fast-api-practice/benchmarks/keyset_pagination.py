@@ -0,0 +1,91 @@
+# GET /api/users/ offset vs keyset(cursor) 페이지 지연 benchmark
+#
+# 실행: python benchmarks/keyset_pagination.py
+# users 테이블에 BENCH_ROWS개(기본 1,000,000)의 행을 채운 뒤, 여러 깊이에서 한 페이지(PAGE_SIZE)를 읽는 데 걸린 시간의
+# 중앙값을 offset 방식(read_users 기본 모드)과 keyset 방식(cursor 모드)으로 각각 출력합니다.
+# 기본 DB는 임시 SQLite 파일이며, BENCH_DATABASE_URL로 MariaDB 등을 지정할 수 있습니다 (비어 있는 DB를 사용하세요).
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROWS = int(os.getenv("BENCH_ROWS", "1000000"))
+PAGE_SIZE = 100
+ROUNDS = 20
+SEED_BATCH = 20_000
+
+temp_dir = None
+if "BENCH_DATABASE_URL" in os.environ:
+    os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+else:
+    temp_dir = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+os.environ["DB_MODE"] = "sync"
+
+from sqlalchemy import func, insert, select
+
+from app.database import Base, SessionLocal, engine
+from app.models import User
+from app.pagination import decode_cursor, encode_cursor
+
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        existing = conn.scalar(select(func.count()).select_from(User))
+        for start in range(existing, ROWS, SEED_BATCH):
+            end = min(ROWS, start + SEED_BATCH)
+            conn.execute(insert(User), [
+                {"uid": f"bench-{i}", "email": f"bench{i}@example.com", "username": f"bench{i}", "hashed_password": "x"}
+                for i in range(start, end)
+            ])
+
+
+def median_ms(fn) -> float:
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    print("=" * 60)
+    print(f"users pagination benchmark ({ROWS:,} rows, page size {PAGE_SIZE})")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    seed()
+    print(f"seeded in {time.perf_counter() - started:.1f}s")
+
+    depths = sorted({0, ROWS // 100, ROWS // 10, ROWS // 2, max(0, ROWS - PAGE_SIZE * 2)})
+    print(f"  {'depth':>10}  {'offset':>10}  {'keyset':>10}")
+    with SessionLocal() as session:
+        for depth in depths:
+            # 해당 깊이의 페이지를 요청할 때 클라이언트가 갖고 있을 cursor (측정에서 제외)
+            last_id = session.scalar(select(User.id).order_by(User.id).offset(depth - 1).limit(1)) if depth else 0
+            cursor = encode_cursor(last_id)
+
+            def offset_page():
+                session.scalars(select(User).offset(depth).limit(PAGE_SIZE)).all()
+                session.expunge_all()
+
+            def keyset_page():
+                session.scalars(
+                    select(User).where(User.id > decode_cursor(cursor)).order_by(User.id).limit(PAGE_SIZE + 1)
+                ).all()
+                session.expunge_all()
+
+            print(f"  {depth:>10,}  {median_ms(offset_page):>8.2f}ms  {median_ms(keyset_page):>8.2f}ms")
+
+    engine.dispose()
+    if temp_dir is not None:
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# 로깅 파이프라인 micro-benchmark
+#
+# 실행: python benchmarks/logging_pipeline.py
+# 로그를 남기는 쪽(= 이벤트 루프 스레드)에서 호출 한 번에 쓰는 CPU 시간(time.thread_time)을 비교합니다.
+#   stream   : 이전 설정 — 호출한 스레드에서 StreamHandler로 포맷 + 출력 (f-string 메시지)
+#   queue    : app.logging_setup — 큐에 넣기만 하고 JSON 포맷 / 출력은 리스너 스레드에서 (호출 위치 찾기 생략)
+#   disabled : 꺼진 레벨(DEBUG)에 f-string vs 지연 포맷(%s)
+#   sampled  : 채팅 메시지 로그처럼 LogSampler(0.01)로 거른 경우
+# 출력은 /dev/null로 보냅니다.
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import QueueListener
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.logging_setup import JsonFormatter, LogSampler, NonBlockingQueueHandler
+
+ITERATIONS = 50_000
+MESSAGE = {"type": "room_message", "room": "lobby", "message": "hello " * 8, "headers": {"access_token": "x" * 160}}
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def measure(label: str, fn) -> float:
+    started = time.thread_time()
+    for _ in range(ITERATIONS):
+        fn()
+    per_call = (time.thread_time() - started) / ITERATIONS * 1_000_000
+    print(f"  {label:<40} {per_call:8.2f} us/call (caller CPU)")
+    return per_call
+
+
+def main():
+    devnull = open(os.devnull, "w")
+    print("=" * 60)
+    print(f"logging pipeline benchmark ({ITERATIONS:,} calls)")
+    print("=" * 60)
+
+    stream = logging.StreamHandler(devnull)
+    stream.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    stream_logger = make_logger("stream", stream)
+    before = measure("stream handler, f-string", lambda: stream_logger.info(f"Received headers: {MESSAGE}"))
+
+    output = logging.StreamHandler(devnull)
+    output.setFormatter(JsonFormatter())
+    handler = NonBlockingQueueHandler(queue.SimpleQueue(), ITERATIONS * 2)
+    listener = QueueListener(handler.queue, output)
+    listener.start()
+    queue_logger = make_logger("queue", handler)
+    # configure_logging()과 같이 호출 위치 찾기를 끔 (LOG_CALLER_INFO=false)
+    logging._srcfile = None
+    after = measure("queue handler (JSON in listener), lazy %s",
+                    lambda: queue_logger.info("Received message of type %s", MESSAGE["type"]))
+    listener.stop()
+    print(f"  -> x{before / after:.1f} less caller CPU, dropped {handler.dropped}")
+
+    measure("disabled DEBUG, f-string", lambda: queue_logger.debug(f"Received headers: {MESSAGE}"))
+    measure("disabled DEBUG, lazy %s", lambda: queue_logger.debug("Received headers: %s", MESSAGE))
+
+    sampler = LogSampler(0.01)
+    listener = QueueListener(handler.queue, output)
+    listener.start()
+    measure("sampled 1% (LogSampler)", lambda: sampler() and queue_logger.info(
+        "Received message of type %s", MESSAGE["type"], extra={"sample_rate": sampler.rate}))
+    listener.stop()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# 로그인 요청 제한(credential stuffing) benchmark
+#
+# 실행: python benchmarks/rate_limit.py
+# 설정마다 별도 프로세스에서 앱을 띄우고(httpx ASGITransport, 네트워크 없음)
+#   - 공격자(IP 하나)가 실제 계정 ATTACK_USERS개에 틀린 비밀번호로 ATTACKS번 로그인을 CONCURRENCY개씩 동시에 시도하는 동안
+#   - 정상 사용자(다른 IP)가 LEGIT_LOGINS번 로그인
+# 했을 때 공격 요청의 응답 코드별 수, 실제로 계산한 비밀번호 해시 수, 정상 사용자의 로그인 성공 수와 지연을 출력합니다.
+#   off    : RATE_LIMIT_ENABLED=false
+#   memory : RATE_LIMIT_STORE=memory (기본값)
+#   redis  : RATE_LIMIT_STORE=redis, 같은 프로세스에서 띄운 fake_redis.FakeRedis 사용
+# httpx가 필요합니다: pip install httpx
+import asyncio
+import collections
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+sys.path.append(BENCH_DIR)
+
+SETTINGS = ("off", "memory", "redis")
+ATTACKS = 300
+ATTACK_USERS = 50
+CONCURRENCY = 32
+LEGIT_LOGINS = 10
+PASSWORD = "correct-password"
+
+
+async def load_test(setting: str):
+    import httpx
+
+    from fake_redis import FakeRedis
+    from fake_websocket import percentile
+
+    fake_redis = None
+    if setting == "redis":
+        # app.rate_limit이 import 시점에 URL을 읽으므로 앱을 import하기 전에 띄움
+        fake_redis = FakeRedis()
+        port = await fake_redis.start()
+        os.environ["RATE_LIMIT_REDIS_URL"] = f"redis://127.0.0.1:{port}/0"
+
+    import main
+    from app import database
+    from app.auth import get_password_hash, password_pool
+    from app.models import User
+    from app.rate_limit import rate_limiter
+
+    database.Base.metadata.create_all(bind=database.engine)
+    hashed_password = get_password_hash(PASSWORD)
+    with database.SessionLocal() as session:
+        session.query(User).delete()
+        session.add_all(
+            User(email=f"user{i}@example.com", username=f"user{i}", hashed_password=hashed_password)
+            for i in range(ATTACK_USERS + 1)
+        )
+        session.commit()
+
+    statuses = collections.Counter()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    legit_latencies: list[float] = []
+    legit_ok = 0
+
+    attacker = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app, client=("10.0.0.1", 1234)),
+                                 base_url="http://bench")
+    legit = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app, client=("10.0.0.2", 1234)),
+                              base_url="http://bench")
+
+    async def attack(i: int):
+        async with semaphore:
+            response = await attacker.post(
+                "/api/auth/login", json={"username": f"user{i % ATTACK_USERS}", "password": "wrong"}
+            )
+            statuses[response.status_code] += 1
+
+    async def legit_user():
+        nonlocal legit_ok
+        for _ in range(LEGIT_LOGINS):
+            started = time.perf_counter()
+            response = await legit.post(
+                "/api/auth/login", json={"username": f"user{ATTACK_USERS}", "password": PASSWORD}
+            )
+            legit_latencies.append(time.perf_counter() - started)
+            legit_ok += response.status_code == 200
+            await asyncio.sleep(0.05)
+
+    hashes_before = password_pool.metrics()["completed"]
+    started = time.perf_counter()
+    await asyncio.gather(legit_user(), *(attack(i) for i in range(ATTACKS)))
+    elapsed = time.perf_counter() - started
+    hashes = password_pool.metrics()["completed"] - hashes_before - legit_ok
+
+    await attacker.aclose()
+    await legit.aclose()
+    await database.dispose_engines()
+    await rate_limiter.close()
+    if fake_redis is not None:
+        await fake_redis.stop()
+
+    codes = " ".join(f"{code}:{count}" for code, count in sorted(statuses.items()))
+    print(
+        f"  {setting:<7} {elapsed:6.2f}s   attack [{codes}]   hashes {hashes:>4}"
+        f"   legit {legit_ok}/{LEGIT_LOGINS} ok, p50 {percentile(legit_latencies, 50) * 1000:6.1f} ms"
+        f" max {max(legit_latencies) * 1000:6.1f} ms"
+    )
+
+
+def main():
+    print("=" * 60)
+    print(f"login rate limit benchmark ({ATTACKS} attack requests over {ATTACK_USERS} accounts, "
+          f"concurrency {CONCURRENCY})")
+    print("=" * 60)
+
+    temp_dir = tempfile.TemporaryDirectory()
+    database_url = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+    for setting in SETTINGS:
+        # 제한 설정은 import 시점에 읽히므로 설정마다 새 프로세스에서 실행
+        env = {
+            **os.environ,
+            "DATABASE_URL": database_url,
+            "RATE_LIMIT_ENABLED": "false" if setting == "off" else "true",
+            "RATE_LIMIT_STORE": "redis" if setting == "redis" else "memory",
+        }
+        subprocess.run([sys.executable, __file__, "--worker", setting], env=env, check=True)
+    temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        logging.disable(logging.INFO)
+        asyncio.run(load_test(sys.argv[-1]))
+    else:
+        main()
@@ -0,0 +1,159 @@
+# 읽기 replica 라우팅 benchmark (SQLite 파일 3개: primary + replica 2개)
+#
+# 실행: python benchmarks/read_replicas.py
+# primary를 만들고 사용자를 채운 뒤 파일을 복사해 replica0 / replica1을 만듭니다. 실제 복제 대신
+#   - replica0 : 별도 스레드가 primary의 heartbeat 행을 계속 복사 (lag ~ DB_REPLICA_CHECK_INTERVAL)
+#   - replica1 : 복사하지 않음 — 시간이 지나면 lag가 DB_REPLICA_MAX_LAG를 넘어 읽기 대상에서 빠져야 함
+# DB_MODE(async / sync) x DB_REPLICA_STRATEGY(round_robin / least_latency)마다 별도 프로세스에서 앱을 띄우고
+# (httpx ASGITransport) GET /api/users/{id}를 REQUESTS번씩 두 번(replica1이 빠지기 전 / 후) 호출해
+# 세션이 어느 replica에서 읽었는지와 req/s, p50을 출력합니다. replica가 없는 경우(none)도 함께 잽니다.
+# 마지막으로 PUT /api/users/me 응답(같은 요청 안의 read-after-write)과 직후 GET /me가 primary의 새 값을 읽는지 확인합니다.
+# httpx가 필요합니다: pip install httpx
+import asyncio
+import logging
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCH_DIR))
+sys.path.append(BENCH_DIR)
+
+REQUESTS = 1_000
+CONCURRENCY = 20
+SEED_USERS = 200
+MAX_LAG = 3.0
+CHECK_INTERVAL = 0.2
+
+
+def replicate_heartbeat(primary: str, replica: str, stop: threading.Event):
+    """primary의 replica_heartbeat 행을 replica 파일로 계속 복사 (복제가 따라오는 replica 흉내)"""
+    while not stop.wait(CHECK_INTERVAL / 2):
+        with sqlite3.connect(primary) as source, sqlite3.connect(replica) as target:
+            rows = source.execute("SELECT id, ts FROM replica_heartbeat").fetchall()
+            target.executemany("INSERT OR REPLACE INTO replica_heartbeat (id, ts) VALUES (?, ?)", rows)
+
+
+async def load_test():
+    import httpx
+
+    import main
+    from app.auth import create_access_token
+    from app.database import replica_router
+    from fake_websocket import percentile
+
+    stop = threading.Event()
+    if replica_router.names:
+        paths = os.environ["BENCH_SQLITE_PATHS"].split(",")
+        # 시작 시점에는 두 replica 모두 따라와 있던 것으로 — 이후 replica1만 복제가 멈춤
+        for path in paths[1:]:
+            with sqlite3.connect(path) as target:
+                target.execute("INSERT OR REPLACE INTO replica_heartbeat (id, ts) VALUES (1, ?)", (time.time(),))
+        threading.Thread(target=replicate_heartbeat, args=(paths[0], paths[1], stop), daemon=True).start()
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'bench0'})}"}
+    label = f"{os.environ['DB_MODE']:<5} {os.environ.get('DB_REPLICA_STRATEGY', '-') if replica_router.names else 'none':<13}"
+
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+            latencies: list[float] = []
+
+            async def one(index: int):
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await client.get(f"/api/users/{index % SEED_USERS + 1}", headers=headers)
+                    latencies.append(time.perf_counter() - started)
+                    response.raise_for_status()
+
+            async def phase(name: str):
+                before = replica_router.metrics()
+                latencies.clear()
+                started = time.perf_counter()
+                await asyncio.gather(*(one(index) for index in range(REQUESTS)))
+                elapsed = time.perf_counter() - started
+                after = replica_router.metrics()
+                reads = "  ".join(
+                    f"{replica} {after['replicas'][replica]['reads'] - before['replicas'][replica]['reads']:>5}"
+                    for replica in replica_router.names
+                )
+                fallbacks = after["primary_fallbacks"] - before["primary_fallbacks"]
+                print(
+                    f"  {label} {name:<7} {REQUESTS / elapsed:>7,.0f} req/s  p50 {percentile(latencies, 50) * 1000:6.2f} ms"
+                    f"  {reads}  primary {fallbacks:>5}"
+                )
+
+            await one(0)  # 워밍업 (커넥션 풀, 토큰/사용자 캐시)
+            await phase("fresh")
+            if replica_router.names:
+                # replica1의 lag가 MAX_LAG를 넘고 다음 확인이 끝날 때까지 대기
+                await asyncio.sleep(MAX_LAG + 2 * CHECK_INTERVAL)
+                await phase("lagged")
+
+            if replica_router.names and os.environ["DB_REPLICA_STRATEGY"] == "round_robin":
+                updated = await client.put("/api/users/me", json={"email": f"changed-{os.environ['DB_MODE']}@example.com"},
+                                           headers=headers)
+                me = await client.get("/api/users/me", headers=headers)
+                by_id = await client.get(f"/api/users/{updated.json()['id']}", headers=headers)
+                print(
+                    f"  {label} read-after-write: PUT /me -> {updated.json()['email']}, GET /me -> {me.json()['email']}, "
+                    f"GET /{{id}} (replica, 복제 안 됨) -> {by_id.json()['email']}"
+                )
+    stop.set()
+
+
+def main():
+    from sqlalchemy import create_engine
+
+    print("=" * 60)
+    print(f"read replica routing ({REQUESTS:,} x GET /api/users/{{id}}, concurrency {CONCURRENCY})")
+    print("=" * 60)
+
+    temp_dir = tempfile.TemporaryDirectory()
+    paths = [os.path.join(temp_dir.name, f"{name}.db") for name in ("primary", "replica0", "replica1")]
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{paths[0]}", "LOG_LEVEL": "WARNING"}
+
+    # primary 스키마 + 사용자 + heartbeat를 만든 뒤 파일 복사로 replica 생성
+    setup = (
+        "from app.database import get_engine; from app.schema import ensure_schema; "
+        "from app.replicas import write_heartbeat; import time; "
+        "ensure_schema(get_engine()); write_heartbeat(get_engine(), time.time())"
+    )
+    subprocess.run([sys.executable, "-c", setup], cwd=os.path.dirname(BENCH_DIR), env=env, check=True)
+    engine = create_engine(env["DATABASE_URL"])
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO users (uid, email, username, hashed_password, is_active, is_superuser) VALUES "
+            + ",".join(f"('bench-{i}', 'bench{i}@example.com', 'bench{i}', 'x', 1, 0)" for i in range(SEED_USERS))
+        )
+    engine.dispose()
+    for path in paths[1:]:
+        shutil.copyfile(paths[0], path)
+
+    replicas = {
+        "DATABASE_REPLICA_URLS": ",".join(f"sqlite:///{path}" for path in paths[1:]),
+        "DB_REPLICA_MAX_LAG": str(MAX_LAG),
+        "DB_REPLICA_CHECK_INTERVAL": str(CHECK_INTERVAL),
+        "BENCH_SQLITE_PATHS": ",".join(paths),
+    }
+    for mode in ("async", "sync"):
+        runs = [{}] + [{**replicas, "DB_REPLICA_STRATEGY": strategy} for strategy in ("round_robin", "least_latency")]
+        for run in runs:
+            # 설정은 import 시점에 읽히므로 실행마다 새 프로세스
+            subprocess.run([sys.executable, __file__, "--worker"], env={**env, **run, "DB_MODE": mode}, check=True)
+
+    temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        logging.disable(logging.INFO)
+        asyncio.run(load_test())
+    else:
+        main()
@@ -0,0 +1,82 @@
+# room 단위 fan-out benchmark
+#
+# 실행: python benchmarks/room_fanout.py
+# 100개 room x 100명이 메시지를 주고받을 때의 전달 지연(p50 / p99)과 처리량을 출력합니다.
+# room에 속하지 않은 유휴 연결을 추가해도 publish 비용이 변하지 않는지도 함께 확인합니다.
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.Classes.ConnectionManager import ConnectionManager
+from app.codec import JsonText
+from fake_websocket import DeliveryTracker, FakeWebSocket, percentile
+
+ROOMS = 100
+USERS_PER_ROOM = 100
+ROUNDS = 20
+IDLE_CONNECTIONS = (0, 10_000, 40_000)
+
+
+async def run(idle: int):
+    manager = ConnectionManager()
+    tracker = DeliveryTracker()
+
+    members: dict[str, list[FakeWebSocket]] = {}
+    for r in range(ROOMS):
+        room = f"room-{r}"
+        members[room] = []
+        for u in range(USERS_PER_ROOM):
+            ws = FakeWebSocket(u, tracker)
+            await manager.connect(ws)
+            manager.connections.join(ws, room)
+            members[room].append(ws)
+
+    idle_sockets = [FakeWebSocket(i, tracker) for i in range(idle)]
+    for ws in idle_sockets:
+        await manager.connect(ws)
+
+    expected = ROOMS * USERS_PER_ROOM
+    p50s, p99s, publish_times, totals = [], [], [], []
+    for i in range(ROUNDS):
+        tracker.reset(expected)
+        publish_started = time.perf_counter()
+        # 각 room에서 한 명씩 메시지를 보냄
+        for room, sockets in members.items():
+            sender = sockets[i % USERS_PER_ROOM]
+            if manager.connections.is_member(sender, room):
+                await manager.publish(room, JsonText(json.dumps({"type": "room_message", "room": room, "seq": i})))
+        publish_times.append(time.perf_counter() - publish_started)
+        await asyncio.wait_for(tracker.done.wait(), timeout=30)
+        totals.append(time.perf_counter() - tracker.started)
+        p50s.append(percentile(tracker.latencies, 50))
+        p99s.append(percentile(tracker.latencies, 99))
+
+    publish_us = sum(publish_times) / len(publish_times) / ROOMS * 1_000_000
+    deliveries_per_sec = expected * ROUNDS / sum(totals)
+    print(
+        f"idle {idle:>6} | publish {publish_us:7.1f} us/msg"
+        f" | p50 {sum(p50s) / len(p50s) * 1000:7.2f} ms"
+        f" | p99 {sum(p99s) / len(p99s) * 1000:7.2f} ms"
+        f" | {deliveries_per_sec:,.0f} deliveries/s"
+    )
+
+    for ws in list(manager.connections):
+        manager.disconnect(ws)
+
+
+async def main():
+    logging.disable(logging.WARNING)
+    print("=" * 60)
+    print(f"Room fan-out benchmark ({ROOMS} rooms x {USERS_PER_ROOM} users)")
+    print("=" * 60)
+    for idle in IDLE_CONNECTIONS:
+        await run(idle)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+# 앱 cold start benchmark (import 시간 + lifespan startup 시간)
+#
+# 실행: python benchmarks/startup.py
+#   1. `python -X importtime -c "import main"` 결과를 요약 — main이 직접 import하는 모듈 / app 모듈별 누적 시간
+#   2. 새 프로세스에서 main을 import하고 lifespan startup을 실행하는 시간을 BENCH_RUNS(기본 5)번 재서 중앙값 출력
+#        fresh         : 빈 DB — 테이블 생성 (create_all + schema_version 기록, 임시 SQLite일 때만)
+#        up to date    : schema_version이 최신 — SELECT 한 번으로 끝남
+#        always        : DB_SCHEMA_INIT=always — 매번 create_all (이전 startup 동작)
+# 기본 DB는 임시 SQLite 파일이며, BENCH_DATABASE_URL로 MariaDB 등을 지정할 수 있습니다.
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = int(os.getenv("BENCH_RUNS", "5"))
+TOP = 12
+
+WORKER = """
+import asyncio, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def startup():
+    async with main.app.router.lifespan_context(main.app):
+        return time.perf_counter()
+
+ready = asyncio.run(startup())
+print((imported - started) * 1000, (ready - imported) * 1000)
+"""
+
+
+def run_worker(env: dict) -> tuple:
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER], cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    import_ms, startup_ms = result.stdout.split()
+    return float(import_ms), float(startup_ms)
+
+
+def import_profile(env: dict):
+    """-X importtime 출력(마이크로초, self | cumulative | 모듈)을 요약"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = (part for part in line.replace("import time:", "|").split("|"))
+        entries.append((int(cumulative_us), int(self_us), len(name) - len(name.lstrip()), name.strip()))
+
+    # 들여쓰기 1칸 = 최상위(site, main ...), 3칸 = 바로 아래 모듈. 하위 모듈이 상위 모듈보다 먼저 출력되므로
+    # main 줄 바로 앞의 최상위 줄 이후 ~ main 줄 사이가 main이 import한 모듈들
+    end = next(index for index, entry in enumerate(entries) if entry[3] == "main")
+    start = max((index for index in range(end) if entries[index][2] == 1), default=-1) + 1
+    total_us = entries[end][0]
+    direct = [entry for entry in entries[start:end] if entry[2] == 3]
+    print(f"import main: {total_us / 1000:.1f} ms (-X importtime, 측정 오버헤드 포함)")
+    print(f"  imported by main (cumulative):")
+    for cumulative_us, _, _, name in sorted(direct, reverse=True)[:TOP]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+    print(f"  app modules (cumulative):")
+    app_modules = [entry for entry in entries if entry[3].startswith("app.")]
+    for cumulative_us, _, _, name in sorted(app_modules, reverse=True)[:TOP]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    temp_dir = tempfile.TemporaryDirectory()
+    env = {**os.environ, "LOG_LEVEL": "WARNING"}
+    env["DATABASE_URL"] = os.environ.get("BENCH_DATABASE_URL") or f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+
+    print("=" * 60)
+    print("app cold start benchmark")
+    print("=" * 60)
+    import_profile(env)
+
+    print(f"process runs (median of {RUNS})")
+    results = []
+    if "BENCH_DATABASE_URL" not in os.environ:
+        fresh = []
+        for _ in range(RUNS):
+            for name in os.listdir(temp_dir.name):
+                os.remove(os.path.join(temp_dir.name, name))
+            fresh.append(run_worker(env))
+        results.append(("fresh", fresh))
+    results.append(("up to date", [run_worker(env) for _ in range(RUNS)]))
+    results.append(("always", [run_worker({**env, "DB_SCHEMA_INIT": "always"}) for _ in range(RUNS)]))
+
+    for label, runs in results:
+        import_ms = statistics.median(run[0] for run in runs)
+        startup_ms = statistics.median(run[1] for run in runs)
+        print(f"  {label:<12} import {import_ms:7.1f} ms   lifespan startup {startup_ms:7.1f} ms")
+
+    temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
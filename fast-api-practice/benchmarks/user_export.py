@@ -0,0 +1,88 @@
+# GET /api/users/export 스트리밍 내보내기 benchmark
+#
+# 실행: python benchmarks/user_export.py
+# users 테이블을 BENCH_EXPORT_SIZES(기본 10,000 / 1,000,000)행까지 채우면서, 각 크기마다 별도 프로세스에서
+# app.user_export.iter_export로 NDJSON / CSV를 끝까지 생성(chunk는 버림)하고 rows/sec와 peak RSS를 출력합니다.
+# peak RSS가 행 수와 관계없이 비슷하면 스트리밍이 제대로 동작하는 것입니다.
+# 기본 DB는 임시 SQLite 파일이며, BENCH_DATABASE_URL로 MariaDB 등을 지정할 수 있습니다 (비어 있는 DB를 사용하세요).
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SIZES = tuple(int(size) for size in os.getenv("BENCH_EXPORT_SIZES", "10000,1000000").split(","))
+SEED_BATCH = 20_000
+
+
+def seed(rows: int):
+    from sqlalchemy import func, insert, select
+
+    from app.database import Base, engine
+    from app.models import User
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        existing = conn.scalar(select(func.count()).select_from(User))
+        for start in range(existing, rows, SEED_BATCH):
+            end = min(rows, start + SEED_BATCH)
+            conn.execute(insert(User), [
+                {"uid": f"bench-{i}", "email": f"bench{i}@example.com", "username": f"bench{i}", "hashed_password": "x"}
+                for i in range(start, end)
+            ])
+
+
+async def export(export_format: str):
+    from app.database import dispose_engines, open_session
+    from app.user_export import iter_export
+
+    rows = 0
+    size = 0
+    started = time.perf_counter()
+    async with open_session() as db:
+        async for chunk in iter_export(db, export_format):
+            size += len(chunk)
+            rows += chunk.count(b"\n")
+    elapsed = time.perf_counter() - started
+    await dispose_engines()
+    if export_format == "csv":
+        rows -= 1  # 헤더
+    # linux에서 ru_maxrss 단위는 KB
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"  {rows:>10,} rows  {export_format:<6} {rows / elapsed:>10,.0f} rows/s"
+        f"  {size / 1024 / 1024:>8.1f} MB  peak RSS {peak_mb:6.1f} MB"
+    )
+
+
+def main():
+    print("=" * 60)
+    print("users streaming export benchmark")
+    print("=" * 60)
+
+    temp_dir = None
+    if "BENCH_DATABASE_URL" in os.environ:
+        os.environ["DATABASE_URL"] = os.environ["BENCH_DATABASE_URL"]
+    else:
+        temp_dir = tempfile.TemporaryDirectory()
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+
+    for rows in SIZES:
+        seed(rows)
+        for export_format in ("ndjson", "csv"):
+            # peak RSS는 프로세스 단위로만 알 수 있으므로 측정마다 새 프로세스에서 실행
+            subprocess.run([sys.executable, __file__, "--worker", export_format], env=os.environ, check=True)
+
+    if temp_dir is not None:
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        asyncio.run(export(sys.argv[-1]))
+    else:
+        main()
@@ -0,0 +1,95 @@
+# 사용자 목록 응답 직렬화 benchmark (response_model 경로 vs app.user_serialization fast path)
+#
+# 실행: python benchmarks/user_serialization.py
+# 임시 SQLite DB에 사용자를 채운 뒤 PAGE_SIZE(기본 100)행 페이지 하나를 만드는 시간을 비교합니다.
+#   response_model : select(User) -> ORM 객체 -> List[UserResponse]로 검증(from_attributes) -> JSON 모드 dump -> JSONResponse
+#                    (FastAPI가 response_model로 하는 일과 같은 단계)
+#   fast path      : select(UserResponse 컬럼) -> row tuple -> 미리 만든 serialize_row + codec.dumps_bytes -> Response
+# "serialize only"는 DB 조회를 뺀 직렬화 단계만, "query + serialize"는 조회부터 응답 바이트까지 잰 값입니다.
+# 두 경로의 JSON 내용이 같은지도 확인합니다.
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PAGE_SIZE = int(os.getenv("BENCH_PAGE_SIZE", "100"))
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "300"))
+
+
+def measure(label: str, fn) -> float:
+    fn()  # warm-up
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    per_call = (time.perf_counter() - started) / ROUNDS * 1_000_000
+    print(f"  {label:<40} {per_call:10.1f} us/page")
+    return per_call
+
+
+def main():
+    temp_dir = tempfile.TemporaryDirectory()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+    from sqlalchemy import insert, select
+    from sqlalchemy.orm import Session
+
+    from app import codec
+    from app.database import Base, engine
+    from app.models import User
+    from app.schemas import UserResponse
+    from app.user_serialization import USER_RESPONSE_COLUMNS, json_response, users_json
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"uid": f"bench-{i}", "email": f"bench{i}@example.com", "username": f"bench{i}", "hashed_password": "x"}
+            for i in range(PAGE_SIZE)
+        ])
+
+    adapter = TypeAdapter(List[UserResponse])
+
+    def response_model_body(users) -> bytes:
+        validated = adapter.validate_python(users, from_attributes=True)
+        return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+    def fast_body(rows) -> bytes:
+        return json_response(users_json(rows)).body
+
+    session = Session(engine)
+    orm_statement = select(User).limit(PAGE_SIZE)
+    row_statement = select(*USER_RESPONSE_COLUMNS).limit(PAGE_SIZE)
+    users = session.scalars(orm_statement).all()
+    rows = session.execute(row_statement).all()
+
+    print("=" * 60)
+    print(f"user list serialization benchmark ({PAGE_SIZE} rows/page, json backend: {codec.BACKEND})")
+    print("=" * 60)
+    assert codec.loads(response_model_body(users)) == codec.loads(fast_body(rows)), "JSON 내용이 다름"
+
+    print("serialize only")
+    before = measure("response_model (validate + dump)", lambda: response_model_body(users))
+    after = measure("fast path (row tuple -> bytes)", lambda: fast_body(rows))
+    print(f"  -> x{before / after:.1f}")
+
+    print("query + serialize")
+
+    def response_model_page():
+        session.expunge_all()  # 요청마다 새 세션처럼 ORM 객체를 다시 만듦
+        return response_model_body(session.scalars(orm_statement).all())
+
+    before = measure("response_model (select(User))", response_model_page)
+    after = measure("fast path (select columns)", lambda: fast_body(session.execute(row_statement).all()))
+    print(f"  -> x{before / after:.1f}")
+
+    session.close()
+    engine.dispose()
+    temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
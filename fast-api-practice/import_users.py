@@ -0,0 +1,74 @@
+# Bulk User Import Script
+#
+# 사용법: python import_users.py users.csv [--batch-size 1000] [--errors errors.ndjson]
+#   - CSV  : email,username,password 헤더가 있는 파일
+#   - NDJSON: 한 줄에 {"email": ..., "username": ..., "password": ...} 하나 (.ndjson / .jsonl)
+# 파일을 batch 단위로 읽어 app.user_import로 저장하므로 10만 명 이상도 메모리에 한꺼번에 올리지 않습니다.
+import argparse
+import asyncio
+import csv
+import os
+import sys
+import time
+
+from app import codec
+from app.database import dispose_engines, get_engine, open_session
+from app.schema import ensure_schema
+from app.user_import import IMPORT_BATCH_SIZE, ImportReport, import_users
+
+
+def read_records(path: str):
+    if path.endswith((".ndjson", ".jsonl")):
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield codec.loads(line)
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.DictReader(f)
+
+
+async def run(path: str, batch_size: int, errors_path: str):
+    ensure_schema(get_engine())
+
+    report = ImportReport(max_errors=None)
+    started = time.perf_counter()
+    async with open_session() as db:
+        await import_users(db, read_records(path), batch_size, report)
+    elapsed = time.perf_counter() - started
+    await dispose_engines()
+
+    print("=" * 60)
+    print(f"Imported {report.inserted:,} / {report.total:,} users in {elapsed:.1f}s "
+          f"({report.total / elapsed if elapsed else 0:,.0f} rows/s)")
+    print(f"Failed: {report.failed:,}")
+    print("=" * 60)
+
+    if report.errors:
+        if errors_path:
+            with open(errors_path, "wb") as f:
+                for error in report.errors:
+                    f.write(codec.dumps_bytes(error) + b"\n")
+            print(f"Errors written to {errors_path}")
+        else:
+            for error in report.errors[:20]:
+                print(f"  row {error['index']}: {error['detail']}")
+            if report.failed > 20:
+                print(f"  ... {report.failed - 20:,} more (use --errors to save all)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV or NDJSON")
+    parser.add_argument("path")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--errors", default="", help="write per-row errors to this NDJSON file")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"File not found: {args.path}")
+        sys.exit(1)
+    asyncio.run(run(args.path, args.batch_size, args.errors))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,70 @@
-﻿from fastapi import FastAPI
+﻿# 가장 먼저 import — 여기서부터 import / startup 시간을 잼
+from app import startup_timing
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
+from fastapi.responses import JSONResponse
+from app.database import dispose_engines
+from app.replicas import start_replica_monitor, stop_replica_monitor
+from app.schema import ensure_app_schema
+from app.auth import password_pool
+from app.Classes.PasswordHasherPool import PasswordHasherBusy
+from app.rate_limit import RATE_LIMIT_ENABLED, RateLimitMiddleware, rate_limiter
+from app.request_metrics import RequestMetricsMiddleware, request_monitor
+from app.logging_setup import configure_logging
 from app.routers import auth, users
 from app.routers import chat
+from app.routers import metrics
 import logging
-from logging.config import dictConfig
-
-dictConfig({
-    "version": 1,
-    "disable_existing_loggers": False,  # uvicorn 등 기존 로거 유지하면서 레벨 적용
-    "formatters": {
-        "default": {"format": "%(levelname)s:%(name)s:%(message)s"}
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-            "level": "INFO",
-        }
-    },
-    "root": {
-        "handlers": ["console"],
-        "level": "INFO",
-    },
-})
+
+# 큐 기반 JSON 로깅 — 출력은 별도 스레드에서 (LOG_LEVEL / LOG_FORMAT / LOG_QUEUE_SIZE)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    시작: 스키마 확인(필요할 때만 create_all) -> 읽기 replica 확인 -> 채팅 백플레인 연결
+    종료: 비밀번호 해시 풀 -> 요청 제한 저장소 -> 채팅 백플레인 -> replica 확인 -> DB 커넥션 풀 순서로 정리
+    DB 엔진은 스키마 확인 때 처음 만들어지며 (DB_MODE의 엔진만), sync 모드의 DB 작업은 db_executor 스레드에서 실행해
+    이벤트 루프를 막지 않습니다.
+    """
+    with startup_timing.phase("startup"):
+        try:
+            schema = await ensure_app_schema()
+            logger.info("Database schema %s", schema)
+        except Exception as e:
+            logger.warning("Could not create database tables: %s", e)
+            logger.warning("The API will start, but database operations may fail.")
+        await start_replica_monitor()
+        # Connect the chat manager to the other worker processes
+        await chat.manager.start()
+    logger.info(
+        "Startup complete",
+        extra={f"{phase}_ms": round(seconds * 1000, 1) for phase, seconds in startup_timing.phases.items()},
+    )
+
+    yield
+
+    password_pool.shutdown()
+    await rate_limiter.close()
+    await chat.manager.stop()
+    await stop_replica_monitor()
+    await dispose_engines()
+
+
 app = FastAPI(
     title="FastAPI JWT Authentication",
     description="FastAPI project with JWT authentication, MariaDB, and SQLAlchemy 2.0",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
+# 로그인/가입 요청 제한 — DB 조회와 비밀번호 해시보다 먼저 실행 (CORS보다 먼저 추가해 429 응답에도 CORS 헤더가 붙도록)
+if RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -38,20 +73,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 가장 바깥 미들웨어 — 요청 제한 / CORS를 포함한 요청 전체 지연을 라우트별로 기록 (GET /metrics)
+app.add_middleware(RequestMetricsMiddleware, monitor=request_monitor, routes=app.router.routes)
+
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(chat.router)
+app.include_router(metrics.router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Create database tables on startup"""
-    try:
-        Base.metadata.create_all(bind=engine)
-        print("Database tables created successfully!")
-    except Exception as e:
-        print(f"Warning: Could not create database tables: {e}")
-        print("The API will start, but database operations may fail.")
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Password hashing queue is full — ask the client to retry later"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
 
 
 @app.get("/")
@@ -70,8 +108,8 @@ async def health_check():
     return {"status": "healthy"}
 
 
-logger = logging.getLogger("app.Classes.ConnectionManager")
-logger.info("logger ready? level=%s handlers=%s propagate=%s", logger.level, logger.handlers, logger.propagate)
+startup_timing.imported()
+
 
 if __name__ == "__main__":
     import uvicorn
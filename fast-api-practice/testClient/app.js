@@ -1,5 +1,82 @@
 const { createApp, reactive, ref, nextTick, onBeforeUnmount } = Vue;
 
+/**
+ * /ws/chat 바이너리 프레임 프로토콜 (서버: app/binary_protocol.py)
+ * [버전 u8][플래그 u8][종류 u8][payload...]
+ */
+const FRAME_VERSION = 1;
+const FLAG_DEFLATE = 0x01;
+const KIND_JSON = 0x01;
+const KIND_TEXT = 0x02;
+const KIND_ROOM = 0x03;
+const PING_MESSAGE = '{"type":"ping"}';
+const PONG_MESSAGE = '{"type":"pong"}';
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
+const encodeFrame = (kind, payload) => {
+    const frame = new Uint8Array(3 + payload.length);
+    frame[0] = FRAME_VERSION;
+    frame[1] = 0;
+    frame[2] = kind;
+    frame.set(payload, 3);
+    return frame;
+};
+
+/**
+ * 입력 메시지를 바이너리 프레임으로 변환
+ * room_message는 서버가 JSON 파싱 없이 라우팅할 수 있도록 ROOM 프레임으로 보냄
+ */
+const encodeOutgoingFrame = (message) => {
+    let parsed = null;
+    try {
+        parsed = JSON.parse(message);
+    } catch (err) {
+        return encodeFrame(KIND_TEXT, textEncoder.encode(message));
+    }
+
+    if (parsed && parsed.type === 'room_message' && typeof parsed.room === 'string' && typeof parsed.message === 'string') {
+        const room = textEncoder.encode(parsed.room);
+        if (room.length <= 255) {
+            const body = textEncoder.encode(parsed.message);
+            const payload = new Uint8Array(1 + room.length + body.length);
+            payload[0] = room.length;
+            payload.set(room, 1);
+            payload.set(body, 1 + room.length);
+            return encodeFrame(KIND_ROOM, payload);
+        }
+    }
+    return encodeFrame(KIND_JSON, textEncoder.encode(message));
+};
+
+const inflate = async (bytes) => {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+    return new Uint8Array(await new Response(stream).arrayBuffer());
+};
+
+/**
+ * 수신한 바이너리 프레임을 화면에 표시할 문자열로 변환
+ */
+const decodeIncomingFrame = async (buffer) => {
+    const frame = new Uint8Array(buffer);
+    if (frame.length < 3 || frame[0] !== FRAME_VERSION) {
+        throw new Error('지원하지 않는 프레임');
+    }
+    let payload = frame.subarray(3);
+    if (frame[1] & FLAG_DEFLATE) {
+        payload = await inflate(payload);
+    }
+    if (frame[2] === KIND_ROOM) {
+        const roomLength = payload[0];
+        return JSON.stringify({
+            type: 'room_message',
+            room: textDecoder.decode(payload.subarray(1, 1 + roomLength)),
+            message: textDecoder.decode(payload.subarray(1 + roomLength))
+        });
+    }
+    return textDecoder.decode(payload);
+};
+
 createApp({
     setup() {
         // 상태 관리
@@ -54,7 +131,8 @@ createApp({
                 ws: null,
                 headers: [{ key: '', value: '' }],  // 클라이언트별 커스텀 헤더
                 showHeaders: false,  // 헤더 입력 영역 표시 여부
-                headerTransport: 'query' // 'query' | 'protocol' | 'initmsg'
+                headerTransport: 'query', // 'query' | 'protocol' | 'initmsg'
+                wireProtocol: 'text' // 'text' | 'binary' | 'binary+deflate'
             });
 
             addMessage(client, `클라이언트 #${id}가 생성되었습니다. 연결 버튼을 클릭하세요.`);
@@ -182,33 +260,58 @@ createApp({
 
                 // WebSocket 생성 (protocols가 undefined면 생성자에 넣지 않음)
                 client.ws = protocols ? new WebSocket(urlToUse, protocols) : new WebSocket(urlToUse);
+                client.ws.binaryType = 'arraybuffer';
 
                 client.ws.onopen = () => {
                     addMessage(client, '✅ 서버에 연결되었습니다!');
                     client.connected = true;
 
                     // 초기 메시지 방식이면 첫 메시지로 헤더 전송
+                    // 바이너리 프로토콜을 쓰는 경우 같은 ws_headers 메시지로 협상
+                    const initMsg = { type: 'ws_headers' };
                     if (client.headerTransport === 'initmsg') {
                         const obj = {};
                         client.headers.forEach(h => {
                             if (h.key && h.key.trim() !== '') obj[h.key.trim()] = h.value;
                         });
                         if (Object.keys(obj).length > 0) {
-                            try {
-                                const initMsg = JSON.stringify({ type: 'ws_headers', headers: obj });
-                                client.ws.send(initMsg);
-                                addMessage(client, '📤 초기 헤더 메시지를 전송했습니다.', 'system');
-                            } catch (err) {
-                                addMessage(client, '❌ 초기 헤더 메시지 전송 실패: ' + err.message);
-                                console.error('초기 메시지 전송 실패:', err);
-                            }
+                            initMsg.headers = obj;
+                        }
+                    }
+                    if (client.wireProtocol !== 'text') {
+                        initMsg.protocol = 'binary';
+                        if (client.wireProtocol === 'binary+deflate') {
+                            initMsg.compression = 'deflate';
+                        }
+                    }
+                    if (initMsg.headers || initMsg.protocol) {
+                        try {
+                            client.ws.send(JSON.stringify(initMsg));
+                            addMessage(client, '📤 초기 헤더 메시지를 전송했습니다.', 'system');
+                        } catch (err) {
+                            addMessage(client, '❌ 초기 헤더 메시지 전송 실패: ' + err.message);
+                            console.error('초기 메시지 전송 실패:', err);
                         }
                     }
                 };
 
-                client.ws.onmessage = (event) => {
+                client.ws.onmessage = async (event) => {
+                    let text = event.data;
+                    if (event.data instanceof ArrayBuffer) {
+                        try {
+                            text = await decodeIncomingFrame(event.data);
+                        } catch (err) {
+                            addMessage(client, '❌ 바이너리 프레임 해석 실패: ' + err.message);
+                            return;
+                        }
+                    }
+                    // 서버 heartbeat ping에는 화면에 표시하지 않고 pong으로 응답
+                    if (text === PING_MESSAGE) {
+                        sendRaw(client, PONG_MESSAGE);
+                        return;
+                    }
                     client.receivedCount++;
-                    addMessage(client, event.data, 'received');
+                    addMessage(client, text, 'received');
                 };
 
                 client.ws.onerror = (error) => {
@@ -238,6 +341,15 @@ createApp({
             }
         };
 
+        /**
+         * 클라이언트의 메시지 형식(텍스트/바이너리)에 맞춰 전송
+         */
+        const sendRaw = (client, message) => {
+            if (client.ws && client.ws.readyState === WebSocket.OPEN) {
+                client.ws.send(client.wireProtocol === 'text' ? message : encodeOutgoingFrame(message));
+            }
+        };
+
         /**
          * 메시지 전송
          */
@@ -252,7 +364,7 @@ createApp({
             }
 
             try {
-                client.ws.send(message);
+                sendRaw(client, message);
                 client.sentCount++;
                 addMessage(client, message, 'sent');
                 client.inputMessage = '';
@@ -0,0 +1,60 @@
+# /ws/chat 바이너리 프레임의 송신 형식 협상과 압축 해제 크기 제한 (decompression bomb) 확인.
+# 실행: python -m pytest tests
+import os
+import sys
+import zlib
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import binary_protocol as bp
+
+
+def bomb(size: int) -> bytes:
+    """size바이트의 0을 압축한 KIND_TEXT 프레임 (압축하면 수백 분의 1 크기, 1 MiB씩 나눠 압축)"""
+    compressor = zlib.compressobj(9)
+    chunk = b"\0" * (1024 * 1024)
+    parts = [compressor.compress(chunk) for _ in range(size // len(chunk))]
+    parts.append(compressor.compress(b"\0" * (size % len(chunk))))
+    parts.append(compressor.flush())
+    return bytes((bp.PROTOCOL_VERSION, bp.FLAG_DEFLATE, bp.KIND_TEXT)) + b"".join(parts)
+
+
+def test_negotiate_binary_only_with_deflate():
+    assert bp.negotiate({"protocol": "binary", "compression": "deflate"}) == bp.WireEncoding.BINARY_DEFLATE
+    # 압축 없는 바이너리는 텍스트보다 커서 협상하지 않음
+    assert bp.negotiate({"protocol": "binary"}) == bp.WireEncoding.TEXT
+    assert bp.negotiate({"protocol": "binary", "accept_bytes": True}) == bp.WireEncoding.BYTES
+
+
+def test_decode_frame_rejects_payload_over_limit():
+    frame = bomb(bp.MAX_INFLATED_BYTES + 1)
+    assert len(frame) < bp.MAX_INFLATED_BYTES // 100
+    with pytest.raises(bp.ProtocolError):
+        bp.decode_frame(frame)
+
+
+def test_decode_frame_accepts_payload_at_limit():
+    kind, payload = bp.decode_frame(bomb(bp.MAX_INFLATED_BYTES))
+    assert kind == bp.KIND_TEXT
+    assert len(payload) == bp.MAX_INFLATED_BYTES
+
+
+def test_decode_frame_rejects_truncated_deflate():
+    with pytest.raises(bp.ProtocolError):
+        bp.decode_frame(bomb(1000)[:-4])
+
+
+def test_websocket_rejects_oversized_compressed_frame():
+    from fastapi.testclient import TestClient
+
+    import main
+
+    client = TestClient(main.app)
+    with client.websocket_connect("/ws/chat") as websocket:
+        websocket.send_bytes(bomb(200 * 1024 * 1024))
+        assert "Invalid binary frame" in websocket.receive_text()
+        # 연결은 그대로 유지
+        websocket.send_text('{"type":"echo"}')
+        assert websocket.receive_text() == '{"type":"echo"}'
@@ -0,0 +1,57 @@
+# GET /api/users/export 가 DB_MODE=sync에서 세션 수 제한(_sync_sessions)을 두 번 잡아 멈추지 않는지 확인.
+# DB_MODE / DB_EXECUTOR_WORKERS는 import 시점에 읽히므로 설정마다 새 프로세스에서 실행합니다.
+# 실행: python -m pytest tests (httpx 필요)
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = textwrap.dedent("""
+    import asyncio, logging, sys
+    import httpx
+    import main
+    from app.auth import create_access_token
+    from app.database import get_engine
+    from app.schema import ensure_schema
+    from sqlalchemy import insert
+    from app.models import User
+
+    logging.disable(logging.INFO)
+    ensure_schema(get_engine())
+    with get_engine().begin() as conn:
+        conn.execute(insert(User), [
+            {"email": f"u{i}@example.com", "username": f"u{i}", "hashed_password": "x"} for i in range(50)
+        ])
+
+    async def run(concurrency):
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': 'u0'})}"}
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.wait_for(asyncio.gather(*(
+                client.get("/api/users/export?format=ndjson", headers=headers) for _ in range(concurrency)
+            )), timeout=20)
+        for response in responses:
+            assert response.status_code == 200, response.text
+            assert response.text.count("\\n") == 50
+
+    asyncio.run(run(int(sys.argv[1])))
+""")
+
+
+@pytest.mark.parametrize("workers, concurrency", [(1, 1), (1, 4), (8, 8)])
+def test_sync_export_does_not_deadlock(tmp_path, workers, concurrency):
+    env = {
+        **os.environ,
+        "DB_MODE": "sync",
+        "DB_EXECUTOR_WORKERS": str(workers),
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'test.db'}",
+        "RATE_LIMIT_ENABLED": "false",
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(concurrency)], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
@@ -0,0 +1,54 @@
+# 송신 큐가 가득 찼을 때 버린 메시지 수(dropped, /metrics/chat의 dropped_messages) 확인.
+# 실행: python -m pytest tests
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.Classes.ConnectionManager import ConnectionManager
+from app.Classes.OutboundQueue import OverflowPolicy
+
+
+class StalledWebSocket:
+    """accept만 하고 전송은 끝나지 않는 가짜 WebSocket (큐가 비워지지 않음)"""
+
+    def __init__(self):
+        self.client = SimpleNamespace(host="10.0.0.1")
+        self.headers = {}
+
+    async def accept(self, *args, **kwargs):
+        pass
+
+    async def send_text(self, message: str):
+        await asyncio.Event().wait()
+
+    async def close(self, code: int = 1000, reason: str = None):
+        pass
+
+
+def run_overflow(policy: OverflowPolicy, messages: int) -> dict:
+    async def main():
+        manager = ConnectionManager(queue_size=3, overflow_policy=policy, send_timeout=60)
+        websocket = StalledWebSocket()
+        await manager.connect(websocket)
+        queue = manager.connections.get(websocket)
+        queue._task.cancel()  # writer가 메시지를 꺼내지 않도록
+        for index in range(messages):
+            await manager.send_personal_message(f"m{index}", websocket)
+        metrics = manager.metrics()
+        manager.disconnect(websocket)
+        return {"dropped": manager.metrics()["dropped_messages"], "before_disconnect": metrics["dropped_messages"]}
+
+    return asyncio.run(main())
+
+
+def test_disconnect_policy_counts_each_message_once():
+    # maxsize=3에 4개: 4번째에서 연결을 끊고 큐의 3개 + 4번째 = 4
+    assert run_overflow(OverflowPolicy.DISCONNECT, 4)["dropped"] == 4
+
+
+def test_drop_policies_count_dropped_messages():
+    assert run_overflow(OverflowPolicy.DROP_OLDEST, 5)["before_disconnect"] == 2
+    assert run_overflow(OverflowPolicy.DROP_NEWEST, 5)["before_disconnect"] == 2